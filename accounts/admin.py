@@ -2,12 +2,13 @@
 
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import User
+from .models import Branch, Team, User
 
 @admin.register(User)
 class CustomUserAdmin(UserAdmin):
-    list_display = ('username', 'role', 'department', 'phone', 'join_date', 'is_active')
-    list_filter = ('role', 'department', 'is_active')
+    list_display = ('username', 'role', 'branch', 'team', 'department', 'phone', 'join_date', 'is_active')
+    list_filter = ('role', 'branch', 'team', 'department', 'is_active')
+    list_select_related = ('branch', 'team')
     search_fields = ('username', 'first_name', 'last_name', 'phone')
     ordering = ('-date_joined',)
     
@@ -15,7 +16,7 @@ class CustomUserAdmin(UserAdmin):
     fieldsets = (
         (None, {'fields': ('username', 'password')}),
         ('개인정보', {'fields': ('first_name', 'last_name', 'email', 'phone', 'profile_image')}),
-        ('소속정보', {'fields': ('department', 'role', 'join_date')}),
+        ('소속정보', {'fields': ('branch', 'team', 'department', 'role', 'join_date')}),
         ('권한', {'fields': ('is_active', 'is_staff', 'is_superuser', 'groups', 'user_permissions')}),
         ('중요 일자', {'fields': ('last_login', 'date_joined')}),
     )
@@ -23,6 +24,20 @@ class CustomUserAdmin(UserAdmin):
     add_fieldsets = (
         (None, {
             'classes': ('wide',),
-            'fields': ('username', 'password1', 'password2', 'role', 'department'),
+            'fields': ('username', 'password1', 'password2', 'role', 'branch', 'team', 'department'),
         }),
-    )
\ No newline at end of file
+    )
+
+
+@admin.register(Branch)
+class BranchAdmin(admin.ModelAdmin):
+    list_display = ('name',)
+    search_fields = ('name',)
+
+
+@admin.register(Team)
+class TeamAdmin(admin.ModelAdmin):
+    list_display = ('name', 'branch')
+    list_filter = ('branch',)
+    list_select_related = ('branch',)
+    search_fields = ('name',)
@@ -0,0 +1,49 @@
+# accounts/authentication.py
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from .token_revocation import is_revoked
+from .user_cache import CACHED_USER_FIELDS, get_user_values, set_user_values
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """토큰의 user_id로 캐시된 사용자 정보를 사용하는 JWT 인증
+
+    캐시에 있으면 DB 조회 없이 사용자 객체를 만들고, 없을 때만 필요한 필드를 한 번 조회합니다.
+    역할/소속은 토큰 클레임이 아닌 캐시 값을 사용하므로 변경 즉시(캐시 삭제 시) 반영됩니다.
+    캐시하지 않은 필드는 접근할 때 조회되고, save()는 불러온 필드만 저장합니다.
+    """
+
+    def get_validated_token(self, raw_token):
+        # 로그아웃 등으로 폐기된 액세스 토큰 거부 (캐시된 폐기 목록으로 확인)
+        validated_token = super().get_validated_token(raw_token)
+        if is_revoked(validated_token.get(api_settings.JTI_CLAIM)):
+            raise InvalidToken(_("Token is blacklisted"))
+        return validated_token
+
+    def get_user(self, validated_token):
+        # 비밀번호 변경 검사는 비밀번호 해시가 필요하므로 기본 동작 사용
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        values = get_user_values(user_id)
+        if values is None:
+            values = self.user_model.objects.filter(
+                **{api_settings.USER_ID_FIELD: user_id}
+            ).values(*CACHED_USER_FIELDS).first()
+            if values is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            set_user_values(user_id, values)
+
+        if not values['is_active']:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        # from_db는 모델 필드 순서의 값 목록을 받음
+        field_names = [f.attname for f in self.user_model._meta.concrete_fields if f.attname in values]
+        return self.user_model.from_db('default', field_names, [values[name] for name in field_names])
@@ -0,0 +1,106 @@
+# accounts/management/commands/benchmark_token_refresh.py
+import statistics
+import time
+import uuid
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.utils import aware_utcnow
+from accounts.models import User
+from accounts.token_revocation import is_revoked, purge_expired_tokens, reset_revoked_jtis, revoke_user_tokens
+from accounts.tokens import CustomToken, TrackedTokenRefreshSerializer
+
+BENCH_PREFIX = 'BENCH-'
+SEED_BATCH_SIZE = 10000
+
+
+class Command(BaseCommand):
+    help = '과거 토큰 기록을 대량 생성한 뒤 토큰 갱신/로그아웃/폐기 확인 응답시간 비교'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tokens', type=int, default=1000000, help='생성할 과거 토큰 수')
+        parser.add_argument('--revoked', type=int, default=100000, help='생성할 만료 전 폐기 토큰 수 (폐기 목록 크기)')
+        parser.add_argument('--repeat', type=int, default=20, help='항목별 반복 횟수')
+        parser.add_argument('--keep', action='store_true', help='벤치마크 데이터 유지')
+
+    def handle(self, *args, **options):
+        user = User.objects.get_or_create(username=f'{BENCH_PREFIX}token', defaults={'role': 'staff'})[0]
+        repeat = options['repeat']
+
+        stages = [('empty', self._measure(user, repeat))]
+        self._seed(user, options['tokens'], options['revoked'])
+        stages.append((f"{options['tokens']}+{options['revoked']} tokens", self._measure(user, repeat)))
+
+        # 벤치마크 사용자의 만료 토큰만 삭제 (다른 사용자의 토큰은 건드리지 않음)
+        started = time.perf_counter()
+        purged = purge_expired_tokens(user=user)
+        purge_ms = (time.perf_counter() - started) * 1000
+        stages.append(('after purge', self._measure(user, repeat)))
+
+        self.stdout.write(
+            f"{'stage':<28}{'refresh (ms)':>14}{'logout (ms)':>14}{'revoked load (ms)':>20}{'revoked check (us)':>20}")
+        for name, result in stages:
+            self.stdout.write(
+                f"{name:<28}{result['refresh']:>14.2f}{result['logout']:>14.2f}"
+                f"{result['load']:>20.2f}{result['check']:>20.2f}")
+        self.stdout.write(f'purge: {purged} tokens, {purge_ms:.0f}ms')
+
+        if not options['keep']:
+            OutstandingToken.objects.filter(jti__startswith=BENCH_PREFIX).delete()
+            OutstandingToken.objects.filter(user=user).delete()
+            user.delete()
+
+    def _seed(self, user, expired_count, revoked_count):
+        """만료된 토큰(절반은 블랙리스트)과 만료 전 폐기 토큰(is_revoked가 읽는 목록)을 배치로 생성"""
+        now = aware_utcnow()
+        self._bulk_seed(user, expired_count, now - timedelta(days=1), blacklist_every=2)
+        self._bulk_seed(user, revoked_count, now + timedelta(days=1), blacklist_every=1)
+        reset_revoked_jtis()
+
+    def _bulk_seed(self, user, count, expires_at, blacklist_every):
+        for start in range(0, count, SEED_BATCH_SIZE):
+            size = min(SEED_BATCH_SIZE, count - start)
+            tokens = OutstandingToken.objects.bulk_create([
+                OutstandingToken(
+                    user=user,
+                    jti=f'{BENCH_PREFIX}{uuid.uuid4().hex}',
+                    token='',
+                    created_at=expires_at - timedelta(days=1, seconds=start + i),
+                    expires_at=expires_at - timedelta(seconds=start + i),
+                )
+                for i in range(size)
+            ])
+            # SQLite/PostgreSQL 모두 bulk_create 후 pk가 채워짐
+            BlacklistedToken.objects.bulk_create(
+                [BlacklistedToken(token=token) for token in tokens[::blacklist_every]])
+
+    def _measure(self, user, repeat):
+        refresh_times, logout_times, load_times, check_times = [], [], [], []
+        for _ in range(repeat):
+            refresh = CustomToken.for_user(user)
+
+            started = time.perf_counter()
+            serializer = TrackedTokenRefreshSerializer(data={'refresh': str(refresh)})
+            serializer.is_valid(raise_exception=True)
+            refresh_times.append((time.perf_counter() - started) * 1000)
+
+            access = refresh.access_token
+            started = time.perf_counter()
+            revoke_user_tokens(user, access)
+            logout_times.append((time.perf_counter() - started) * 1000)
+
+            # 폐기 목록 적재(스냅샷/공유 캐시 만료 후 첫 요청) 비용과 이후 요청당 확인 비용
+            reset_revoked_jtis()
+            started = time.perf_counter()
+            is_revoked(access['jti'])
+            load_times.append((time.perf_counter() - started) * 1000)
+            started = time.perf_counter()
+            is_revoked(access['jti'])
+            check_times.append((time.perf_counter() - started) * 1000000)
+
+        return {
+            'refresh': statistics.median(refresh_times),
+            'logout': statistics.median(logout_times),
+            'load': statistics.median(load_times),
+            'check': statistics.median(check_times),
+        }
@@ -0,0 +1,15 @@
+# accounts/management/commands/purge_expired_tokens.py
+from django.core.management.base import BaseCommand
+from accounts.token_revocation import PURGE_BATCH_SIZE, purge_expired_tokens
+
+
+class Command(BaseCommand):
+    help = '만료된 JWT 토큰 기록 삭제 (매일 cron으로 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=PURGE_BATCH_SIZE, help='트랜잭션당 삭제 건수')
+        parser.add_argument('--pause', type=float, default=0.0, help='배치 사이 대기 시간(초)')
+
+    def handle(self, *args, **options):
+        count = purge_expired_tokens(options['batch_size'], options['pause'])
+        self.stdout.write(self.style.SUCCESS(f'만료 토큰 {count}건 삭제'))
@@ -0,0 +1,56 @@
+# Generated by Django 4.2 on 2026-10-19 01:07
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Branch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True, verbose_name='지점명')),
+            ],
+            options={
+                'verbose_name': '지점',
+                'verbose_name_plural': '지점 목록',
+            },
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='org_path',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=50, verbose_name='조직 경로'),
+        ),
+        migrations.CreateModel(
+            name='Team',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, verbose_name='팀명')),
+                ('branch', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='teams', to='accounts.branch', verbose_name='지점')),
+            ],
+            options={
+                'verbose_name': '팀',
+                'verbose_name_plural': '팀 목록',
+            },
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='branch',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='members', to='accounts.branch', verbose_name='지점'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='team',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='members', to='accounts.team', verbose_name='팀'),
+        ),
+        migrations.AddConstraint(
+            model_name='team',
+            constraint=models.UniqueConstraint(fields=('branch', 'name'), name='accounts_team_branch_name_uniq'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """token_blacklist 앱 테이블에 조회 패턴용 인덱스 추가
+
+    - expires_at: 만료 토큰 삭제/유효한 폐기 토큰 조회
+    - (user_id, expires_at): 로그아웃 시 사용자의 유효한 토큰 조회
+    """
+
+    dependencies = [
+        ('accounts', '0002_branch_team_org_path'),
+        ('token_blacklist', '0012_alter_outstandingtoken_user'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'CREATE INDEX IF NOT EXISTS accounts_outtoken_expires_idx '
+            'ON token_blacklist_outstandingtoken (expires_at)',
+            'DROP INDEX IF EXISTS accounts_outtoken_expires_idx',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX IF NOT EXISTS accounts_outtoken_user_exp_idx '
+            'ON token_blacklist_outstandingtoken (user_id, expires_at)',
+            'DROP INDEX IF EXISTS accounts_outtoken_user_exp_idx',
+        ),
+    ]
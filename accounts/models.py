@@ -2,6 +2,50 @@
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from .user_cache import invalidate_users_on_commit
+
+
+class Branch(models.Model):
+    name = models.CharField('지점명', max_length=50, unique=True)
+
+    class Meta:
+        verbose_name = '지점'
+        verbose_name_plural = '지점 목록'
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def org_path(self):
+        return f'/{self.id}/'
+
+
+class Team(models.Model):
+    branch = models.ForeignKey(Branch, on_delete=models.CASCADE, related_name='teams', verbose_name='지점')
+    name = models.CharField('팀명', max_length=50)
+
+    class Meta:
+        verbose_name = '팀'
+        verbose_name_plural = '팀 목록'
+        constraints = [
+            models.UniqueConstraint(fields=['branch', 'name'], name='accounts_team_branch_name_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.branch} {self.name}"
+
+    @property
+    def org_path(self):
+        return f'/{self.branch_id}/{self.id}/'
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # 팀이 다른 지점으로 옮겨지면 소속 사용자의 경로도 함께 갱신
+        moved = self.members.exclude(org_path=self.org_path)
+        moved_ids = list(moved.values_list('id', flat=True))
+        moved.update(branch_id=self.branch_id, org_path=self.org_path)
+        invalidate_users_on_commit(moved_ids)
+
 
 class User(AbstractUser):
     # AbstractUser의 기본 필드들:
@@ -20,6 +64,12 @@ class User(AbstractUser):
     join_date = models.DateField('입사일', null=True, blank=True)
     profile_image = models.ImageField('프로필 이미지', upload_to='profiles/', blank=True, null=True)
     department = models.CharField('부서', max_length=50, blank=True)
+    branch = models.ForeignKey(
+        Branch, on_delete=models.SET_NULL, null=True, blank=True, related_name='members', verbose_name='지점')
+    team = models.ForeignKey(
+        Team, on_delete=models.SET_NULL, null=True, blank=True, related_name='members', verbose_name='팀')
+    # 조직 경로 '/지점ID/팀ID/' (지점만 있으면 '/지점ID/'). 접두사 검색으로 지점/팀 소속 전체를 조회
+    org_path = models.CharField('조직 경로', max_length=50, blank=True, db_index=True, editable=False)
     
     class Meta:
         verbose_name = '사용자'
@@ -30,5 +80,29 @@ class User(AbstractUser):
 
     def get_full_name(self):
         return f"{self.last_name}{self.first_name}"
+
+    def save(self, *args, **kwargs):
+        """팀이 지정되면 지점은 팀의 지점으로 맞추고 조직 경로 갱신"""
+        if self.team_id:
+            self.branch_id = self.team.branch_id
+            self.org_path = self.team.org_path
+        elif self.branch_id:
+            self.org_path = f'/{self.branch_id}/'
+        else:
+            self.org_path = ''
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'branch', 'team'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'branch', 'org_path'}
+        super().save(*args, **kwargs)
+
+    @property
+    def scope_path(self):
+        """대출 건 조회 범위 경로: 지점장은 지점, 팀장은 팀 (소속이 없으면 None)"""
+        if self.role == 'branch_manager' and self.branch_id:
+            return f'/{self.branch_id}/'
+        if self.role == 'team_leader' and self.team_id:
+            return self.org_path or None
+        return None
     
     
\ No newline at end of file
@@ -21,14 +21,8 @@ class CanManageCase(BasePermission):
         return request.user.role in ['admin', 'branch_manager', 'team_leader', 'staff']
 
     def has_object_permission(self, request, view, obj):
-        user = request.user
-        if user.role == 'admin':
-            return True
-        elif user.role == 'branch_manager':
-            return obj.manager.branch == user.branch
-        elif user.role == 'team_leader':
-            return obj.manager.team == user.team
-        return obj.manager == user
+        # 목록 조회는 LoanCase.objects.visible_to(user)로 같은 규칙을 SQL에서 적용
+        return obj.is_visible_to(request.user)
 
 class CanManageEvent(BasePermission):
     def has_permission(self, request, view):
@@ -38,11 +32,4 @@ class CanManageEvent(BasePermission):
         return request.user.role in ['admin', 'branch_manager', 'team_leader']
 
     def has_object_permission(self, request, view, obj):
-        user = request.user
-        if user.role == 'admin':
-            return True
-        elif user.role == 'branch_manager':
-            return obj.loan_case.manager.branch == user.branch
-        elif user.role == 'team_leader':
-            return obj.loan_case.manager.team == user.team
-        return obj.loan_case.manager == user
\ No newline at end of file
+        return obj.loan_case.is_visible_to(request.user)
\ No newline at end of file
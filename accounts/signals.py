@@ -0,0 +1,30 @@
+# accounts/signals.py
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from .models import Branch, Team, User
+from .user_cache import invalidate_users, invalidate_users_on_commit
+
+
+@receiver(pre_delete, sender=Team)
+def detach_team_members(sender, instance, **kwargs):
+    # SET_NULL은 org_path를 갱신하지 않으므로 삭제 전에 지점 경로로 되돌림
+    member_ids = list(instance.members.values_list('id', flat=True))
+    instance.members.update(team=None, org_path=f'/{instance.branch_id}/')
+    invalidate_users_on_commit(member_ids)
+
+
+@receiver(pre_delete, sender=Branch)
+def detach_branch_members(sender, instance, **kwargs):
+    member_ids = list(instance.members.values_list('id', flat=True))
+    instance.members.update(branch=None, team=None, org_path='')
+    invalidate_users_on_commit(member_ids)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, created=False, **kwargs):
+    if created:
+        # 재사용된 ID의 이전 캐시 방지 (아직 다른 요청이 읽을 수 없는 행이므로 바로 삭제)
+        invalidate_users([instance.pk])
+    else:
+        invalidate_users_on_commit([instance.pk])
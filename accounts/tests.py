@@ -1,3 +1,125 @@
+from datetime import timedelta
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.utils import aware_utcnow
 
-# Create your tests here.
+from accounts.authentication import CachedJWTAuthentication
+from accounts.models import Branch, Team, User
+from accounts.token_revocation import purge_expired_tokens
+from accounts.tokens import CustomToken
+
+
+class OrgPathTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.seoul = Branch.objects.create(name='서울')
+        cls.busan = Branch.objects.create(name='부산')
+        cls.team = Team.objects.create(branch=cls.seoul, name='1팀')
+
+    def test_path_follows_team_and_branch_changes(self):
+        member = User.objects.create_user(username='member', password='pw', team=self.team)
+        self.assertEqual((member.branch_id, member.org_path), (self.seoul.id, f'/{self.seoul.id}/{self.team.id}/'))
+
+        self.team.branch = self.busan
+        self.team.save()
+        member.refresh_from_db()
+        self.assertEqual((member.branch_id, member.org_path), (self.busan.id, f'/{self.busan.id}/{self.team.id}/'))
+
+        self.team.delete()
+        member.refresh_from_db()
+        self.assertEqual((member.team_id, member.org_path), (None, f'/{self.busan.id}/'))
+
+    def test_register_is_limited_to_own_branch(self):
+        manager = User.objects.create_user(
+            username='bm', password='pw', role='branch_manager', branch=self.seoul)
+        client = APIClient()
+        client.force_authenticate(manager)
+
+        response = client.post('/api/accounts/register/', {
+            'username': 'new', 'password': 'pw', 'role': 'staff', 'team': self.team.id})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(User.objects.get(username='new').org_path, self.team.org_path)
+
+        response = client.post('/api/accounts/register/', {
+            'username': 'other', 'password': 'pw', 'role': 'staff', 'branch': self.busan.id})
+        self.assertEqual(response.status_code, 403)
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.branch = Branch.objects.create(name='서울')
+        self.team = Team.objects.create(branch=self.branch, name='1팀')
+        self.user = User.objects.create_user(username='staff', password='pw', role='staff', team=self.team)
+        self.token = CustomToken.for_user(self.user).access_token
+        self.auth = CachedJWTAuthentication()
+
+    def test_user_is_served_from_cache(self):
+        with self.assertNumQueries(1):
+            user = self.auth.get_user(self.token)
+        with self.assertNumQueries(0):
+            cached = self.auth.get_user(self.token)
+        self.assertEqual((cached.pk, cached.role, cached.org_path), (self.user.pk, 'staff', self.team.org_path))
+        self.assertEqual(user.pk, cached.pk)
+
+    def test_changes_invalidate_cache(self):
+        self.auth.get_user(self.token)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.team.branch = Branch.objects.create(name='부산')
+            self.team.save()
+        self.assertEqual(self.auth.get_user(self.token).org_path, self.team.org_path)
+
+        # 커밋 전에는 삭제하지 않아, 동시 요청이 이전 값을 다시 캐시하지 않음
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+            self.assertTrue(self.auth.get_user(self.token).is_active)
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.get_user(self.token)
+
+
+class TokenRevocationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='staff', password='pw', role='staff')
+        self.client = APIClient()
+
+    def test_logout_revokes_access_and_rotated_refresh_tokens(self):
+        refresh = CustomToken.for_user(self.user)
+        response = self.client.post('/api/accounts/refresh/', {'refresh': str(refresh)})
+        self.assertEqual(response.status_code, 200)
+        rotated = response.data['refresh']
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        self.assertEqual(self.client.get('/api/accounts/profile/').status_code, 200)
+        self.assertEqual(self.client.post('/api/accounts/logout/').status_code, 200)
+
+        self.assertEqual(self.client.get('/api/accounts/profile/').status_code, 401)
+        self.client.credentials()
+        self.assertEqual(self.client.post('/api/accounts/refresh/', {'refresh': rotated}).status_code, 401)
+
+    def test_purge_removes_expired_tokens_in_batches(self):
+        now = aware_utcnow()
+        expired = [
+            OutstandingToken.objects.create(user=self.user, jti=f'old-{i}', token='', expires_at=now - timedelta(hours=1))
+            for i in range(3)
+        ]
+        BlacklistedToken.objects.create(token=expired[0])
+        OutstandingToken.objects.create(user=self.user, jti='valid', token='', expires_at=now + timedelta(hours=1))
+
+        self.assertEqual(purge_expired_tokens(batch_size=2), 3)
+        self.assertEqual(list(OutstandingToken.objects.values_list('jti', flat=True)), ['valid'])
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+    def test_purge_can_be_limited_to_one_user(self):
+        other = User.objects.create_user(username='other', password='pw', role='staff')
+        expired_at = aware_utcnow() - timedelta(hours=1)
+        OutstandingToken.objects.create(user=self.user, jti='mine', token='', expires_at=expired_at)
+        OutstandingToken.objects.create(user=other, jti='theirs', token='', expires_at=expired_at)
+
+        self.assertEqual(purge_expired_tokens(user=self.user), 1)
+        self.assertEqual(list(OutstandingToken.objects.values_list('jti', flat=True)), ['theirs'])
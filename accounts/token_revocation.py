@@ -0,0 +1,113 @@
+# accounts/token_revocation.py
+import threading
+import time
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.utils import aware_utcnow, datetime_from_epoch
+
+# 만료 전 폐기된 토큰 jti 목록 (공유 캐시 + 프로세스 내 스냅샷)
+REVOKED_CACHE_KEY = 'accounts:revoked_jtis'
+SNAPSHOT_TTL = 10
+PURGE_BATCH_SIZE = 1000
+
+_snapshot = (0.0, frozenset())
+_snapshot_lock = threading.Lock()
+
+
+def _load_revoked_jtis() -> frozenset:
+    # 만료된 토큰은 exp 검사에서 걸러지므로 아직 유효한 폐기 토큰만 보관
+    return frozenset(
+        BlacklistedToken.objects.filter(token__expires_at__gt=aware_utcnow())
+        .values_list('token__jti', flat=True)
+    )
+
+
+def get_revoked_jtis() -> frozenset:
+    """프로세스 내 스냅샷 -> 공유 캐시 -> DB 순으로 조회"""
+    global _snapshot
+    now = time.monotonic()
+    with _snapshot_lock:
+        expires, jtis = _snapshot
+    if expires > now:
+        return jtis
+
+    jtis = cache.get(REVOKED_CACHE_KEY)
+    if jtis is None:
+        jtis = _load_revoked_jtis()
+        cache.set(REVOKED_CACHE_KEY, jtis, SNAPSHOT_TTL)
+    with _snapshot_lock:
+        _snapshot = (now + SNAPSHOT_TTL, jtis)
+    return jtis
+
+
+def is_revoked(jti) -> bool:
+    return jti in get_revoked_jtis()
+
+
+def reset_revoked_jtis():
+    """폐기 목록 변경 시 호출. 다른 프로세스의 스냅샷은 SNAPSHOT_TTL 안에 갱신됩니다."""
+    global _snapshot
+    cache.delete(REVOKED_CACHE_KEY)
+    with _snapshot_lock:
+        _snapshot = (0.0, frozenset())
+
+
+def track_token(token, user_id):
+    """발급된 토큰을 OutstandingToken에 기록 (로그아웃 시 폐기 대상)"""
+    return OutstandingToken.objects.get_or_create(
+        jti=token[api_settings.JTI_CLAIM],
+        defaults={
+            'user_id': user_id,
+            'token': str(token),
+            'created_at': token.current_time,
+            'expires_at': datetime_from_epoch(token['exp']),
+        },
+    )[0]
+
+
+def revoke_user_tokens(user, access_token=None) -> int:
+    """사용자의 유효한 리프레시 토큰과 현재 액세스 토큰을 한 번에 블랙리스트에 추가
+
+    만료된 토큰과 이미 폐기된 토큰은 제외하므로 누적 토큰 수와 관계없이 일정한 비용으로 처리됩니다.
+    """
+    if access_token is not None:
+        track_token(access_token, user.pk)
+
+    token_ids = list(
+        OutstandingToken.objects.filter(user=user, expires_at__gt=aware_utcnow(), blacklistedtoken__isnull=True)
+        .values_list('id', flat=True)
+    )
+    BlacklistedToken.objects.bulk_create(
+        [BlacklistedToken(token_id=token_id) for token_id in token_ids], ignore_conflicts=True)
+    reset_revoked_jtis()
+    return len(token_ids)
+
+
+def purge_expired_tokens(batch_size=PURGE_BATCH_SIZE, pause=0.0, user=None) -> int:
+    """만료된 OutstandingToken/BlacklistedToken을 배치 단위로 삭제 (user 지정 시 해당 사용자 토큰만)
+
+    한 번에 지우면 큰 테이블에서 긴 잠금이 생기므로 batch_size건씩 짧은 트랜잭션으로 나눕니다.
+    """
+    now = aware_utcnow()
+    expired = OutstandingToken.objects.filter(expires_at__lte=now)
+    if user is not None:
+        expired = expired.filter(user=user)
+    total = 0
+    while True:
+        token_ids = list(
+            expired
+            .order_by('expires_at').values_list('id', flat=True)[:batch_size]
+        )
+        if not token_ids:
+            break
+        with transaction.atomic():
+            BlacklistedToken.objects.filter(token_id__in=token_ids).delete()
+            OutstandingToken.objects.filter(id__in=token_ids).delete()
+        total += len(token_ids)
+        if len(token_ids) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+    return total
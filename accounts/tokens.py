@@ -1,19 +1,24 @@
 # accounts/tokens.py
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken
+from .token_revocation import track_token
 
 class CustomToken(RefreshToken):
-    def __init__(self, user=None, *args, **kwargs):
-        super().__init__(user, *args, **kwargs)
-        
-        # user가 제공된 경우 추가 클레임 설정
-        if user is not None:
-            self.setup_custom_claims(user)
+    @classmethod
+    def for_user(cls, user):
+        # RefreshToken(token)의 첫 인자는 토큰 문자열이므로 사용자 토큰은 for_user로 발급
+        token = super().for_user(user)
+        token.setup_custom_claims(user)
+        return token
     
     def setup_custom_claims(self, user):
         # access 토큰에 추가할 클레임 설정
         self['role'] = user.role
         self['username'] = user.username
         self['is_staff'] = user.is_staff
+        # 조직 경로 '/지점ID/팀ID/' (권한 판단용)
+        self['org_path'] = user.org_path
         
         # branch와 team 정보 추가 (해당 필드가 있는 경우)
         if hasattr(user, 'branch') and user.branch:
@@ -29,11 +34,24 @@ class CustomToken(RefreshToken):
         access = super().access_token
         
         # refresh 토큰의 커스텀 클레임을 access 토큰에도 복사
-        custom_claims = ['role', 'username', 'is_staff', 'branch_id', 
+        custom_claims = ['role', 'username', 'is_staff', 'org_path', 'branch_id',
                         'branch_name', 'team_id', 'team_name']
         
         for claim in custom_claims:
             if claim in self:
                 access[claim] = self[claim]
         
-        return access
\ No newline at end of file
+        return access
+
+class TrackedTokenRefreshSerializer(TokenRefreshSerializer):
+    """회전된 리프레시 토큰도 OutstandingToken에 기록
+
+    기본 serializer는 새 리프레시 토큰을 기록하지 않아 로그아웃 시 폐기되지 않습니다.
+    """
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        if 'refresh' in data:
+            refresh = self.token_class(data['refresh'], verify=False)
+            track_token(refresh, refresh.get(api_settings.USER_ID_CLAIM))
+        return data
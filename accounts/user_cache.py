@@ -0,0 +1,68 @@
+# accounts/user_cache.py
+import threading
+import time
+from typing import Dict, Iterable, Optional
+from django.core.cache import cache
+from django.db import transaction
+
+# 인증 시 캐시하는 사용자 필드 (비밀번호/이미지 등 나머지는 접근할 때 조회)
+CACHED_USER_FIELDS = (
+    'id', 'username', 'first_name', 'last_name', 'email', 'phone', 'department',
+    'role', 'is_active', 'is_staff', 'is_superuser', 'branch_id', 'team_id', 'org_path',
+)
+# 공유 캐시(Redis/locmem)와 프로세스 내 캐시 유지 시간(초)
+SHARED_TTL = 300
+LOCAL_TTL = 10
+
+_local: Dict[int, tuple] = {}
+_local_lock = threading.Lock()
+
+
+def _cache_key(user_id) -> str:
+    return f'accounts:user:{user_id}'
+
+
+def get_user_values(user_id) -> Optional[Dict]:
+    """프로세스 내 캐시 -> 공유 캐시 순으로 조회"""
+    now = time.monotonic()
+    with _local_lock:
+        entry = _local.get(user_id)
+    if entry and entry[0] > now:
+        return entry[1]
+
+    values = cache.get(_cache_key(user_id))
+    if values is not None:
+        with _local_lock:
+            _local[user_id] = (now + LOCAL_TTL, values)
+    return values
+
+
+def set_user_values(user_id, values: Dict):
+    cache.set(_cache_key(user_id), values, SHARED_TTL)
+    with _local_lock:
+        _local[user_id] = (time.monotonic() + LOCAL_TTL, values)
+
+
+def invalidate_users(user_ids: Iterable):
+    """사용자 변경/비활성화 시 캐시 삭제
+
+    공유 캐시는 즉시 삭제되고, 다른 프로세스의 내부 캐시는 LOCAL_TTL 안에 만료됩니다.
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    cache.delete_many([_cache_key(user_id) for user_id in user_ids])
+    with _local_lock:
+        for user_id in user_ids:
+            _local.pop(user_id, None)
+
+
+def invalidate_users_on_commit(user_ids: Iterable):
+    """트랜잭션 커밋 후 캐시 삭제
+
+    커밋 전에 지우면 동시 요청이 이전 행(역할/활성 여부/조직 경로)을 다시 읽어 SHARED_TTL 동안 캐시하므로
+    변경 쿼리 이후 on_commit으로 삭제합니다.
+    """
+    user_ids = list(user_ids)
+    if user_ids:
+        transaction.on_commit(lambda: invalidate_users(user_ids))
@@ -4,11 +4,11 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from django.contrib.auth import authenticate, logout, login
-from .models import User
+from .models import Branch, Team, User
 from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework_simplejwt.token_blacklist.models import OutstandingToken, BlacklistedToken
 from .permissions import IsAdmin
 from .tokens import CustomToken
+from .token_revocation import revoke_user_tokens
 
 
 @api_view(['POST'])
@@ -55,19 +55,36 @@ def register_view(request):
         return Response({'error': '권한이 없습니다.'},
                         status=status.HTTP_403_FORBIDDEN)
 
+    # 소속 지점/팀 (ID)
     try:
-        # 사용자 생성
+        branch = Branch.objects.get(id=branch) if branch else None
+        team = Team.objects.select_related('branch').get(id=team) if team else None
+    except (Branch.DoesNotExist, Team.DoesNotExist, ValueError):
+        return Response({'error': '존재하지 않는 지점 또는 팀입니다.'},
+                        status=status.HTTP_400_BAD_REQUEST)
+
+    # 지점장/팀장은 본인 지점/팀 소속으로만 생성 (지정하지 않으면 본인 소속)
+    scope_path = request.user.scope_path
+    if scope_path:
+        branch = branch or request.user.branch
+        if requester_role == 'team_leader':
+            team = team or request.user.team
+        org_path = team.org_path if team else branch.org_path
+        if not org_path.startswith(scope_path):
+            return Response({'error': '다른 지점/팀 소속으로 생성할 권한이 없습니다.'},
+                            status=status.HTTP_403_FORBIDDEN)
+
+    try:
+        # 사용자 생성 (팀이 있으면 지점은 팀의 지점으로 저장)
         user = User.objects.create_user(
             username=username,
             password=password,
-            role=role
+            role=role,
+            branch=branch,
+            team=team
         )
 
         # 추가 필드 업데이트
-        if branch:
-            user.branch = branch
-        if team:
-            user.team = team
         if department:
             user.department = department
         if phone:
@@ -82,7 +99,7 @@ def register_view(request):
         user.save()
 
         # CustomToken을 사용하여 토큰 생성
-        refresh = CustomToken(user)
+        refresh = CustomToken.for_user(user)
 
         return Response({
             'success': True,
@@ -122,7 +139,7 @@ def login_view(request):
     if user is not None:
         login(request, user)
         # CustomToken 사용
-        refresh = CustomToken(user)
+        refresh = CustomToken.for_user(user)
         token_data = {
             'success': True,
             'access': str(refresh.access_token),
@@ -153,8 +170,8 @@ def login_view(request):
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def logout_view(request):
-    for token in OutstandingToken.objects.filter(user=request.user):
-        _, _ = BlacklistedToken.objects.get_or_create(token=token)
+    # 유효한 리프레시 토큰과 현재 액세스 토큰 폐기
+    revoke_user_tokens(request.user, request.auth)
     logout(request)
     return Response({'success': True})
 
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import LoanCase, SecurityProvider, PriorLoan, ConsultingLog, CaseComment, Notice
+from .models import LoanCase, SecurityProvider, PriorLoan, ConsultingLog, CaseComment, Notice, DailyCaseStats, CaseStatusChange
 
 class SecurityProviderInline(admin.TabularInline):
     model = SecurityProvider
@@ -19,13 +19,22 @@ class CaseCommentInline(admin.TabularInline):
     extra = 1
     readonly_fields = ('created_at', 'writer')
 
+class CaseStatusChangeInline(admin.TabularInline):
+    model = CaseStatusChange
+    extra = 0
+    can_delete = False
+    readonly_fields = ('from_status', 'to_status', 'changed_at', 'changed_by')
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
 @admin.register(LoanCase)
 class LoanCaseAdmin(admin.ModelAdmin):
     list_display = ('borrower_name', 'loan_amount', 'interest_rate', 'status', 'reception_date', 'authorizing_date', 'journalizing_date', 'scheduled_date')
-    list_filter = ('status', 'is_urgent')
+    list_filter = ('status', 'is_urgent', 'region_tier')
     search_fields = ('borrower_name', 'borrower_phone')
     ordering = ('-created_at',)
-    inlines = [SecurityProviderInline, PriorLoanInline, ConsultingLogInline, CaseCommentInline]
+    inlines = [SecurityProviderInline, PriorLoanInline, ConsultingLogInline, CaseCommentInline, CaseStatusChangeInline]
     fields = [
         'status', 'referrer', 'manager', 'created_at', 'updated_at',
         'borrower_name', 'borrower_birth', 'borrower_phone', 'borrower_credit_score',
@@ -37,13 +46,13 @@ class LoanCaseAdmin(admin.ModelAdmin):
         'is_fake_business', 'is_soho', 'need_proof_of_use', 'is_separate_household',
         'residents', 'loan_amount', 'interest_rate',
         'is_urgent', 'reception_date', 'authorizing_date', 'journalizing_date', 'scheduled_date',
-        'status_changes',
     ]
     readonly_fields = ('created_at', 'updated_at')
 
     def save_model(self, request, obj, form, change):
         if not obj.pk:
             obj.manager = request.user
+        obj._changed_by = request.user
         super().save_model(request, obj, form, change)
 
 @admin.register(SecurityProvider)
@@ -80,4 +89,11 @@ class NoticeAdmin(admin.ModelAdmin):
     list_display = ('title', 'priority', 'created_at', 'created_by', 'end_date', 'is_active')
     search_fields = ('title', 'content')
     ordering = ('-priority', '-created_at')
-    fields = ['title', 'content', 'priority', 'created_by', 'end_date', 'is_active']  # 'created_at'을 제외
\ No newline at end of file
+    fields = ['title', 'content', 'priority', 'created_by', 'end_date', 'is_active']  # 'created_at'을 제외
+
+@admin.register(DailyCaseStats)
+class DailyCaseStatsAdmin(admin.ModelAdmin):
+    list_display = ('date', 'status', 'manager', 'case_count', 'loan_amount', 'new_count')
+    list_filter = ('status', 'manager')
+    date_hierarchy = 'date'
+    ordering = ('-date', 'status')
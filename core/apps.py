@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .region_tiers import get_region_trie
+        from .services.loan_rate_service import get_rate_tables
+        # LTV/금리/급지 표를 기동 시 한 번 읽어 둠
+        get_rate_tables()
+        get_region_trie()
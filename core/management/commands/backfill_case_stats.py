@@ -0,0 +1,27 @@
+# core/management/commands/backfill_case_stats.py
+from datetime import date, timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from core.services.daily_stats_service import DailyCaseStatsService
+
+
+class Command(BaseCommand):
+    help = 'CaseStatusChange 이력으로 일별 대출건 통계 재구성'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', required=True, help='시작일 (YYYY-MM-DD)')
+        parser.add_argument('--end', help='종료일 (YYYY-MM-DD, 기본값: 전일)')
+
+    def handle(self, *args, **options):
+        try:
+            start = date.fromisoformat(options['start'])
+            end = (date.fromisoformat(options['end']) if options['end']
+                   else timezone.now().date() - timedelta(days=1))
+        except ValueError:
+            raise CommandError('날짜 형식은 YYYY-MM-DD 이어야 합니다.')
+
+        if start > end:
+            raise CommandError('시작일이 종료일보다 늦습니다.')
+
+        count = DailyCaseStatsService.backfill(start, end)
+        self.stdout.write(self.style.SUCCESS(f'{start} ~ {end} 통계 {count}건 저장'))
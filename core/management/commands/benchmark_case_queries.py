@@ -0,0 +1,151 @@
+# core/management/commands/benchmark_case_queries.py
+import random
+import statistics
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+from accounts.models import User
+from core.models import LoanCase
+from core.services.dashboard_service import DashboardService
+from todos.models import Todo
+from todos.views import TodoViewSet
+
+BENCH_PREFIX = 'BENCH-'
+SEED_BATCH_SIZE = 5000
+# created_at을 같은 값으로 맞추는 묶음 크기 (update 한 번의 IN 목록 크기)
+CREATED_AT_CHUNK_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = '테스트 DB에 대출 건/할일을 대량 생성한 뒤 목록/대시보드/할일 쿼리 응답시간을 인덱스 유무로 비교'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--cases', type=int, default=500000, help='생성할 대출 건 수')
+        parser.add_argument('--todos', type=int, default=100000, help='생성할 할일 수')
+        parser.add_argument('--repeat', type=int, default=5, help='엔드포인트별 반복 횟수')
+        parser.add_argument('--keepdb', action='store_true', help='테스트 DB를 삭제하지 않고 다음 실행에 재사용')
+
+    def handle(self, *args, **options):
+        # 운영 DB의 인덱스/데이터를 건드리지 않도록 테스트 러너와 같은 방식으로 별도 DB를 만들어 사용
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False, keepdb=options['keepdb'])
+        try:
+            self._run(options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options['keepdb'])
+
+    def _run(self, options):
+        managers = self._seed(options['cases'], options['todos'])
+        staff = managers[1]
+
+        today = timezone.now().date()
+        latest = LoanCase.objects.select_related('manager').order_by('-created_at')
+        factory = APIRequestFactory()
+        todo_list = TodoViewSet.as_view({'get': 'list'})
+        case_id = LoanCase.objects.filter(manager=staff).values_list('id', flat=True).first()
+
+        def list_todos(params):
+            request = factory.get('/api/todos/', params)
+            force_authenticate(request, user=staff)
+            return todo_list(request).render()
+
+        # 각 엔드포인트가 실행하는 쿼리 형태 (목록은 첫 페이지 10건 + 전체 건수)
+        endpoints = [
+            ('case list (admin)', lambda: (list(latest[:10]), latest.count())),
+            ('case list (staff)', lambda: (
+                list(latest.filter(manager=staff)[:10]), latest.filter(manager=staff).count())),
+            ('case list (status filter)', lambda: (
+                list(latest.filter(status='심사중')[:10]), latest.filter(status='심사중').count())),
+            ('case list (urgent filter)', lambda: (
+                list(latest.filter(is_urgent=True)[:10]), latest.filter(is_urgent=True).count())),
+            ('dashboard stats', lambda: DashboardService._get_case_stats(today)),
+            ('dashboard urgent cases', lambda: DashboardService._get_urgent_cases(today)),
+            ('dashboard recent cases', lambda: DashboardService._get_recent_cases(staff)),
+            ('todo list (staff)', lambda: list_todos({})),
+            ('todo list (cursor)', lambda: list_todos({'pagination': 'cursor'})),
+            ('todo list (case filter)', lambda: list_todos({'loan_case': case_id})),
+        ]
+
+        indexes = LoanCase._meta.indexes
+        try:
+            with connection.schema_editor() as editor:
+                for index in indexes:
+                    editor.remove_index(LoanCase, index)
+            before = self._measure(endpoints, options['repeat'])
+        finally:
+            with connection.schema_editor() as editor:
+                for index in indexes:
+                    editor.add_index(LoanCase, index)
+            # 재생성한 인덱스 통계 갱신 (PostgreSQL/SQLite 공통)
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+        after = self._measure(endpoints, options['repeat'])
+
+        self.stdout.write(f"{'endpoint':<32}{'no index (ms)':>16}{'indexed (ms)':>16}")
+        for name, _ in endpoints:
+            self.stdout.write(f"{name:<32}{before[name]:>16.1f}{after[name]:>16.1f}")
+
+    def _seed(self, case_count, todo_count):
+        managers = [
+            User.objects.get_or_create(username=f'{BENCH_PREFIX}{role}', defaults={'role': role, 'is_staff': role == 'admin'})[0]
+            for role in ('admin', 'staff', 'team_leader')
+        ]
+        statuses = [choice for choice, _ in LoanCase.STATUS_CHOICES]
+        today = timezone.now().date()
+
+        existing = LoanCase.objects.filter(borrower_name__startswith=BENCH_PREFIX).count()
+        for start in range(existing, case_count, SEED_BATCH_SIZE):
+            cases = LoanCase.objects.bulk_create([
+                LoanCase(
+                    borrower_name=f'{BENCH_PREFIX}{i}',
+                    manager=random.choice(managers),
+                    status=random.choice(statuses),
+                    loan_amount=random.randint(1000, 50000),
+                    is_urgent=random.random() < 0.01,
+                    scheduled_date=today + timedelta(days=random.randint(-30, 30)),
+                )
+                for i in range(start, min(start + SEED_BATCH_SIZE, case_count))
+            ])
+            self._spread_created_at(LoanCase, [case.id for case in cases])
+
+        case_ids = list(LoanCase.objects.filter(borrower_name__startswith=BENCH_PREFIX).values_list('id', flat=True))
+        existing = Todo.objects.filter(title__startswith=BENCH_PREFIX).count()
+        for start in range(existing, todo_count if case_ids else 0, SEED_BATCH_SIZE):
+            todos = Todo.objects.bulk_create([
+                Todo(
+                    loan_case_id=random.choice(case_ids),
+                    title=f'{BENCH_PREFIX}{i}',
+                    created_by=random.choice(managers),
+                    assigned_to=random.choice(managers),
+                    priority=random.randint(1, 3),
+                    deadline=timezone.now() + timedelta(days=random.randint(-30, 30)),
+                )
+                for i in range(start, min(start + SEED_BATCH_SIZE, todo_count))
+            ])
+            self._spread_created_at(Todo, [todo.id for todo in todos])
+
+        self.stdout.write(f'대출 건 {case_count}건, 할일 {todo_count}건 준비 완료')
+        return managers
+
+    def _spread_created_at(self, model, ids):
+        """생성일을 2년에 걸쳐 분산 (auto_now_add는 그대로 두고 생성 후 update로 변경)"""
+        now = timezone.now()
+        random.shuffle(ids)
+        for start in range(0, len(ids), CREATED_AT_CHUNK_SIZE):
+            model.objects.filter(id__in=ids[start:start + CREATED_AT_CHUNK_SIZE]).update(
+                created_at=now - timedelta(minutes=random.randint(0, 60 * 24 * 730)))
+
+    def _measure(self, endpoints, repeat):
+        results = {}
+        for name, run in endpoints:
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                run()
+                timings.append((time.perf_counter() - started) * 1000)
+            results[name] = statistics.median(timings)
+        return results
@@ -0,0 +1,34 @@
+# core/management/commands/dedupe_case_events.py
+import time
+from django.core.management.base import BaseCommand
+from core.models import Event
+from core.services.calendar_service import CalendarService
+
+
+class Command(BaseCommand):
+    help = '대출 건 날짜를 기본 제목으로 복사한 중복 일정(Event) 삭제 (일회성, 캘린더는 대출 건 날짜로 표시)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='배치당 삭제 건수')
+        parser.add_argument('--pause', type=float, default=0.0, help='배치 사이 대기 시간(초)')
+        parser.add_argument('--dry-run', action='store_true', help='삭제하지 않고 건수만 출력')
+
+    def handle(self, *args, **options):
+        redundant = CalendarService.redundant_events().order_by('id')
+        if options['dry_run']:
+            self.stdout.write(f'중복 일정 {redundant.count()}건')
+            return
+
+        total = 0
+        last_id = 0
+        while True:
+            ids = list(redundant.filter(id__gt=last_id).values_list('id', flat=True)[:options['batch_size']])
+            if not ids:
+                break
+            total += Event.objects.filter(id__in=ids).delete()[0]
+            last_id = ids[-1]
+            self.stdout.write(f'{total}건 삭제')
+            if options['pause']:
+                time.sleep(options['pause'])
+
+        self.stdout.write(self.style.SUCCESS(f'중복 일정 {total}건 삭제 완료'))
@@ -0,0 +1,24 @@
+# core/management/commands/snapshot_case_stats.py
+from datetime import date, timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from core.services.daily_stats_service import DailyCaseStatsService
+
+
+class Command(BaseCommand):
+    help = '일별 대출건 통계 스냅샷 생성 (매일 자정 직후 실행, 기본값: 전일)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', help='기준일 (YYYY-MM-DD)')
+
+    def handle(self, *args, **options):
+        if options['date']:
+            try:
+                day = date.fromisoformat(options['date'])
+            except ValueError:
+                raise CommandError('날짜 형식은 YYYY-MM-DD 이어야 합니다.')
+        else:
+            day = timezone.now().date() - timedelta(days=1)
+
+        count = DailyCaseStatsService.snapshot(day)
+        self.stdout.write(self.style.SUCCESS(f'{day} 통계 {count}건 저장'))
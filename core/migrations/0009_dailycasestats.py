@@ -0,0 +1,40 @@
+# Generated by Django 4.2 on 2026-10-19 00:23
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0008_loancase_business_category_loancase_business_item_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyCaseStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='기준일')),
+                ('status', models.CharField(blank=True, choices=[('단순조회중', '단순조회중'), ('신용조회중', '신용조회중'), ('서류수취중', '서류수취중'), ('심사중', '심사중'), ('승인', '승인'), ('자서예정', '자서예정'), ('기표예정', '기표예정'), ('용도증빙', '용도증빙'), ('완료', '완료'), ('취소', '취소'), ('거절', '거절'), ('보류', '보류')], max_length=20, null=True, verbose_name='진행상황')),
+                ('case_count', models.IntegerField(default=0, verbose_name='건수')),
+                ('loan_amount', models.BigIntegerField(default=0, help_text='단위: 만원', verbose_name='실행금액 합계')),
+                ('new_count', models.IntegerField(default=0, verbose_name='신규 건수')),
+                ('recent_count', models.IntegerField(default=0, verbose_name='30일 이내 생성 건수')),
+                ('month_count', models.IntegerField(default=0, verbose_name='당월 생성 건수')),
+                ('month_loan_amount', models.BigIntegerField(default=0, help_text='단위: 만원', verbose_name='당월 생성 실행금액 합계')),
+                ('manager', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='daily_case_stats', to=settings.AUTH_USER_MODEL, verbose_name='담당자')),
+            ],
+            options={
+                'verbose_name': '일별 대출건 통계',
+                'verbose_name_plural': '일별 대출건 통계 목록',
+                'ordering': ['-date', 'status'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailycasestats',
+            constraint=models.UniqueConstraint(fields=('date', 'status', 'manager'), name='unique_daily_case_stats'),
+        ),
+    ]
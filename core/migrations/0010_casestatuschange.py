@@ -0,0 +1,64 @@
+# Generated by Django 4.2 on 2026-10-19 00:26
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+from datetime import datetime
+
+
+def copy_status_changes(apps, schema_editor):
+    """기존 status_changes JSON 이력을 CaseStatusChange 테이블로 이관"""
+    LoanCase = apps.get_model('core', 'LoanCase')
+    CaseStatusChange = apps.get_model('core', 'CaseStatusChange')
+
+    changes = []
+    for loan_case in LoanCase.objects.only('id', 'status_changes').iterator():
+        for change in loan_case.status_changes or []:
+            try:
+                changed_at = datetime.fromisoformat(change['changed_at'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            changes.append(CaseStatusChange(
+                loan_case_id=loan_case.id,
+                from_status=change.get('from_status'),
+                to_status=change.get('to_status'),
+                changed_at=changed_at,
+            ))
+    CaseStatusChange.objects.bulk_create(changes, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0009_dailycasestats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CaseStatusChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(blank=True, max_length=20, null=True, verbose_name='변경 전 상태')),
+                ('to_status', models.CharField(blank=True, max_length=20, null=True, verbose_name='변경 후 상태')),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='변경일시')),
+                ('changed_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='변경자')),
+                ('loan_case', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_history', to='core.loancase', verbose_name='대출 건')),
+            ],
+            options={
+                'verbose_name': '상태 변경 이력',
+                'verbose_name_plural': '상태 변경 이력 목록',
+                'ordering': ['changed_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='casestatuschange',
+            index=models.Index(fields=['loan_case', 'changed_at'], name='core_status_change_case_idx'),
+        ),
+        migrations.RunPython(copy_status_changes, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='loancase',
+            name='status_changes',
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2 on 2026-10-19 00:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_casestatuschange'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='loancase',
+            index=models.Index(fields=['manager', '-created_at'], name='core_case_manager_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loancase',
+            index=models.Index(fields=['-created_at'], name='core_case_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loancase',
+            index=models.Index(fields=['status', 'created_at'], name='core_case_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loancase',
+            index=models.Index(fields=['scheduled_date', 'status'], name='core_case_scheduled_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loancase',
+            index=models.Index(condition=models.Q(('is_urgent', True)), fields=['-created_at'], name='core_case_urgent_idx'),
+        ),
+    ]
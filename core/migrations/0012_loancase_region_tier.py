@@ -0,0 +1,35 @@
+# Generated by Django 4.2 on 2026-10-19 00:53
+
+from django.db import migrations, models
+from core.region_tiers import resolve_region_tier
+
+
+def fill_region_tier(apps, schema_editor):
+    """기존 대출 건의 주소로 급지 채우기"""
+    LoanCase = apps.get_model('core', 'LoanCase')
+
+    batch = []
+    for loan_case in LoanCase.objects.exclude(address_main=None).only('id', 'address_main').iterator():
+        loan_case.region_tier = resolve_region_tier(loan_case.address_main)
+        if loan_case.region_tier is not None:
+            batch.append(loan_case)
+        if len(batch) >= 1000:
+            LoanCase.objects.bulk_update(batch, ['region_tier'])
+            batch = []
+    LoanCase.objects.bulk_update(batch, ['region_tier'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_loancase_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='loancase',
+            name='region_tier',
+            field=models.PositiveSmallIntegerField(blank=True, db_index=True, null=True, verbose_name='급지'),
+        ),
+        migrations.RunPython(fill_region_tier, migrations.RunPython.noop),
+    ]
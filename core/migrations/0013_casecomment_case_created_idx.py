@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-19 00:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_loancase_region_tier'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='casecomment',
+            index=models.Index(fields=['loan_case', 'created_at'], name='core_comment_case_created_idx'),
+        ),
+    ]
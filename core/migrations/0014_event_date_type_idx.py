@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-19 01:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_casecomment_case_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['date', 'event_type'], name='event_date_type_idx'),
+        ),
+    ]
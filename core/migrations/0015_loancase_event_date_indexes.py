@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-19 01:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_event_date_type_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='loancase',
+            index=models.Index(fields=['authorizing_date'], name='core_case_authorizing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loancase',
+            index=models.Index(fields=['journalizing_date'], name='core_case_journalizing_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2 on 2026-10-19 01:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_loancase_event_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='dailycasestats',
+            constraint=models.UniqueConstraint(condition=models.Q(('manager__isnull', True)), fields=('date', 'status'), name='unique_daily_case_stats_no_manager'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailycasestats',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__isnull', True)), fields=('date', 'manager'), name='unique_daily_case_stats_no_status'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailycasestats',
+            constraint=models.UniqueConstraint(condition=models.Q(('manager__isnull', True), ('status__isnull', True)), fields=('date',), name='unique_daily_case_stats_no_status_manager'),
+        ),
+    ]
@@ -1,13 +1,78 @@
 # core/models.py
 from django.db import models
+from django.db.models.functions import Cast, Coalesce
+from core.region_tiers import resolve_region_tier
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
 from datetime import datetime
 from django.utils import timezone
 from datetime import timedelta
 
+_UNKNOWN_STATUS = object()
+
+CASE_MANAGER_ROLES = ('admin', 'branch_manager', 'team_leader', 'staff')
+
+
+def case_visibility_q(user, prefix=''):
+    """역할별 대출 건 조회 범위 조건 (prefix='loan_case__' 로 연관 모델에도 사용)
+
+    - admin: 전체
+    - branch_manager/team_leader: 담당자 조직 경로(org_path)가 본인 지점/팀 경로로 시작하는 대출 건
+      (소속이 없으면 본인 담당 건)
+    - staff: 본인 담당 건
+    """
+    if user.role == 'admin':
+        return models.Q()
+    if user.scope_path:
+        return models.Q(**{f'{prefix}manager__org_path__startswith': user.scope_path})
+    if user.role in CASE_MANAGER_ROLES:
+        return models.Q(**{f'{prefix}manager': user})
+    return models.Q(**{f'{prefix}pk__in': []})
+
+
+class CaseScopedQuerySet(models.QuerySet):
+    """대출 건 권한을 따르는 모델용 QuerySet (권한 조건을 JOIN으로 처리)"""
+    case_lookup = 'loan_case__'
+
+    def visible_to(self, user):
+        return self.filter(case_visibility_q(user, self.case_lookup))
+
+
+
+class LoanCaseQuerySet(CaseScopedQuerySet):
+    case_lookup = ''
+
+    def with_ltv(self):
+        """선설정 합계/선후순위/LTV를 서브쿼리로 함께 조회 (행마다 prior_loans 조회 방지)"""
+        prior_loans = PriorLoan.objects.filter(loan_case=models.OuterRef('pk'))
+        prior_loan_total = prior_loans.order_by().values('loan_case').annotate(
+            total=models.Sum('amount')
+        ).values('total')
+
+        queryset = self.annotate(
+            prior_loan_total=Coalesce(models.Subquery(prior_loan_total), 0),
+            has_prior_loans=models.Exists(prior_loans),
+        )
+        # loan_ltv 속성과 같은 순서로 계산: (실행금액 + 선설정 합계) / 시세 * 100
+        return queryset.annotate(
+            ltv=models.Case(
+                models.When(
+                    price_amount__gt=0,
+                    then=Cast(
+                        Coalesce('loan_amount', 0) + models.F('prior_loan_total'),
+                        models.FloatField()
+                    ) / models.F('price_amount') * 100,
+                ),
+                default=None,
+                output_field=models.FloatField(),
+            )
+        )
+
+
 class LoanCase(models.Model):
     """대출 건 메인 모델"""
+    objects = LoanCaseQuerySet.as_manager()
+
     STATUS_CHOICES = [
         ('단순조회중', '단순조회중'),
         ('신용조회중', '신용조회중'),
@@ -76,6 +141,8 @@ class LoanCase(models.Model):
     # 담보물건 정보
     address_main = models.CharField('담보물건지', max_length=200, help_text='동까지', null=True, blank=True)
     address_detail = models.CharField('상세주소', max_length=200, null=True, blank=True)
+    # address_main에서 계산한 급지 (저장 시 갱신, 급지별 필터/통계용)
+    region_tier = models.PositiveSmallIntegerField('급지', null=True, blank=True, db_index=True)
     area = models.DecimalField('면적', max_digits=10, decimal_places=2, null=True, blank=True)
     
     # 체크박스 필드들
@@ -121,33 +188,56 @@ class LoanCase(models.Model):
     journalizing_date = models.DateField('기표예정일', null=True, blank=True)  # 기표예정일
     scheduled_date = models.DateField('고객요청일', null=True, blank=True)  # 고객체크
 
-    # 상태 변경 이력을 저장할 JSON 필드 추가
-    status_changes = models.JSONField('상태 변경 이력', default=list, blank=True, null=True)
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 상태 변경 이력 비교용으로 조회 시점의 상태 보관 (저장 시 재조회 방지)
+        instance._loaded_status = instance.__dict__.get('status', _UNKNOWN_STATUS)
+        return instance
+
+    def is_visible_to(self, user):
+        """visible_to()와 같은 규칙을 조회된 객체에 적용 (지점/팀 비교 시에만 담당자 필요)"""
+        if user.role == 'admin':
+            return True
+        if user.scope_path:
+            return self.manager is not None and self.manager.org_path.startswith(user.scope_path)
+        return user.role in CASE_MANAGER_ROLES and self.manager_id == user.id
 
     def save(self, *args, **kwargs):
-        # 상태가 변경되었을 때 이력 저장
-        if self.pk:  # 기존 객체 수정시
-            try:
-                old_obj = LoanCase.objects.get(pk=self.pk)
-                if old_obj.status != self.status:  # 상태가 변경되었다면
-                    if not isinstance(self.status_changes, list):
-                        self.status_changes = []
-                    
-                    self.status_changes.append({
-                        'from_status': old_obj.status,
-                        'to_status': self.status,
-                        'changed_at': timezone.now().isoformat(),
-                        'changed_by': getattr(getattr(self, '_request', None), 'user', None)
-                    })
-            except LoanCase.DoesNotExist:
-                pass
-        
+        """저장 전 긴급처리 여부 체크, 급지 갱신 및 상태 변경 이력 기록"""
+        update_fields = kwargs.get('update_fields')
+        track_status = not self._state.adding and (
+            update_fields is None or 'status' in update_fields)
+        old_status = self._get_loaded_status() if track_status else None
+
         # 긴급처리 여부 체크 및 처리
         if self.is_urgent_schedule:
             self.is_urgent = True
-        
+
+        # 주소를 저장하는 경우에만 급지 재계산 (지연 로딩된 주소는 조회하지 않음)
+        if 'address_main' in self.__dict__ and (update_fields is None or 'address_main' in update_fields):
+            self.region_tier = resolve_region_tier(self.address_main)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'region_tier'}
+
         super().save(*args, **kwargs)
 
+        if track_status and old_status != self.status:
+            CaseStatusChange.objects.create(
+                loan_case=self,
+                from_status=old_status,
+                to_status=self.status,
+                changed_by=getattr(self, '_changed_by', None),
+            )
+        self._loaded_status = self.status
+
+    def _get_loaded_status(self):
+        loaded_status = getattr(self, '_loaded_status', _UNKNOWN_STATUS)
+        if loaded_status is _UNKNOWN_STATUS:
+            # status를 제외(defer)하고 조회한 경우에만 DB 값 확인
+            loaded_status = LoanCase.objects.filter(pk=self.pk).values_list('status', flat=True).first()
+        return loaded_status
+
     @property
     def is_urgent_schedule(self):
         if self.is_urgent:  # urgent -> is_urgent로 변경
@@ -163,16 +253,22 @@ class LoanCase(models.Model):
         
         return False
 
-    def save(self, *args, **kwargs):
-        """저장 전 긴급처리 여부 체크 및 처리"""
-        if self.is_urgent_schedule:
-            self.urgent = True  # 긴급 처리 여부 자동 설정
-        
-        super().save(*args, **kwargs)
-
     class Meta:
         verbose_name = '대출건'
         verbose_name_plural = '대출건 목록'
+        indexes = [
+            # 목록: 담당자별 최신순 / 전체 최신순
+            models.Index(fields=['manager', '-created_at'], name='core_case_manager_created_idx'),
+            models.Index(fields=['-created_at'], name='core_case_created_idx'),
+            # 목록 상태 필터, 대시보드 상태+생성일 집계
+            models.Index(fields=['status', 'created_at'], name='core_case_status_created_idx'),
+            # 대시보드 긴급 건: 예정일 기준 조회 + 긴급 플래그 부분 인덱스
+            models.Index(fields=['scheduled_date', 'status'], name='core_case_scheduled_idx'),
+            models.Index(fields=['-created_at'], condition=models.Q(is_urgent=True), name='core_case_urgent_idx'),
+            # 캘린더: 자서/기표 예정일 기간 조회 (고객요청일은 core_case_scheduled_idx 사용)
+            models.Index(fields=['authorizing_date'], name='core_case_authorizing_idx'),
+            models.Index(fields=['journalizing_date'], name='core_case_journalizing_idx'),
+        ]
 
     def __str__(self):
         return f"{self.borrower_name}님의 대출 건"
@@ -204,15 +300,29 @@ class LoanCase(models.Model):
         }
         return loan_type_dict.get(self.loan_type, self.loan_type)
 
+    # with_ltv()로 조회한 경우 주석값을, prefetch된 경우 캐시를 사용
+    def _has_prefetched_prior_loans(self):
+        return 'prior_loans' in getattr(self, '_prefetched_objects_cache', {})
+
     @property
     def loan_rank(self):
-        prior_loans = self.prior_loans.all()
-        return '후순위' if prior_loans.exists() else '선순위'
+        if hasattr(self, 'has_prior_loans'):
+            has_prior_loans = self.has_prior_loans
+        elif self._has_prefetched_prior_loans():
+            has_prior_loans = bool(self.prior_loans.all())
+        else:
+            has_prior_loans = self.prior_loans.exists()
+        return '후순위' if has_prior_loans else '선순위'
 
     @property
     def loan_ltv(self):
-        prior_loans = self.prior_loans.all()
-        prior_loan_amount = sum(loan.amount for loan in prior_loans)
+        if hasattr(self, 'ltv'):
+            return round(self.ltv, 2) if self.ltv is not None else None
+
+        if hasattr(self, 'prior_loan_total'):
+            prior_loan_amount = self.prior_loan_total
+        else:
+            prior_loan_amount = sum(loan.amount for loan in self.prior_loans.all())
         
         loan_amount = self.loan_amount or 0
         total_loan_amount = loan_amount + prior_loan_amount
@@ -243,6 +353,8 @@ class LoanCase(models.Model):
 
     @property
     def prior_loan_details(self):
+        if getattr(self, 'has_prior_loans', True) is False:
+            return None
         prior_loans = self.prior_loans.all()
         return ', '.join([f"{loan.financial_company} {loan.amount}만원" for loan in prior_loans]) if prior_loans else None
 
@@ -279,6 +391,7 @@ class LoanCase(models.Model):
             'borrower_credit_score': self.borrower_credit_score,
             'address_main': self.address_main,
             'address_detail': self.address_detail,
+            'region_tier': self.region_tier,
             'area': float(self.area) if self.area else None,
             'price_type': self.price_type,
             'price_amount': self.price_amount,
@@ -325,11 +438,32 @@ class LoanCase(models.Model):
             'is_separate_household_display': self.is_separate_household_display,
             'is_tenant': self.is_tenant,
             'is_tenant_display': self.is_tenant_display,
+            'loan_rank': self.loan_rank,
+            'loan_ltv': self.loan_ltv,
         }
     
     
     
 
+class CaseStatusChange(models.Model):
+    """대출 건 상태 변경 이력 (추가 전용)"""
+    loan_case = models.ForeignKey(LoanCase, on_delete=models.CASCADE, related_name='status_history', verbose_name='대출 건')
+    from_status = models.CharField('변경 전 상태', max_length=20, null=True, blank=True)
+    to_status = models.CharField('변경 후 상태', max_length=20, null=True, blank=True)
+    changed_at = models.DateTimeField('변경일시', default=timezone.now)
+    changed_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, verbose_name='변경자')
+
+    class Meta:
+        ordering = ['changed_at']
+        verbose_name = '상태 변경 이력'
+        verbose_name_plural = '상태 변경 이력 목록'
+        indexes = [
+            models.Index(fields=['loan_case', 'changed_at'], name='core_status_change_case_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.from_status} → {self.to_status}"
+
 class ConsultingLog(models.Model):
     """상담일지 모델"""
     loan_case = models.ForeignKey(LoanCase, on_delete=models.CASCADE, related_name='consulting_logs', null=True, blank=True)
@@ -378,6 +512,8 @@ class Notice(models.Model):
 
 class CaseComment(models.Model):
     """대출건별 커뮤니케이션"""
+    objects = CaseScopedQuerySet.as_manager()
+
     loan_case = models.ForeignKey(LoanCase, on_delete=models.CASCADE, related_name='comments', null=True, blank=True)
     writer = models.ForeignKey(
         settings.AUTH_USER_MODEL, 
@@ -407,11 +543,15 @@ class CaseComment(models.Model):
             'writer_name': self.writer.get_full_name() if self.writer else 'Unknown',
             'is_question': self.is_question,
             'is_read': self.is_read,
-            'parent_id': self.parent_id if self.parent else None,
+            'parent_id': self.parent_id,
         }
 
     class Meta:
         ordering = ['created_at']
+        indexes = [
+            # 댓글 목록/새 댓글 폴링 (loan_case, created_at) 조회
+            models.Index(fields=['loan_case', 'created_at'], name='core_comment_case_created_idx'),
+        ]
         verbose_name = '케이스 댓글'
         verbose_name_plural = '케이스 댓글 목록'
 
@@ -462,7 +602,7 @@ class SecurityProvider(models.Model):
             'phone': self.phone,
             'credit_score': self.credit_score,
             'relationship_type': self.relationship_type,
-            'related_person_id': self.related_person.id if self.related_person else None
+            'related_person_id': self.related_person_id
         }
 
     class Meta:
@@ -507,22 +647,59 @@ class Event(models.Model):
         ('authorizing', '자서'),
         ('journalizing', '기표'),
     ]
+    objects = CaseScopedQuerySet.as_manager()
+
     title = models.CharField(max_length=255)
     description = models.TextField(null=True, blank=True)
     event_type = models.CharField(max_length=20, choices=EVENT_TYPES, default='scheduled')  # default 추가
     date = models.DateField(null=True, blank=True)  # null=True, blank=True 추가
     loan_case = models.ForeignKey(LoanCase, related_name='events', on_delete=models.CASCADE)
 
-    def save(self, *args, **kwargs):
-        # date가 없는 경우에만 기본값 설정
-        if not self.date:
-            if self.event_type == 'authorizing' and self.loan_case.authorizing_date:
-                self.date = self.loan_case.authorizing_date
-            elif self.event_type == 'journalizing' and self.loan_case.journalizing_date:
-                self.date = self.loan_case.journalizing_date
-            elif self.event_type == 'scheduled' and self.loan_case.scheduled_date:
-                self.date = self.loan_case.scheduled_date
-        super().save(*args, **kwargs)
+    class Meta:
+        indexes = [
+            # 캘린더 기간 조회 (날짜 범위 + 유형 필터)
+            models.Index(fields=['date', 'event_type'], name='event_date_type_idx'),
+        ]
+
+    # 대출 건 날짜 컬럼에서 바로 만드는 일정 (Event 행으로 복사하지 않음, CalendarService 참고)
+    CASE_DATE_FIELDS = {
+        'scheduled': 'scheduled_date',
+        'authorizing': 'authorizing_date',
+        'journalizing': 'journalizing_date',
+    }
+
+    def __str__(self):
+        return f"{self.get_event_type_display()} - {self.title}"
+
+class DailyCaseStats(models.Model):
+    """일자/상태/담당자별 대출 건 통계 스냅샷 (대시보드 전일·전월 비교용)"""
+    date = models.DateField('기준일')
+    status = models.CharField('진행상황', max_length=20, choices=LoanCase.STATUS_CHOICES, null=True, blank=True)
+    manager = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='daily_case_stats', verbose_name='담당자')
+    case_count = models.IntegerField('건수', default=0)  # 기준일 종료 시점 해당 상태 건수
+    loan_amount = models.BigIntegerField('실행금액 합계', default=0, help_text='단위: 만원')
+    new_count = models.IntegerField('신규 건수', default=0)  # 기준일 생성 건
+    recent_count = models.IntegerField('30일 이내 생성 건수', default=0)
+    month_count = models.IntegerField('당월 생성 건수', default=0)
+    month_loan_amount = models.BigIntegerField('당월 생성 실행금액 합계', default=0, help_text='단위: 만원')
+
+    class Meta:
+        verbose_name = '일별 대출건 통계'
+        verbose_name_plural = '일별 대출건 통계 목록'
+        ordering = ['-date', 'status']
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'status', 'manager'], name='unique_daily_case_stats'),
+            # NULL은 서로 다른 값으로 취급되므로 담당자/상태가 없는 행은 조건부 제약으로 중복 방지
+            models.UniqueConstraint(
+                fields=['date', 'status'], condition=models.Q(manager__isnull=True),
+                name='unique_daily_case_stats_no_manager'),
+            models.UniqueConstraint(
+                fields=['date', 'manager'], condition=models.Q(status__isnull=True),
+                name='unique_daily_case_stats_no_status'),
+            models.UniqueConstraint(
+                fields=['date'], condition=models.Q(status__isnull=True, manager__isnull=True),
+                name='unique_daily_case_stats_no_status_manager'),
+        ]
 
     def __str__(self):
-        return f"{self.get_event_type_display()} - {self.title}"
\ No newline at end of file
+        return f"{self.date} {self.status} {self.case_count}건"
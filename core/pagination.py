@@ -1,7 +1,97 @@
 # core/pagination.py
-from rest_framework.pagination import PageNumberPagination
+from collections import OrderedDict
+from django.db import connection
+from rest_framework.pagination import BasePagination, CursorPagination, PageNumberPagination
+from rest_framework.response import Response
 
 class CustomPageNumberPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = 'page_size'
-    max_page_size = 100
\ No newline at end of file
+    max_page_size = 100
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """(created_at, id) 기준 키셋 페이지네이션
+
+    OFFSET/COUNT 없이 마지막 행 위치 다음부터 조회하므로 페이지 깊이와 무관하게 일정한 시간이 걸립니다.
+    ?count=exact 이면 전체 건수를, ?count=approx 이면 근사 건수를 함께 반환합니다.
+
+    DRF 커서는 첫 정렬 필드(created_at) 값만 위치로 저장하고, 같은 created_at 행은 커서의
+    offset으로 건너뜁니다. -id는 그 안의 순서를 고정하는 용도입니다.
+    created_at이 NULL인 행은 위치로 쓸 수 없으므로 커서 목록에서 제외합니다.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    count_query_param = 'count'
+    # 근사 건수는 이 값까지만 세고 넘으면 '이상'으로 표시
+    approx_count_limit = 10000
+
+    def get_ordering(self, request, queryset, view):
+        # 커서 위치가 정렬 기준과 일치해야 하므로 ?ordering 파라미터는 무시
+        return self.ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = queryset.filter(created_at__isnull=False)
+        self.count, self.count_is_approximate = self.get_count(queryset, request)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_count(self, queryset, request):
+        mode = request.query_params.get(self.count_query_param)
+        if mode == 'exact':
+            return queryset.count(), False
+        if mode == 'approx':
+            return self.get_approximate_count(queryset)
+        return None, False
+
+    def get_approximate_count(self, queryset):
+        # 필터가 없는 PostgreSQL 테이블은 통계값(reltuples) 사용
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= 0:
+                return row[0], True
+
+        # 그 외에는 상한까지만 계산
+        limit = self.approx_count_limit
+        count = queryset.order_by()[:limit + 1].count()
+        return min(count, limit), count > limit
+
+    def get_paginated_response(self, data):
+        response = OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+        ])
+        if self.count is not None:
+            response['count'] = self.count
+            response['count_is_approximate'] = self.count_is_approximate
+        response['results'] = data
+        return Response(response)
+
+
+class CursorOptInPagination(BasePagination):
+    """기본은 default_class 방식, ?pagination=cursor 또는 ?cursor= 요청 시 커서 방식"""
+    default_class = PageNumberPagination
+    cursor_class = CreatedAtCursorPagination
+    mode_query_param = 'pagination'
+
+    def use_cursor(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == 'cursor'
+            or self.cursor_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.paginator = self.cursor_class() if self.use_cursor(request) else self.default_class()
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return self.default_class().get_paginated_response_schema(schema)
@@ -0,0 +1,107 @@
+# core/region_tiers.py
+import json
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+from django.conf import settings
+
+REGIONAL_TIERS_PATH = settings.BASE_DIR / 'static' / 'json' / 'regional_tiers.json'
+
+# 시/도 약칭 -> 주소에 쓰이는 표기들. '서울특별시', '서울시', '서울'은 모두 '서울'
+PROVINCE_NAMES = {
+    '서울': ('서울특별시',),
+    '부산': ('부산광역시',),
+    '대구': ('대구광역시',),
+    '인천': ('인천광역시',),
+    '광주': ('광주광역시',),
+    '대전': ('대전광역시',),
+    '울산': ('울산광역시',),
+    '세종': ('세종특별자치시',),
+    '경기': ('경기도',),
+    '강원': ('강원도', '강원특별자치도'),
+    '충북': ('충청북도',),
+    '충남': ('충청남도',),
+    '전북': ('전라북도', '전북특별자치도'),
+    '전남': ('전라남도',),
+    '경북': ('경상북도',),
+    '경남': ('경상남도',),
+    '제주': ('제주도', '제주특별자치도'),
+}
+
+# 시/도 표에 없는 첫 단어의 접미사 제거: '○○특별시' -> '○○', '○○시' -> '○○'
+PROVINCE_SUFFIX_PATTERN = re.compile(r'(특별자치시|특별자치도|특별시|광역시|시|도)$')
+
+
+class RegionTrie:
+    """문자열 키의 글자 단위 접두사 트리
+
+    급지표 키('서울종로구')와 시/도 표기('서울특별시')에 함께 사용합니다.
+    주소 길이만큼만 따라가며 가장 긴 일치 키의 값을 반환합니다.
+    """
+    VALUE = object()
+
+    def __init__(self, values):
+        self.root = {}
+        for key, value in values.items():
+            node = self.root
+            for char in key:
+                node = node.setdefault(char, {})
+            node[RegionTrie.VALUE] = value
+
+    def longest_prefix(self, text: str) -> Tuple[Optional[object], int]:
+        """(가장 긴 일치 키의 값, 그 키의 길이). 일치가 없으면 (None, 0)"""
+        node, value, length = self.root, None, 0
+        for index, char in enumerate(text, 1):
+            node = node.get(char)
+            if node is None:
+                break
+            if RegionTrie.VALUE in node:
+                value, length = node[RegionTrie.VALUE], index
+        return value, length
+
+    def longest_match(self, text: str) -> Optional[int]:
+        return self.longest_prefix(text)[0]
+
+
+@lru_cache(maxsize=None)
+def get_province_trie() -> RegionTrie:
+    names = {}
+    for province, full_names in PROVINCE_NAMES.items():
+        names[province] = names[province + '시'] = province
+        names.update(dict.fromkeys(full_names, province))
+    return RegionTrie(names)
+
+
+@lru_cache(maxsize=None)
+def get_region_trie() -> RegionTrie:
+    with open(REGIONAL_TIERS_PATH, encoding='utf-8') as f:
+        return RegionTrie(json.load(f))
+
+
+def normalize_address(address: Optional[str]) -> Tuple[Optional[str], str]:
+    """주소를 (시/도, 공백 없는 조회 문자열)로 변환
+
+    '경기도 성남시 분당구 정자동' -> ('경기', '경기성남시분당구정자동')
+    '서울시 강남구', '서울강남구역삼동'처럼 시/도 표기나 띄어쓰기가 달라도 같은 약칭으로 맞춥니다.
+    """
+    text = ''.join(address.split()) if address else ''
+    if not text:
+        return None, ''
+
+    province, length = get_province_trie().longest_prefix(text)
+    if province is None:
+        first = address.split()[0]
+        province, length = PROVINCE_SUFFIX_PATTERN.sub('', first) or first, len(first)
+    return province, province + text[length:]
+
+
+def resolve_region(address: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
+    """주소의 (시/도, 급지). 급지표에 없는 지역이면 급지는 None"""
+    province, text = normalize_address(address)
+    if not province:
+        return None, None
+    return province, get_region_trie().longest_match(text)
+
+
+def resolve_region_tier(address: Optional[str]) -> Optional[int]:
+    return resolve_region(address)[1]
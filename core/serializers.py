@@ -3,6 +3,14 @@ from rest_framework import serializers
 from .models import LoanCase
 from core.models import Event
 from core.utils import format_phone_number
+from core.services.loan_rate_service import LoanRateService
+
+
+def get_case_pricing(obj):
+    """대출 건의 최대 LTV/예상 금리 (직렬화 중 한 번만 계산)"""
+    if not hasattr(obj, '_pricing'):
+        obj._pricing = LoanRateService.price(obj.borrower_credit_score, obj.address_main, obj.loan_ltv)
+    return obj._pricing
 
 
 class LoanCaseSerializer(serializers.ModelSerializer):
@@ -12,6 +20,10 @@ class LoanCaseSerializer(serializers.ModelSerializer):
         source='get_business_type_display', read_only=True)
     manager_name = serializers.CharField(
         source='manager.get_full_name', read_only=True)
+    loan_rank = serializers.CharField(read_only=True)
+    loan_ltv = serializers.FloatField(read_only=True)
+    max_ltv = serializers.SerializerMethodField()
+    expected_rate = serializers.SerializerMethodField()
 
     class Meta:
         model = LoanCase
@@ -27,7 +39,27 @@ class LoanCaseSerializer(serializers.ModelSerializer):
             'business_number',
             'business_category',
             'business_item',
-            'is_tenant'
+            'is_tenant',
+            'loan_rank',
+            'loan_ltv',
+            'max_ltv',
+            'expected_rate'
+        ]
+
+    def get_max_ltv(self, obj):
+        return get_case_pricing(obj)['max_ltv']
+
+    def get_expected_rate(self, obj):
+        return get_case_pricing(obj)['rate']
+
+
+class CaseStatusRowSerializer(serializers.ModelSerializer):
+    """고객 현황 페이지 목록용 최소 필드"""
+    class Meta:
+        model = LoanCase
+        fields = [
+            'id', 'status', 'borrower_name', 'address_main',
+            'loan_amount', 'interest_rate', 'created_at'
         ]
 
 
@@ -48,6 +80,8 @@ class CsvExportSerializer(serializers.ModelSerializer):
     선후순위 = serializers.SerializerMethodField()
     세입자 = serializers.BooleanField(source='is_tenant')
     취급LTV = serializers.SerializerMethodField()
+    최대LTV = serializers.SerializerMethodField()
+    예상금리 = serializers.SerializerMethodField()
     신규추가대환 = serializers.CharField(source='loan_type')
     금액 = serializers.IntegerField(source='loan_amount')
     등급 = serializers.IntegerField(source='borrower_credit_score')
@@ -65,20 +99,22 @@ class CsvExportSerializer(serializers.ModelSerializer):
             return obj.reception_date
         return obj.created_at.date() if obj.created_at else None
 
+    # 선후순위/LTV는 with_ltv() 주석값, 채권설정내역/비고는 prefetch된 목록만 사용해
+    # 행마다 추가 쿼리가 없도록 함
     def get_선후순위(self, obj):
-        prior_loans = obj.prior_loans.all()
-        return '후순위' if prior_loans.exists() else '선순위'
+        return obj.loan_rank
 
     def get_취급LTV(self, obj):
-        prior_loans = obj.prior_loans.all()
-        prior_loan_amount = sum(loan.amount for loan in prior_loans)
+        ltv = obj.loan_ltv
+        return ltv if ltv is not None else '-'
 
-        loan_amount = obj.loan_amount or 0
-        total_loan_amount = loan_amount + prior_loan_amount
+    def get_최대LTV(self, obj):
+        max_ltv = get_case_pricing(obj)['max_ltv']
+        return max_ltv if max_ltv is not None else '-'
 
-        if obj.price_amount:
-            return round((total_loan_amount / obj.price_amount) * 100, 2)
-        return '-'
+    def get_예상금리(self, obj):
+        rate = get_case_pricing(obj)['rate']
+        return rate if rate is not None else '-'
 
     def get_연락처(self, obj):
         return format_phone_number(obj.borrower_phone)
@@ -98,7 +134,7 @@ class CsvExportSerializer(serializers.ModelSerializer):
         model = LoanCase
         fields = [
             '접수일자', '진행여부', '래퍼', '차주', '기표일',
-            '사업자', '선후순위', '세입자', '취급LTV',
+            '사업자', '선후순위', '세입자', '취급LTV', '최대LTV', '예상금리',
             '신규추가대환', '금액', '등급', '금리',
             '연락처', '주소지', '시세', '전용',
             '채권설정내역', '비고', '부가세대상'
@@ -3,6 +3,10 @@ from .security_provider_service import SecurityProviderService
 from .loan_case_service import LoanCaseService
 from .prior_loan_service import PriorLoanService
 from .dashboard_service import DashboardService
+from .daily_stats_service import DailyCaseStatsService
+from .csv_import_service import CsvImportService
+from .loan_rate_service import LoanRateService
+from .case_status_service import CaseStatusService
 
 __all__ = [
     'BaseService',
@@ -10,4 +14,8 @@ __all__ = [
     'LoanCaseService',
     'PriorLoanService',
     'DashboardService',
+    'DailyCaseStatsService',
+    'CsvImportService',
+    'LoanRateService',
+    'CaseStatusService',
 ]
\ No newline at end of file
@@ -0,0 +1,198 @@
+# core/services/calendar_service.py
+import hashlib
+import json
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from django.db.models import CharField, F, IntegerField, Q, TextField, Value
+from django.db.models.functions import Concat
+from core.models import Event, LoanCase
+
+
+class CalendarService:
+    """일정 기간 조회 -> FullCalendar JSON / iCalendar 변환
+
+    접수/자서/기표 일정은 대출 건 날짜 컬럼(인덱스)에서 바로 만들고, 사용자가 등록한 Event와
+    UNION ALL 쿼리 한 번으로 함께 조회합니다. 권한 범위는 visible_to로 제한합니다.
+    같은 대출 건/유형/날짜의 Event가 있으면 대출 건 일정 대신 Event(제목/메모)를 사용합니다.
+    """
+
+    EVENT_COLORS = {
+        'scheduled': '#FB8C00',     # 접수
+        'authorizing': '#1E88E5',   # 자서
+        'journalizing': '#43A047',  # 기표
+    }
+    DEFAULT_DAYS = 30
+    MAX_RANGE_DAYS = 400
+    FIELDS = ('id', 'loan_case_id', 'event_type', 'date', 'title', 'description')
+
+    @staticmethod
+    def parse_range(start_str: Optional[str], end_str: Optional[str]) -> Tuple[date, date]:
+        """[start, end) 기간. FullCalendar가 보내는 '2024-01-01T00:00:00+09:00' 형식도 허용
+
+        Raises: ValueError (형식 오류/기간 초과)
+        """
+        if not start_str or not end_str:
+            today = date.today()
+            return today - timedelta(days=CalendarService.DEFAULT_DAYS), today + timedelta(days=CalendarService.DEFAULT_DAYS)
+
+        start = date.fromisoformat(start_str[:10])
+        end = date.fromisoformat(end_str[:10])
+        if end <= start:
+            raise ValueError('end는 start 이후여야 합니다.')
+        if (end - start).days > CalendarService.MAX_RANGE_DAYS:
+            raise ValueError(f'조회 기간은 최대 {CalendarService.MAX_RANGE_DAYS}일입니다.')
+        return start, end
+
+    @staticmethod
+    def _calendar_values(queryset, **columns):
+        # UNION 각 쿼리의 컬럼 순서를 맞추기 위해 모두 같은 이름의 annotation으로 조회
+        aliases = {f'cal_{name}': expression for name, expression in columns.items()}
+        return queryset.order_by().annotate(**aliases).values(*aliases)
+
+    @staticmethod
+    def get_events(user, start: date, end: date, event_type: Optional[str] = None) -> List[Dict]:
+        """기간 내 대출 건 날짜 일정 + 등록된 Event (쿼리 1회)
+
+        Returns: [{id(Event가 아니면 None), loan_case_id, event_type, date, title, description}] 날짜순
+        """
+        event_queryset = Event.objects.visible_to(user).filter(date__gte=start, date__lt=end)
+        if event_type:
+            event_queryset = event_queryset.filter(event_type=event_type)
+        queryset = CalendarService._calendar_values(
+            event_queryset,
+            id=F('id'),
+            loan_case_id=F('loan_case_id'),
+            event_type=F('event_type'),
+            date=F('date'),
+            title=F('title'),
+            description=F('description'),
+        )
+
+        cases = LoanCase.objects.visible_to(user)
+        case_parts = [
+            CalendarService._calendar_values(
+                cases.filter(**{f'{field}__gte': start, f'{field}__lt': end}),
+                id=Value(None, output_field=IntegerField()),
+                loan_case_id=F('id'),
+                event_type=Value(case_event_type, output_field=CharField()),
+                date=F(field),
+                title=F('borrower_name'),
+                description=Value('', output_field=TextField()),
+            )
+            for case_event_type, field in Event.CASE_DATE_FIELDS.items()
+            if not event_type or event_type == case_event_type
+        ]
+        rows = queryset.union(*case_parts, all=True)
+
+        events, case_events = [], {}
+        for row in rows:
+            row = {name: row[f'cal_{name}'] for name in CalendarService.FIELDS}
+            if row['id'] is None:
+                case_events[(row['loan_case_id'], row['event_type'], row['date'])] = row
+            else:
+                events.append(row)
+
+        # Event가 있는 (대출 건, 유형, 날짜)는 대출 건 일정 생략
+        for event in events:
+            case_events.pop((event['loan_case_id'], event['event_type'], event['date']), None)
+        return sorted(
+            events + list(case_events.values()),
+            key=lambda row: (row['date'], row['id'] is None, row['id'] or 0, row['loan_case_id'])
+        )
+
+    @staticmethod
+    def redundant_events():
+        """대출 건 날짜를 그대로 복사한 Event
+
+        같은 유형/날짜에 제목이 일정 등록 화면의 기본값('OOO님의 자서 일정')이고 메모가 없거나
+        기본값인 행만 해당합니다. 사용자가 제목/메모를 직접 입력한 일정은 남깁니다.
+        """
+        labels = dict(Event.EVENT_TYPES)
+        borrower = F('loan_case__borrower_name')
+        duplicated = Q()
+        for event_type, field in Event.CASE_DATE_FIELDS.items():
+            label = labels[event_type]
+            default_title = Concat(borrower, Value(f'님의 {label} 일정'), output_field=CharField())
+            default_description = Concat(borrower, Value(f'고객 대출 {label} 일정입니다.'), output_field=TextField())
+            duplicated |= Q(event_type=event_type, date=F(f'loan_case__{field}'), title=default_title) & (
+                Q(description__isnull=True) | Q(description='') | Q(description=default_description)
+            )
+        return Event.objects.filter(duplicated)
+
+    @staticmethod
+    def event_uid(event: Dict) -> str:
+        if event['id'] is not None:
+            return f"event-{event['id']}"
+        return f"case-{event['loan_case_id']}-{event['event_type']}"
+
+    @staticmethod
+    def to_fullcalendar(events: List[Dict]) -> List[Dict]:
+        labels = dict(Event.EVENT_TYPES)
+        return [
+            {
+                'id': CalendarService.event_uid(event),
+                'title': f"{event['title']} ({labels.get(event['event_type'], event['event_type'])})",
+                'start': event['date'].isoformat(),
+                'allDay': True,
+                'backgroundColor': CalendarService.EVENT_COLORS.get(event['event_type']),
+                'borderColor': CalendarService.EVENT_COLORS.get(event['event_type']),
+                'extendedProps': {
+                    'description': event['description'] or '',
+                    'loan_case': event['loan_case_id'],
+                    'type': event['event_type'],
+                    'event_id': event['id'],
+                },
+            }
+            for event in events
+        ]
+
+    @staticmethod
+    def etag(payload) -> str:
+        body = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        return '"{}"'.format(hashlib.sha1(body).hexdigest())
+
+    @staticmethod
+    def _ical_text(value: str) -> str:
+        # RFC 5545 TEXT 이스케이프
+        return (value or '').replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\r\n', '\\n').replace('\n', '\\n')
+
+    @staticmethod
+    def _ical_fold(line: str) -> List[str]:
+        # 한 줄 75옥텟 제한: 이어지는 줄은 공백으로 시작
+        lines, current = [], ''
+        for char in line:
+            limit = 75 if not lines else 74
+            if len((current + char).encode('utf-8')) > limit:
+                lines.append(current)
+                current = char
+            else:
+                current += char
+        lines.append(current)
+        return [lines[0]] + [' ' + part for part in lines[1:]]
+
+    @staticmethod
+    def to_ical(events: List[Dict], host: str = 'modiloan') -> str:
+        labels = dict(Event.EVENT_TYPES)
+        stamp = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
+        lines = [
+            'BEGIN:VCALENDAR',
+            'VERSION:2.0',
+            'PRODID:-//MODI//Loan Calendar//KO',
+            'CALSCALE:GREGORIAN',
+            'X-WR-CALNAME:MODI 대출 일정',
+        ]
+        for event in events:
+            label = labels.get(event['event_type'], event['event_type'])
+            lines += [
+                'BEGIN:VEVENT',
+                f"UID:{CalendarService.event_uid(event)}@{host}",
+                f'DTSTAMP:{stamp}',
+                f"DTSTART;VALUE=DATE:{event['date'].strftime('%Y%m%d')}",
+                f"DTEND;VALUE=DATE:{(event['date'] + timedelta(days=1)).strftime('%Y%m%d')}",
+                f"SUMMARY:{CalendarService._ical_text(event['title'])} ({label})",
+                f"DESCRIPTION:{CalendarService._ical_text(event['description'])}",
+                f'CATEGORIES:{label}',
+                'END:VEVENT',
+            ]
+        lines.append('END:VCALENDAR')
+        return ''.join(part + '\r\n' for line in lines for part in CalendarService._ical_fold(line))
@@ -0,0 +1,72 @@
+# core/services/case_status_service.py
+from datetime import timedelta
+from typing import Dict
+from django.db.models import Count, Q
+from django.utils import timezone
+from core.models import LoanCase
+from .base_service import BaseService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CaseStatusService(BaseService):
+    """고객 현황 페이지의 상태 그룹별 건수/목록"""
+    RECENT_DAYS = 30
+
+    # recent_only 그룹은 최근 RECENT_DAYS일 이내 생성된 건만 집계
+    STATUS_GROUPS = {
+        'reception': {'title': '접수 진행 케이스', 'statuses': ['단순조회중', '신용조회중'], 'recent_only': False},
+        'ongoing': {'title': '심사 진행 케이스', 'statuses': ['서류수취중', '심사중'], 'recent_only': False},
+        'signing': {'title': '자서/기표 진행 케이스', 'statuses': ['승인', '자서예정', '기표예정'], 'recent_only': False},
+        'proof': {'title': '용도증빙 케이스', 'statuses': ['용도증빙'], 'recent_only': False},
+        'completed': {'title': '완료된 케이스', 'statuses': ['완료'], 'recent_only': True},
+        'cancelled': {'title': '취소/종료된 케이스', 'statuses': ['취소', '거절', '보류'], 'recent_only': True},
+    }
+
+    @staticmethod
+    def _recent_from():
+        return timezone.now() - timedelta(days=CaseStatusService.RECENT_DAYS)
+
+    @staticmethod
+    def get_summary(user) -> Dict:
+        """상태별 건수를 GROUP BY 쿼리 한 번으로 집계해 그룹별로 합산"""
+        rows = LoanCase.objects.visible_to(user).values('status').annotate(
+            total=Count('id'),
+            recent=Count('id', filter=Q(created_at__gte=CaseStatusService._recent_from())),
+        ).order_by()
+        counts = {row['status']: row for row in rows}
+
+        groups = {}
+        for key, group in CaseStatusService.STATUS_GROUPS.items():
+            count_key = 'recent' if group['recent_only'] else 'total'
+            statuses = {
+                status: counts[status][count_key] if status in counts else 0
+                for status in group['statuses']
+            }
+            groups[key] = {
+                'title': group['title'],
+                'count': sum(statuses.values()),
+                'statuses': statuses,
+            }
+
+        return {
+            'statuses': {status: row['total'] for status, row in counts.items()},
+            'groups': groups,
+        }
+
+    @staticmethod
+    def get_group_cases(user, group_key, status=None):
+        """그룹(선택 시 특정 상태)에 속한 대출 건 QuerySet. 잘못된 그룹/상태는 ValueError"""
+        group = CaseStatusService.STATUS_GROUPS.get(group_key)
+        if group is None:
+            raise ValueError(f'알 수 없는 상태 그룹입니다: {group_key}')
+        if status and status not in group['statuses']:
+            raise ValueError(f'{group_key} 그룹에 없는 상태입니다: {status}')
+
+        queryset = LoanCase.objects.visible_to(user).filter(
+            status__in=[status] if status else group['statuses']
+        )
+        if group['recent_only']:
+            queryset = queryset.filter(created_at__gte=CaseStatusService._recent_from())
+        return queryset
@@ -0,0 +1,186 @@
+# core/services/change_bus.py
+import asyncio
+import json
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from django.conf import settings
+from django.db import transaction
+from django.core.serializers.json import DjangoJSONEncoder
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class LocalChangeBus:
+    """프로세스 내 변경 알림 버스
+
+    이벤트에 증가하는 ID를 붙여 최근 BUFFER_SIZE개를 보관하고,
+    대기 중인 스트림(스레드/asyncio)을 깨웁니다.
+    """
+    BUFFER_SIZE = 1000
+
+    def __init__(self, buffer_size: int = None):
+        self.buffer_size = buffer_size or self.BUFFER_SIZE
+        self._events = deque(maxlen=self.buffer_size)
+        self._last_id = 0
+        self._condition = threading.Condition()
+        self._async_waiters = set()
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def publish(self, topic: str, **payload):
+        self._append({'topic': topic, **payload})
+
+    def _append(self, event: Dict):
+        with self._condition:
+            self._last_id += 1
+            self._events.append((self._last_id, event))
+        self._notify()
+
+    def _notify(self):
+        """대기 중인 스트림(스레드/asyncio)을 깨움"""
+        with self._condition:
+            self._condition.notify_all()
+            waiters = list(self._async_waiters)
+
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(waiter.set)
+
+    def _has_news(self, last_id: int) -> bool:
+        return self._last_id != last_id
+
+    def events_since(self, last_id: int) -> Tuple[List[Tuple[int, Dict]], bool]:
+        """(last_id 이후 이벤트, 재동기화 필요 여부)
+
+        다른 프로세스의 ID이거나 버퍼에서 밀려난 ID면 재동기화가 필요합니다.
+        """
+        with self._condition:
+            oldest_id = self._events[0][0] if self._events else self._last_id + 1
+            if last_id > self._last_id or last_id < oldest_id - 1:
+                return [], True
+            return [(event_id, event) for event_id, event in self._events if event_id > last_id], False
+
+    def wait(self, last_id: int, timeout: float):
+        """새 이벤트가 생기거나 timeout까지 대기 (동기)"""
+        with self._condition:
+            self._condition.wait_for(lambda: self._has_news(last_id), timeout)
+        return self.events_since(last_id)
+
+    async def wait_async(self, last_id: int, timeout: float):
+        """새 이벤트가 생기거나 timeout까지 대기 (ASGI 스트림용)"""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._condition:
+            if self._has_news(last_id):
+                return self.events_since(last_id)
+            self._async_waiters.add(waiter)
+
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._condition:
+                self._async_waiters.discard(waiter)
+        return self.events_since(last_id)
+
+
+class RedisChangeBus(LocalChangeBus):
+    """Redis로 여러 프로세스(워커)가 같은 이벤트 ID와 버퍼를 공유
+
+    발행 시 INCR로 전역 ID를 붙여 sorted set에 최근 buffer_size개를 보관하므로,
+    폴링 요청이 어느 워커로 가도 같은 ID로 이어서 조회할 수 있습니다.
+    pub/sub는 대기 중인 스트림을 깨우는 용도로만 사용합니다.
+    """
+    CHANNEL = 'modiloan:changes'
+    ID_KEY = 'modiloan:changes:id'
+    EVENTS_KEY = 'modiloan:changes:events'
+
+    def __init__(self, url: str, buffer_size: int = None):
+        super().__init__(buffer_size)
+        import redis
+        self._redis = redis.Redis.from_url(url)
+        self._listener = None
+        self._listener_lock = threading.Lock()
+
+    @property
+    def last_id(self) -> int:
+        return int(self._redis.get(self.ID_KEY) or 0)
+
+    def publish(self, topic: str, **payload):
+        event = {'topic': topic, **payload}
+        try:
+            event_id = self._redis.incr(self.ID_KEY)
+            pipe = self._redis.pipeline()
+            pipe.zadd(self.EVENTS_KEY, {json.dumps([event_id, event], cls=DjangoJSONEncoder): event_id})
+            pipe.zremrangebyrank(self.EVENTS_KEY, 0, -self.buffer_size - 1)
+            pipe.publish(self.CHANNEL, event_id)
+            pipe.execute()
+        except Exception as e:
+            # 클라이언트는 주기적 전체 새로고침으로 따라잡음
+            logger.error(f"Change bus publish failed: {str(e)}")
+
+    def events_since(self, last_id: int) -> Tuple[List[Tuple[int, Dict]], bool]:
+        pipe = self._redis.pipeline()
+        pipe.get(self.ID_KEY)
+        pipe.zrange(self.EVENTS_KEY, 0, 0, withscores=True)
+        pipe.zrangebyscore(self.EVENTS_KEY, f'({last_id}', '+inf')
+        current_id, oldest, entries = pipe.execute()
+
+        current_id = int(current_id or 0)
+        oldest_id = int(oldest[0][1]) if oldest else current_id + 1
+        if last_id > current_id or last_id < oldest_id - 1:
+            return [], True
+        return [tuple(json.loads(entry)) for entry in entries], False
+
+    def _has_news(self, last_id: int) -> bool:
+        # 수신 스레드가 받은 가장 최근 ID 기준
+        return self._last_id > last_id
+
+    def _ensure_listener(self):
+        with self._listener_lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(target=self._listen, name='change-bus-listener', daemon=True)
+                self._listener.start()
+
+    def _listen(self):
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self.CHANNEL)
+        try:
+            for message in pubsub.listen():
+                with self._condition:
+                    self._last_id = max(self._last_id, int(message['data']))
+                self._notify()
+        except Exception as e:
+            logger.error(f"Change bus listener stopped: {str(e)}", exc_info=True)
+
+    def wait(self, last_id: int, timeout: float):
+        self._ensure_listener()
+        events, reset = self.events_since(last_id)
+        if events or reset:
+            return events, reset
+        return super().wait(last_id, timeout)
+
+    async def wait_async(self, last_id: int, timeout: float):
+        self._ensure_listener()
+        events, reset = self.events_since(last_id)
+        if events or reset:
+            return events, reset
+        return await super().wait_async(last_id, timeout)
+
+
+@lru_cache(maxsize=None)
+def get_change_bus() -> LocalChangeBus:
+    """CHANGE_BUS_REDIS_URL 설정 시 Redis, 아니면 프로세스 내 버스"""
+    redis_url = getattr(settings, 'CHANGE_BUS_REDIS_URL', None)
+    if redis_url:
+        return RedisChangeBus(redis_url)
+    return LocalChangeBus()
+
+
+def publish_on_commit(topic: str, **payload):
+    """트랜잭션 커밋 후 변경 알림 발행 (롤백된 변경은 알리지 않음)"""
+    transaction.on_commit(lambda: get_change_bus().publish(topic, **payload))
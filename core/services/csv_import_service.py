@@ -0,0 +1,185 @@
+# core/services/csv_import_service.py
+import csv
+import re
+import time
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from core.models import LoanCase, PriorLoan, ConsultingLog
+from core.region_tiers import resolve_region_tier
+from .change_bus import get_change_bus
+from .dashboard_service import DashboardCache
+from .loan_case_service import LoanCaseService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CsvImportService:
+    """CsvExportSerializer 컬럼 구성의 CSV를 대출 건으로 일괄 등록"""
+    BATCH_SIZE = 1000
+    MAX_REPORTED_ERRORS = 1000
+    EMPTY_VALUES = ('', '-', 'None')
+    TRUE_VALUES = ('true', '1', 'o', 'y', 'yes')
+
+    # CSV 컬럼 -> LoanCase 필드 (선후순위, 취급LTV, 최대LTV, 예상금리는 계산값이라 무시)
+    COLUMN_MAP = {
+        '접수일자': 'reception_date',
+        '진행여부': 'status',
+        '래퍼': 'referrer',
+        '차주': 'borrower_name',
+        '기표일': 'journalizing_date',
+        '사업자': 'business_type',
+        '세입자': 'is_tenant',
+        '신규추가대환': 'loan_type',
+        '금액': 'loan_amount',
+        '등급': 'borrower_credit_score',
+        '금리': 'interest_rate',
+        '연락처': 'borrower_phone',
+        '주소지': 'address_main',
+        '시세': 'price_amount',
+        '전용': 'area',
+        '부가세대상': 'vat_status',
+    }
+    CHOICE_FIELDS = {
+        'status': dict(LoanCase.STATUS_CHOICES),
+        'business_type': dict(LoanCase.BUSINESS_TYPE_CHOICES),
+        'loan_type': dict(LoanCase.LOAN_TYPE_CHOICES),
+        'vat_status': dict(LoanCase.VAT_STATUS_CHOICES),
+    }
+    INTEGER_FIELDS = ('loan_amount', 'borrower_credit_score', 'price_amount')
+    DECIMAL_FIELDS = ('interest_rate', 'area')
+    DATE_FIELDS = ('reception_date', 'journalizing_date')
+    PRIOR_LOAN_PATTERN = re.compile(r'^(?P<company>.+?)\s+(?P<amount>\d+)만원$')
+
+    @staticmethod
+    def import_cases(csv_file, user):
+        """CSV 스트림을 읽어 배치 단위로 등록하고 결과 요약 반환"""
+        started = time.perf_counter()
+        reader = csv.DictReader(csv_file)
+        imported_count, error_count, errors = 0, 0, []
+        batch = []
+
+        # 헤더가 1행이므로 데이터는 2행부터
+        for row_number, row in enumerate(reader, start=2):
+            try:
+                batch.append(CsvImportService._parse_row(row, user))
+            except ValueError as e:
+                error_count += 1
+                if len(errors) < CsvImportService.MAX_REPORTED_ERRORS:
+                    errors.append({'row': row_number, 'errors': e.args[0]})
+
+            if len(batch) >= CsvImportService.BATCH_SIZE:
+                imported_count += CsvImportService._save_batch(batch, user)
+                batch = []
+
+        if batch:
+            imported_count += CsvImportService._save_batch(batch, user)
+
+        # bulk_create는 post_save가 없으므로 대시보드 캐시 무효화와 변경 알림을 한 번만 처리
+        if imported_count:
+            DashboardCache.invalidate('cases')
+            get_change_bus().publish('dashboard')
+
+        elapsed = time.perf_counter() - started
+        total = imported_count + error_count
+        rows_per_sec = round(total / elapsed, 1) if elapsed else total
+        logger.info(
+            f"CSV import by {user}: {imported_count} imported, {error_count} errors, "
+            f"{elapsed:.2f}s ({rows_per_sec} rows/sec)")
+
+        return {
+            'imported_count': imported_count,
+            'error_count': error_count,
+            'errors': errors,
+            'elapsed_seconds': round(elapsed, 3),
+            'rows_per_sec': rows_per_sec,
+        }
+
+    @staticmethod
+    @transaction.atomic
+    def _save_batch(batch, user):
+        """대출 건을 bulk_create 후 선설정/상담일지를 한 번에 생성"""
+        cases = LoanCase.objects.bulk_create([loan_case for loan_case, _, _ in batch])
+
+        prior_loans, consulting_logs = [], []
+        for loan_case, (_, loans, note) in zip(cases, batch):
+            prior_loans.extend(
+                PriorLoan(loan_case=loan_case, loan_type='선설정', financial_company=company, amount=amount)
+                for company, amount in loans
+            )
+            if note:
+                consulting_logs.append(ConsultingLog(loan_case=loan_case, content=note, created_by=user))
+
+        PriorLoan.objects.bulk_create(prior_loans)
+        ConsultingLog.objects.bulk_create(consulting_logs)
+        return len(cases)
+
+    @staticmethod
+    def _parse_row(row, user):
+        """CSV 한 행을 (LoanCase, 선설정 목록, 비고)로 변환. 오류 시 ValueError(오류 목록)"""
+        data = {
+            field: CsvImportService._clean(row.get(column))
+            for column, field in CsvImportService.COLUMN_MAP.items()
+        }
+
+        errors = LoanCaseService.validate_case_data(data)
+
+        for field, choices in CsvImportService.CHOICE_FIELDS.items():
+            if data[field] is not None and data[field] not in choices:
+                errors.append(f'{field} 값이 올바르지 않습니다: {data[field]}')
+
+        if data['borrower_credit_score'] is not None and not data['borrower_credit_score'].isdigit():
+            errors.append('borrower_credit_score는 숫자여야 합니다.')
+
+        for field in CsvImportService.DECIMAL_FIELDS:
+            if data[field] is not None:
+                try:
+                    data[field] = Decimal(data[field])
+                except InvalidOperation:
+                    errors.append(f'{field}는 숫자여야 합니다.')
+
+        for field in CsvImportService.DATE_FIELDS:
+            if data[field] is not None:
+                try:
+                    data[field] = date.fromisoformat(data[field])
+                except ValueError:
+                    errors.append(f'{field} 날짜 형식은 YYYY-MM-DD 이어야 합니다.')
+
+        prior_loans = []
+        for item in (CsvImportService._clean(row.get('채권설정내역')) or '').split(', '):
+            if not item:
+                continue
+            match = CsvImportService.PRIOR_LOAN_PATTERN.match(item)
+            if not match:
+                errors.append(f'채권설정내역 형식이 올바르지 않습니다: {item}')
+                continue
+            prior_loans.append((match['company'][:50], int(match['amount'])))
+
+        if errors:
+            raise ValueError(errors)
+
+        for field in CsvImportService.INTEGER_FIELDS:
+            if data[field] is not None:
+                data[field] = int(data[field])
+        data['is_tenant'] = (data['is_tenant'] or '').lower() in CsvImportService.TRUE_VALUES
+        data['status'] = data['status'] or '단순조회중'
+
+        # bulk_create는 save()를 거치지 않으므로 급지를 직접 계산
+        loan_case = LoanCase(manager=user, region_tier=resolve_region_tier(data['address_main']), **data)
+        try:
+            # 길이/자릿수 초과 값이 bulk_create에서 DB 오류로 배치 전체를 실패시키지 않도록 행 단위로 검사
+            loan_case.clean_fields(exclude=['manager'])
+        except ValidationError as e:
+            raise ValueError([
+                f'{field}: {message}' for field, messages in e.message_dict.items() for message in messages
+            ])
+        return loan_case, prior_loans, CsvImportService._clean(row.get('비고'))
+
+    @staticmethod
+    def _clean(value):
+        if value is None:
+            return None
+        value = value.strip()
+        return None if value in CsvImportService.EMPTY_VALUES else value
@@ -0,0 +1,154 @@
+# core/services/daily_stats_service.py
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, Tuple
+from django.db import transaction
+from django.db.models import Count, Sum, Q, Prefetch
+from core.models import LoanCase, DailyCaseStats, CaseStatusChange
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DailyCaseStatsService:
+    RECENT_DAYS = 30
+    BATCH_SIZE = 1000
+
+    @staticmethod
+    @transaction.atomic
+    def snapshot(day: date) -> int:
+        """현재 LoanCase 데이터로 기준일 통계 스냅샷 생성 (기준일 종료 직후 실행)"""
+        recent_from = day - timedelta(days=DailyCaseStatsService.RECENT_DAYS)
+        month_from = day.replace(day=1)
+        in_month = Q(created_at__date__gte=month_from)
+
+        rows = LoanCase.objects.filter(
+            created_at__date__lte=day
+        ).values('status', 'manager_id').annotate(
+            case_count=Count('id'),
+            total_amount=Sum('loan_amount'),
+            new_count=Count('id', filter=Q(created_at__date=day)),
+            recent_count=Count('id', filter=Q(created_at__date__gte=recent_from)),
+            month_count=Count('id', filter=in_month),
+            month_amount=Sum('loan_amount', filter=in_month),
+        ).order_by()
+
+        stats = [
+            DailyCaseStats(
+                date=day,
+                status=row['status'],
+                manager_id=row['manager_id'],
+                case_count=row['case_count'],
+                loan_amount=row['total_amount'] or 0,
+                new_count=row['new_count'],
+                recent_count=row['recent_count'],
+                month_count=row['month_count'],
+                month_loan_amount=row['month_amount'] or 0,
+            )
+            for row in rows
+        ]
+
+        DailyCaseStats.objects.filter(date=day).delete()
+        DailyCaseStats.objects.bulk_create(stats, batch_size=DailyCaseStatsService.BATCH_SIZE)
+        logger.info(f"Daily case stats snapshot for {day}: {len(stats)} rows")
+        return len(stats)
+
+    @staticmethod
+    @transaction.atomic
+    def backfill(start: date, end: date) -> int:
+        """CaseStatusChange 이력으로 기간 내 일별 스냅샷 재구성
+
+        건마다 상태 구간의 시작일에 +1, 종료일에 -1을 기록한 뒤 (상태, 담당자)별 누적합으로
+        일별 값을 만듭니다 (건수 × 일수만큼 반복하지 않음).
+        실행금액 변경 이력은 남지 않으므로 금액 합계는 현재 실행금액 기준입니다.
+        """
+        one_day = timedelta(days=1)
+        # {(상태, 담당자 ID): {일자: {항목: 증감}}}
+        deltas: Dict[Tuple[str, int], Dict[date, Dict[str, int]]] = defaultdict(
+            lambda: defaultdict(lambda: defaultdict(int)))
+
+        cases = LoanCase.objects.filter(
+            created_at__date__lte=end
+        ).only(
+            'id', 'status', 'manager_id', 'created_at', 'loan_amount'
+        ).prefetch_related(
+            Prefetch('status_history', queryset=CaseStatusChange.objects.only(
+                'loan_case_id', 'from_status', 'to_status', 'changed_at'))
+        ).order_by('id')
+
+        for case in cases.iterator(chunk_size=DailyCaseStatsService.BATCH_SIZE):
+            created = case.created_at.date() if case.created_at else start
+            amount = case.loan_amount or 0
+            # 생성일 기준 신규/30일 이내/당월 생성으로 집계되는 마지막 날의 다음 날
+            new_until = created + one_day
+            recent_until = created + timedelta(days=DailyCaseStatsService.RECENT_DAYS + 1)
+            month_until = (created.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+            intervals = DailyCaseStatsService._status_intervals(case, max(start, created), end + one_day)
+            for since, until, status in intervals:
+                changes = deltas[(status, case.manager_id)]
+                DailyCaseStatsService._add_interval(changes, since, until, case_count=1, loan_amount=amount)
+                DailyCaseStatsService._add_interval(changes, since, min(until, new_until), new_count=1)
+                DailyCaseStatsService._add_interval(changes, since, min(until, recent_until), recent_count=1)
+                DailyCaseStatsService._add_interval(
+                    changes, since, min(until, month_until), month_count=1, month_loan_amount=amount)
+
+        stats = []
+        for (status, manager_id), changes in deltas.items():
+            values = defaultdict(int)
+            days = sorted(changes)
+            # 마지막 변경일(end 다음 날 이하)에는 모든 구간이 끝나 값이 0
+            for day, next_day in zip(days, days[1:]):
+                for field, delta in changes[day].items():
+                    values[field] += delta
+                if not values['case_count']:
+                    continue
+                stats.extend(
+                    DailyCaseStats(date=day + timedelta(days=offset), status=status, manager_id=manager_id, **values)
+                    for offset in range((next_day - day).days)
+                )
+
+        DailyCaseStats.objects.filter(date__range=[start, end]).delete()
+        DailyCaseStats.objects.bulk_create(stats, batch_size=DailyCaseStatsService.BATCH_SIZE)
+        logger.info(f"Daily case stats backfill {start} ~ {end}: {len(stats)} rows")
+        return len(stats)
+
+    @staticmethod
+    def _add_interval(changes, since: date, until: date, **values):
+        """[since, until) 기간에 값을 더하도록 시작일/종료일 증감 기록"""
+        if since >= until:
+            return
+        for field, value in values.items():
+            changes[since][field] += value
+            changes[until][field] -= value
+
+    @staticmethod
+    def _status_intervals(case, since: date, until: date):
+        """[since, until) 기간을 상태별로 나눈 [(시작일, 종료일(미포함), 상태)] 목록
+
+        같은 날 여러 번 바뀌면 그날의 마지막 상태를 사용합니다.
+        """
+        timeline = DailyCaseStatsService._status_timeline(case)
+        status = timeline[0][1] if timeline else case.status
+        intervals = []
+        for changed, to_status in timeline[1:]:
+            if changed >= until:
+                break
+            if changed > since:
+                intervals.append((since, changed, status))
+                since = changed
+            status = to_status
+        intervals.append((since, until, status))
+        return intervals
+
+    @staticmethod
+    def _status_timeline(case):
+        """[(변경일, 변경 후 상태)] 목록. 첫 항목은 (생성일, 최초 상태)"""
+        changes = case.status_history.all()
+        if not changes:
+            return []
+
+        created = case.created_at.date() if case.created_at else changes[0].changed_at.date()
+        timeline = [(created, changes[0].from_status)]
+        timeline.extend((change.changed_at.date(), change.to_status) for change in changes)
+        return timeline
@@ -1,98 +1,235 @@
-from typing import List, Dict, Optional
+import time
+from typing import Callable, List, Dict, Optional, Tuple
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Count, Sum, Q
 from django.utils.dateparse import parse_datetime
 from django.utils import timezone
 from datetime import date, timedelta
-from ..models import LoanCase, Notice, CaseComment, Event
+from ..models import LoanCase, Notice, CaseComment, DailyCaseStats
 import logging
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
-class DashboardService:
+class DashboardCache:
+    """대시보드 항목 캐시 (REDIS_URL이 있으면 Redis, 없으면 locmem)
+
+    키에 범위별 세대(generation) 값을 넣어, 변경 시 세대만 바꾸면 관련 키가 한 번에 무효화됩니다.
+    - cases: LoanCase 변경 -> 통계/긴급 건(전체), 최근 등록 건/미확인 질문(사용자별)
+    - questions: 질문 댓글 변경/읽음 처리 -> 미확인 질문
+    - notices: 공지사항 변경 -> 공지사항(전체)
+    """
+    SCOPES = ('cases', 'questions', 'notices')
+    # 최근 24시간 목록은 시간이 지나며 바뀌므로 짧게 유지
+    RECENT_CASES_TIMEOUT = 60
+
     @staticmethod
-    def get_dashboard_data(user) -> Dict:
-        today = timezone.now().date()
-        yesterday = today - timedelta(days=1)
+    def timeout() -> int:
+        return getattr(settings, 'DASHBOARD_CACHE_TIMEOUT', 300)
+
+    @staticmethod
+    def generations() -> Dict[str, int]:
+        keys = {scope: f'dashboard:gen:{scope}' for scope in DashboardCache.SCOPES}
+        found = cache.get_many(list(keys.values()))
+        return {scope: found.get(key, 0) for scope, key in keys.items()}
+
+    @staticmethod
+    def invalidate(*scopes):
+        # 커밋 후 세대 변경 (커밋 전에 다른 요청이 이전 데이터를 다시 캐시하지 않도록)
+        def bump():
+            cache.set_many({f'dashboard:gen:{scope}': time.time_ns() for scope in scopes}, None)
+        transaction.on_commit(bump)
+
+    @staticmethod
+    def get_many(sections: Dict[str, Tuple[str, Callable, int]]) -> Dict:
+        """{이름: (키, 계산 함수, 유지 시간)} -> {이름: 값}. 캐시에 없는 항목만 계산해 저장"""
+        found = cache.get_many([key for key, _, _ in sections.values()])
+        result, missing = {}, {}
+        for name, (key, loader, timeout) in sections.items():
+            if key in found:
+                result[name] = found[key]
+            else:
+                result[name] = loader()
+                missing.setdefault(timeout, {})[key] = result[name]
+        for timeout, values in missing.items():
+            cache.set_many(values, timeout)
+        return result
+
 
-        data = {
-            'today_stats': DashboardService._get_today_stats(today, yesterday),
-            'month_stats': DashboardService._get_month_stats(),
-            'urgent_cases': DashboardService._get_urgent_cases(today),
-            'recent_cases': DashboardService._get_recent_cases(user),
-            'unread_questions': DashboardService._get_unread_questions(user),
-            'notices': DashboardService._get_active_notices(today),
+class DashboardService:
+    # 상태 그룹 정의
+    ONGOING_STATUSES = ['단순조회중', '신용조회중',
+                        '서류수취중', '심사중', '승인', '자서예정', '기표예정']
+    COMPLETED_STATUSES = ['용도증빙', '완료']
+
+    @staticmethod
+    def _get_sections(names, user=None, today: date = None) -> Dict:
+        """대시보드 항목별 캐시 조회 (전체 항목은 날짜별, 사용자 항목은 사용자별 키)"""
+        today = today or timezone.now().date()
+        user_id = getattr(user, 'pk', None)
+        generation = DashboardCache.generations()
+        timeout = DashboardCache.timeout()
+        sections = {
+            'stats': (
+                f"dashboard:stats:{generation['cases']}:{today}",
+                lambda: DashboardService._get_stats(today), timeout),
+            'urgent_cases': (
+                f"dashboard:urgent:{generation['cases']}:{today}",
+                lambda: DashboardService._get_urgent_cases(today), timeout),
+            'notices': (
+                f"dashboard:notices:{generation['notices']}:{today}",
+                lambda: DashboardService._get_active_notices(today), timeout),
+            'recent_cases': (
+                f"dashboard:recent:{generation['cases']}:{user_id}",
+                lambda: DashboardService._get_recent_cases(user), DashboardCache.RECENT_CASES_TIMEOUT),
+            'unread_questions': (
+                f"dashboard:questions:{generation['cases']}.{generation['questions']}:{user_id}",
+                lambda: DashboardService._get_unread_questions(user), timeout),
         }
-        return data
+        return DashboardCache.get_many({name: sections[name] for name in names})
 
     @staticmethod
-    def _get_today_stats(today: date, yesterday: date) -> Dict:
-        # 상태 그룹 정의
-        ONGOING_STATUSES = ['단순조회중', '신용조회중',
-                            '서류수취중', '심사중', '승인', '자서예정', '기표예정']
-        COMPLETED_STATUSES = ['용도증빙', '완료']
+    def get_dashboard_data(user) -> Dict:
+        data = DashboardService._get_sections(
+            ['stats', 'urgent_cases', 'recent_cases', 'unread_questions', 'notices'], user)
+        data.update(data.pop('stats'))
+        return data
 
-        # 신규 케이스
-        new_cases_today = LoanCase.objects.filter(
-            created_at__date=today).count()
-        new_cases_yesterday = LoanCase.objects.filter(
-            created_at__date=yesterday).count()
+    @staticmethod
+    def get_shared_stats(today: date = None) -> Dict:
+        """사용자와 무관한 대시보드 항목 (today_stats, month_stats, urgent_cases)"""
+        data = DashboardService._get_sections(['stats', 'urgent_cases'], today=today)
+        data.update(data.pop('stats'))
+        return data
 
-        # 진행중 케이스 (정의된 상태들만)
-        ongoing_cases_today = LoanCase.objects.filter(
-            status__in=ONGOING_STATUSES).count()
-        ongoing_cases_yesterday = LoanCase.objects.filter(
-            created_at__date__lte=yesterday,
-            status__in=ONGOING_STATUSES
-        ).count()
+    @staticmethod
+    def get_recent_cases(user) -> List[Dict]:
+        return DashboardService._get_sections(['recent_cases'], user)['recent_cases']
 
-        # 완료 케이스 (30일 이내)
-        thirty_days_ago = today - timedelta(days=30)
-        completed_cases_today = LoanCase.objects.filter(
-            status__in=COMPLETED_STATUSES,
-            created_at__date__gte=thirty_days_ago
-        ).count()
-        completed_cases_yesterday = LoanCase.objects.filter(
-            status__in=COMPLETED_STATUSES,
-            created_at__date__gte=thirty_days_ago - timedelta(days=1),
-            created_at__date__lt=today
-        ).count()
+    @staticmethod
+    def get_unread_questions(user) -> List[Dict]:
+        return DashboardService._get_sections(['unread_questions'], user)['unread_questions']
 
+    @staticmethod
+    def _get_stats(today: date) -> Dict:
+        # 전일/전월 기준값은 스냅샷에서 읽고, 스냅샷이 없는 값만 LoanCase에서 함께 집계
+        baselines = DashboardService._get_snapshot_baselines(today)
+        case_stats = DashboardService._get_case_stats(today, skip=baselines.keys())
+        case_stats.update(baselines)
         return {
-            'new_cases': new_cases_today,
-            'new_cases_diff': new_cases_today - new_cases_yesterday,
-            'ongoing_cases': ongoing_cases_today,
-            'ongoing_cases_diff': ongoing_cases_today - ongoing_cases_yesterday,
-            'completed_cases': completed_cases_today,
-            'completed_cases_diff': completed_cases_today - completed_cases_yesterday,
+            'today_stats': DashboardService._get_today_stats(case_stats),
+            'month_stats': DashboardService._get_month_stats(case_stats),
         }
 
     @staticmethod
-    def _get_month_stats() -> Dict:
-        today = timezone.now().date()
+    def _get_case_stats(today: date, skip=()) -> Dict:
+        """오늘/전일/이번달/지난달 통계를 조건부 집계 쿼리 한 번으로 계산
+
+        skip: 스냅샷에서 가져온 기준값 이름 (해당 집계와 그 대상 행은 읽지 않음)
+        """
+        yesterday = today - timedelta(days=1)
+        thirty_days_ago = today - timedelta(days=30)
         first_day_of_month = today.replace(day=1)
-        last_month = first_day_of_month - timedelta(days=1)
-        first_day_of_last_month = last_month.replace(day=1)
+        first_day_of_last_month = (first_day_of_month - timedelta(days=1)).replace(day=1)
 
-        this_month_stats = LoanCase.objects.filter(created_at__gte=first_day_of_month, status='완료').aggregate(
-            count=Count('id'),
-            amount=Sum('loan_amount')
-        )
-        last_month_stats = LoanCase.objects.filter(
+        ongoing = Q(status__in=DashboardService.ONGOING_STATUSES)
+        completed = Q(status__in=DashboardService.COMPLETED_STATUSES)
+        this_month_done = Q(created_at__gte=first_day_of_month, status='완료')
+        last_month_done = Q(
             created_at__gte=first_day_of_last_month,
             created_at__lt=first_day_of_month,
             status='완료'
-        ).aggregate(
-            count=Count('id'),
-            amount=Sum('loan_amount')
         )
 
+        # 날짜 조건은 created_at 범위로 비교해 행마다 날짜 변환을 하지 않도록 함
+        tomorrow = today + timedelta(days=1)
+
+        aggregates = {
+            # 신규 케이스
+            'new_today': Count('id', filter=Q(created_at__gte=today, created_at__lt=tomorrow)),
+            'new_yesterday': Count('id', filter=Q(created_at__gte=yesterday, created_at__lt=today)),
+            # 진행중 케이스 (정의된 상태들만)
+            'ongoing_today': Count('id', filter=ongoing),
+            'ongoing_yesterday': Count('id', filter=ongoing & Q(created_at__lt=today)),
+            # 완료 케이스 (30일 이내)
+            'completed_today': Count('id', filter=completed & Q(created_at__gte=thirty_days_ago)),
+            'completed_yesterday': Count('id', filter=completed & Q(
+                created_at__gte=thirty_days_ago - timedelta(days=1),
+                created_at__lt=today
+            )),
+            # 월간 완료 건수/금액
+            'month_count': Count('id', filter=this_month_done),
+            'month_amount': Sum('loan_amount', filter=this_month_done),
+            'last_month_count': Count('id', filter=last_month_done),
+            'last_month_amount': Sum('loan_amount', filter=last_month_done),
+        }
+        for name in skip:
+            aggregates.pop(name, None)
+
+        # 집계 대상 행만 읽도록 제한 (status, created_at 인덱스 사용 가능)
+        # 전일 신규 건을 스냅샷에서 읽으면 오늘 생성된 행만 추가로 읽음
+        created_from = today if 'new_yesterday' in skip else yesterday
+        return LoanCase.objects.filter(
+            Q(status__in=DashboardService.ONGOING_STATUSES + DashboardService.COMPLETED_STATUSES) |
+            Q(created_at__gte=created_from)
+        ).aggregate(**aggregates)
+
+    @staticmethod
+    def _get_snapshot_baselines(today: date) -> Dict:
+        """전일/전월말 DailyCaseStats 스냅샷이 있으면 비교 기준값을 스냅샷으로 대체"""
+        yesterday = today - timedelta(days=1)
+        last_month_end = today.replace(day=1) - timedelta(days=1)
+
+        rows = {
+            row['date']: row
+            for row in DailyCaseStats.objects.filter(
+                date__in=[yesterday, last_month_end]
+            ).values('date').annotate(
+                new=Sum('new_count'),
+                ongoing=Sum('case_count', filter=Q(status__in=DashboardService.ONGOING_STATUSES)),
+                completed=Sum('recent_count', filter=Q(status__in=DashboardService.COMPLETED_STATUSES)),
+                month_count=Sum('month_count', filter=Q(status='완료')),
+                month_amount=Sum('month_loan_amount', filter=Q(status='완료')),
+            ).order_by()
+        }
+
+        baselines = {}
+        if yesterday in rows:
+            baselines.update(
+                new_yesterday=rows[yesterday]['new'] or 0,
+                ongoing_yesterday=rows[yesterday]['ongoing'] or 0,
+                completed_yesterday=rows[yesterday]['completed'] or 0,
+            )
+        if last_month_end in rows:
+            baselines.update(
+                last_month_count=rows[last_month_end]['month_count'] or 0,
+                last_month_amount=rows[last_month_end]['month_amount'] or 0,
+            )
+        return baselines
+
+    @staticmethod
+    def _get_today_stats(case_stats: Dict) -> Dict:
         return {
-            'count': this_month_stats['count'] or 0,
-            'count_diff': (this_month_stats['count'] or 0) - (last_month_stats['count'] or 0),
-            'amount': this_month_stats['amount'] or 0,
-            'amount_diff': (this_month_stats['amount'] or 0) - (last_month_stats['amount'] or 0)
+            'new_cases': case_stats['new_today'],
+            'new_cases_diff': case_stats['new_today'] - case_stats['new_yesterday'],
+            'ongoing_cases': case_stats['ongoing_today'],
+            'ongoing_cases_diff': case_stats['ongoing_today'] - case_stats['ongoing_yesterday'],
+            'completed_cases': case_stats['completed_today'],
+            'completed_cases_diff': case_stats['completed_today'] - case_stats['completed_yesterday'],
+        }
+
+    @staticmethod
+    def _get_month_stats(case_stats: Dict) -> Dict:
+        count = case_stats['month_count'] or 0
+        amount = case_stats['month_amount'] or 0
+
+        return {
+            'count': count,
+            'count_diff': count - (case_stats['last_month_count'] or 0),
+            'amount': amount,
+            'amount_diff': amount - (case_stats['last_month_amount'] or 0)
         }
 
     @staticmethod
@@ -101,7 +238,7 @@ class DashboardService:
             Q(is_urgent=True) |
             Q(status='자서예정', scheduled_date=today + timedelta(days=1)) |
             Q(status='기표예정', scheduled_date=today + timedelta(days=1))
-        ).select_related('manager')
+        ).select_related('manager').with_ltv()
 
         return [case.to_dict() for case in cases]
 
@@ -114,7 +251,7 @@ class DashboardService:
         cases = LoanCase.objects.filter(
             manager=user,
             created_at__gte=one_day_ago
-        ).select_related('manager').order_by('-created_at')
+        ).select_related('manager').with_ltv().order_by('-created_at')
 
         return [case.to_dict() for case in cases]
 
@@ -124,7 +261,7 @@ class DashboardService:
             loan_case__manager=user,
             is_question=True,
             is_read=False
-        ).select_related('loan_case')
+        ).select_related('loan_case', 'writer')
 
         return [question.to_dict() for question in questions]
 
@@ -148,38 +285,3 @@ class DashboardService:
             }
             for notice in notices
         ]
-
-    @staticmethod
-    def get_calendar_events(start_str, end_str):
-        # 날짜 파라미터가 있을 경우, 이를 datetime 객체로 변환
-        start_date = datetime.fromisoformat(start_str) if start_str else None
-        end_date = datetime.fromisoformat(end_str) if end_str else None
-
-        events = []
-
-        for event in Event.objects.all():
-            # 필터링된 날짜 범위에 맞는 이벤트만 추가
-            if start_date and event.date < start_date:
-                continue
-            if end_date and event.date > end_date:
-                continue
-
-            if event.authorizing_date:
-                events.append({
-                    'title': f"{event.title} - 자서예정일",
-                    'date': event.authorizing_date,
-                    'description': event.description or '',
-                })
-            if event.journalizing_date:
-                events.append({
-                    'title': f"{event.title} - 기표예정일",
-                    'date': event.journalizing_date,
-                    'description': event.description or '',
-                })
-            if event.scheduled_date:
-                events.append({
-                    'title': f"{event.title} - 고객요청일",
-                    'date': event.scheduled_date,
-                    'description': event.description or '',
-                })
-        return events
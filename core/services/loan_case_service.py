@@ -3,6 +3,7 @@ from django.shortcuts import get_object_or_404
 from django.db import transaction
 from django.core.exceptions import ValidationError, ObjectDoesNotExist, PermissionDenied
 from django.utils import timezone
+from django.db.models import Prefetch, Q
 from datetime import datetime, timedelta
 from core.models import (
     LoanCase,
@@ -11,12 +12,18 @@ from core.models import (
     SecurityProvider,
     PriorLoan
 )
+from todos.models import Todo
 from .base_service import BaseService
+from .change_bus import publish_on_commit
+from .dashboard_service import DashboardCache
 import logging
 
 logger = logging.getLogger(__name__)
 
 class LoanCaseService(BaseService):
+    # 상세 화면 일괄 조회(/bundle/)에서 선택할 수 있는 관련 데이터
+    BUNDLE_SECTIONS = ('security_providers', 'prior_loans', 'comments', 'consulting_logs', 'events', 'todos')
+
     # 기존 메서드들 유지하면서, get_case_with_related 메서드 수정
     @staticmethod
     def get_case_with_related(case_id):
@@ -25,7 +32,8 @@ class LoanCaseService(BaseService):
         if not loan_case:
             return None
             
-        return LoanCase.objects.select_related(
+        # to_dict()의 순위/LTV는 with_ltv() 주석값 사용 (추가 조회 없음)
+        return LoanCase.objects.with_ltv().select_related(
             'manager'
         ).prefetch_related(
             'security_providers',
@@ -34,10 +42,39 @@ class LoanCaseService(BaseService):
             'comments'
         ).get(id=case_id)
 
+    @staticmethod
+    def get_case_bundle(case_id, sections):
+        """상세 화면용 대출 건과 요청한 관련 데이터를 한 번에 조회
+
+        대출 건(+담당자) 1 쿼리 + 섹션마다 1 쿼리. 선순위대출은 순위/LTV 계산에 필요해 항상 조회합니다.
+        """
+        prefetches = {
+            'security_providers': 'security_providers',
+            'comments': Prefetch(
+                'comments',
+                queryset=CaseComment.objects.select_related('writer').order_by('created_at', 'id')
+            ),
+            'consulting_logs': Prefetch(
+                'consulting_logs',
+                queryset=ConsultingLog.objects.select_related('created_by')
+            ),
+            'events': 'events',
+            'todos': Prefetch(
+                'todos',
+                queryset=Todo.objects.filter(is_archived=False).select_related('created_by', 'assigned_to')
+            ),
+        }
+        return LoanCase.objects.select_related('manager').prefetch_related(
+            'prior_loans',
+            *(prefetches[section] for section in sections if section in prefetches)
+        ).filter(id=case_id).first()
+
     @staticmethod
     @transaction.atomic
     def update_case_info(case_id, data):
-        loan_case = get_object_or_404(LoanCase, id=case_id)
+        # 응답의 to_dict()(순위/LTV)와 선설정/담보제공자 목록이 같은 prefetch 결과를 사용
+        loan_case = get_object_or_404(
+            LoanCase.objects.prefetch_related('prior_loans', 'security_providers'), id=case_id)
         
         # 로그 추가: 수신된 데이터
         logger.debug(f"Updating LoanCase {case_id} with data: {data}")
@@ -119,6 +156,20 @@ class LoanCaseService(BaseService):
         except Exception as e:
             raise ValidationError(f'상담일지 추가 중 오류가 발생했습니다: {str(e)}')
 
+    @staticmethod
+    def get_comments(loan_case_id, after=None, after_id=None, user=None):
+        """대출 건 댓글 목록. after가 있으면 (created_at, id) 커서 이후 댓글만 조회
+
+        user를 주면 조회 가능한 대출 건의 댓글만 (권한 조건은 같은 쿼리의 JOIN으로 처리)
+        """
+        comments = CaseComment.objects.all() if user is None else CaseComment.objects.visible_to(user)
+        comments = comments.filter(loan_case_id=loan_case_id).select_related('writer')
+        if after is not None:
+            comments = comments.filter(
+                Q(created_at__gt=after) | Q(created_at=after, id__gt=after_id or 0)
+            )
+        return comments.order_by('created_at', 'id')
+
     @staticmethod
     @transaction.atomic
     def add_comment(loan_case_id, content, user):
@@ -156,6 +207,7 @@ class LoanCaseService(BaseService):
             # 상태값이 유효한지만 체크
             if new_status in dict(LoanCase.STATUS_CHOICES):
                 loan_case.status = new_status
+                loan_case._changed_by = user
                 loan_case.save()
                 return True
                 
@@ -220,7 +272,13 @@ class LoanCaseService(BaseService):
                     is_read=False
                 )
 
-            return unread_comments.update(is_read=True)
+            count = unread_comments.update(is_read=True)
+            if count and user.role not in ['admin', 'branch_manager']:
+                # update()는 post_save가 없으므로 대시보드 캐시 무효화와 미확인 질문 수 변경을 직접 알림
+                DashboardCache.invalidate('questions')
+                manager_id = LoanCase.objects.filter(pk=loan_case_id).values_list('manager_id', flat=True).first()
+                publish_on_commit('questions', manager_id=manager_id)
+            return count
 
         except Exception as e:
             raise ValidationError(f'댓글 읽음 처리 중 오류가 발생했습니다: {str(e)}')
@@ -270,8 +328,9 @@ class LoanCaseService(BaseService):
         
         # 새로운 케이스 생성
         new_case = LoanCase.objects.create(**cleaned_data)
-        
-        return new_case
+
+        # 저장된 값으로 다시 읽어 to_dict()의 순위/LTV를 with_ltv() 주석값으로 계산 (쿼리 1회)
+        return LoanCase.objects.with_ltv().select_related('manager').get(pk=new_case.pk)
 
     # @staticmethod
     # def _validate_status_change(current_status, new_status):
@@ -0,0 +1,137 @@
+# core/services/loan_rate_service.py
+import json
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+from django.conf import settings
+from core.region_tiers import resolve_region
+import logging
+
+logger = logging.getLogger(__name__)
+
+JSON_DIR = settings.BASE_DIR / 'static' / 'json'
+
+CREDIT_BAND_PATTERN = re.compile(r'N(?P<score>\d+)점')
+# "85% (88~90%)", "85% (88%)", "70%" -> 기본 LTV와 최대 LTV
+LTV_PATTERN = re.compile(r'^(?P<base>\d+(?:\.\d+)?)%(?:\s*\((?:\d+(?:\.\d+)?~)?(?P<max>\d+(?:\.\d+)?)%\))?$')
+LTV_BUCKET_PATTERN = re.compile(r'LTV\s*(?P<ltv>\d+(?:\.\d+)?)%')
+
+
+class RateTables:
+    """static/json 표를 조회용 구조로 변환한 결과
+
+    - credit_bands: [(최소 점수, 구간명)] 점수 내림차순
+    - ltv_limits: {(구간명, 지역 키): (기본 LTV, 최대 LTV)}
+    - rate_buckets: {구간명: ([LTV 상한], [금리])} LTV 상한 오름차순
+    """
+    def __init__(self, ltv_data, rate_data):
+        self.credit_bands = sorted(
+            ((int(CREDIT_BAND_PATTERN.search(band)['score']), band) for band in ltv_data),
+            reverse=True
+        )
+
+        self.ltv_limits = {}
+        for band, regions in ltv_data.items():
+            for region_key, text in regions.items():
+                match = LTV_PATTERN.match(text.strip())
+                if not match:
+                    raise ValueError(f'LTV 값 형식이 올바르지 않습니다: {band} {region_key} {text}')
+                base = float(match['base'])
+                self.ltv_limits[(band, region_key)] = (base, float(match['max'] or base))
+
+        self.rate_buckets = {}
+        for band, buckets in rate_data.items():
+            pairs = sorted(
+                (float(LTV_BUCKET_PATTERN.search(bucket)['ltv']), float(rate.rstrip('%')))
+                for bucket, rate in buckets.items()
+            )
+            self.rate_buckets[band] = ([ltv for ltv, _ in pairs], [rate for _, rate in pairs])
+
+
+@lru_cache(maxsize=None)
+def get_rate_tables() -> RateTables:
+    """JSON 표를 한 번만 읽어 변환 (CoreConfig.ready에서 미리 로드)"""
+    def load(name):
+        with open(JSON_DIR / name, encoding='utf-8') as f:
+            return json.load(f)
+
+    tables = RateTables(load('ltv_data.json'), load('interest_rate_data.json'))
+    logger.debug(f"Rate tables loaded: {len(tables.ltv_limits)} LTV limits")
+    return tables
+
+
+class LoanRateService:
+    """신용구간/지역 급지/LTV 구간별 최대 LTV와 예상 금리 조회 (ltv_rate_modal.js와 같은 규칙)"""
+    CAPITAL_REGIONS = ('서울', '경기')
+    METROPOLITAN_CITIES = ('부산', '인천', '대구', '대전', '광주', '울산')
+    # 서울/경기 외 지역 가산금리 (%p)
+    REGIONAL_ADJUSTMENT = 0.5
+
+    @staticmethod
+    def get_credit_band(credit_score) -> Optional[str]:
+        try:
+            score = int(credit_score)
+        except (TypeError, ValueError):
+            return None
+        for min_score, band in get_rate_tables().credit_bands:
+            if score >= min_score:
+                return band
+        return None
+
+    @staticmethod
+    def get_region_key(province: Optional[str], tier: Optional[int]) -> Optional[str]:
+        if not province:
+            return None
+        if '세종' in province:
+            return '세종_공통'
+        if tier is None:
+            return None
+        if province in LoanRateService.CAPITAL_REGIONS:
+            return f'{province}_{tier}급지'
+        if any(city in province for city in LoanRateService.METROPOLITAN_CITIES):
+            return f'인천및광역시_{tier}급지'
+        return None
+
+    @staticmethod
+    def get_rate(credit_band: Optional[str], ltv: Optional[float], province: Optional[str]) -> Optional[float]:
+        """LTV가 속한 구간(상한 이상인 첫 구간)의 금리 + 지역 가산금리"""
+        if credit_band is None or ltv is None:
+            return None
+
+        limits, rates = get_rate_tables().rate_buckets[credit_band]
+        index = bisect_left(limits, ltv)
+        if index == len(limits):
+            return None
+
+        adjustment = 0.0 if province in LoanRateService.CAPITAL_REGIONS else LoanRateService.REGIONAL_ADJUSTMENT
+        return round(rates[index] + adjustment, 2)
+
+    @staticmethod
+    def price(credit_score, address: Optional[str], ltv: Optional[float] = None) -> Dict:
+        """한 건의 최대 LTV/예상 금리 계산
+
+        급지표에 없는 지역(region_key 없음)은 가산금리를 정할 수 없으므로 금리도 None
+        """
+        credit_band = LoanRateService.get_credit_band(credit_score)
+        province, tier = resolve_region(address)
+        region_key = LoanRateService.get_region_key(province, tier)
+        base_ltv, max_ltv = get_rate_tables().ltv_limits.get((credit_band, region_key), (None, None))
+        rate = LoanRateService.get_rate(credit_band, ltv, province) if region_key else None
+
+        return {
+            'credit_band': credit_band,
+            'region_key': region_key,
+            'base_ltv': base_ltv,
+            'max_ltv': max_ltv,
+            'ltv': ltv,
+            'rate': rate,
+        }
+
+    @staticmethod
+    def price_cases(cases: Iterable) -> Dict[int, Dict]:
+        """여러 대출 건을 한 번에 계산. with_ltv()로 조회하면 추가 쿼리 없음"""
+        return {
+            case.id: LoanRateService.price(case.borrower_credit_score, case.address_main, case.loan_ltv)
+            for case in cases
+        }
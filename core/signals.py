@@ -0,0 +1,40 @@
+# core/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from core.models import LoanCase, CaseComment, Notice
+from core.services.change_bus import publish_on_commit
+from core.services.dashboard_service import DashboardCache
+
+
+# 대시보드 캐시 무효화는 변경 알림보다 먼저 등록해, 알림을 받은 재조회가 새 데이터를 보도록 함
+@receiver(post_save, sender=CaseComment)
+def notify_comment_saved(sender, instance, created, **kwargs):
+    if instance.is_question:
+        DashboardCache.invalidate('questions')
+    if not created or not instance.loan_case_id:
+        return
+    publish_on_commit('comment', case_id=instance.loan_case_id, comment=instance.to_dict())
+    if instance.is_question:
+        publish_on_commit('questions', manager_id=instance.loan_case.manager_id)
+
+
+@receiver(post_delete, sender=CaseComment)
+def notify_comment_deleted(sender, instance, **kwargs):
+    if instance.is_question:
+        DashboardCache.invalidate('questions')
+    if instance.is_question and not instance.is_read and instance.loan_case_id:
+        manager_id = LoanCase.objects.filter(pk=instance.loan_case_id).values_list('manager_id', flat=True).first()
+        publish_on_commit('questions', manager_id=manager_id)
+
+
+@receiver(post_save, sender=LoanCase)
+@receiver(post_delete, sender=LoanCase)
+def notify_case_changed(sender, instance, **kwargs):
+    DashboardCache.invalidate('cases')
+    publish_on_commit('dashboard')
+
+
+@receiver(post_save, sender=Notice)
+@receiver(post_delete, sender=Notice)
+def notice_changed(sender, instance, **kwargs):
+    DashboardCache.invalidate('notices')
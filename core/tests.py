@@ -1,3 +1,774 @@
+import io
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import Branch, Team, User
+from core.models import (
+    LoanCase, CaseComment, Notice, DailyCaseStats, PriorLoan, ConsultingLog, SecurityProvider, Event
+)
+from core.pagination import CreatedAtCursorPagination
+from core.services.change_bus import LocalChangeBus, get_change_bus
+from core.services.dashboard_service import DashboardService
+from core.services.daily_stats_service import DailyCaseStatsService
+from core.services.loan_case_service import LoanCaseService
+from core.services.loan_rate_service import LoanRateService
+from core.views.stream_views import WSGI_POLL_MILLISECONDS
+from core.region_tiers import resolve_region
+from todos.models import Todo
+
+
+class DashboardViewTests(TestCase):
+    # 통계 1 + 스냅샷 1 + 긴급 1 + 최근 1 + 미확인 질문 1 + 공지 1
+    MAX_DASHBOARD_QUERIES = 6
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='staff', password='pw', role='staff')
+        today = timezone.now()
+
+        LoanCase.objects.create(borrower_name='신규', manager=cls.user)
+        LoanCase.objects.create(borrower_name='진행', manager=cls.user, status='심사중')
+        done = LoanCase.objects.create(
+            borrower_name='완료', manager=cls.user, status='완료', loan_amount=3000)
+        old = LoanCase.objects.create(borrower_name='어제', manager=cls.user, status='승인')
+        LoanCase.objects.filter(pk=old.pk).update(created_at=today - timedelta(days=1))
+        LoanCase.objects.create(borrower_name='긴급', manager=cls.user, is_urgent=True)
+
+        CaseComment.objects.create(loan_case=done, writer=cls.user, content='질문', is_question=True)
+        Notice.objects.create(title='공지', content='내용', created_by=cls.user)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_stats_shape_and_values(self):
+        data = DashboardService.get_dashboard_data(self.user)
+
+        self.assertEqual(data['today_stats'], {
+            'new_cases': 4,
+            'new_cases_diff': 3,
+            'ongoing_cases': 4,
+            'ongoing_cases_diff': 3,
+            'completed_cases': 1,
+            'completed_cases_diff': 1,
+        })
+        self.assertEqual(data['month_stats']['count'], 1)
+        self.assertEqual(data['month_stats']['amount'], 3000)
+
+    def test_dashboard_view_query_count(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(len(ctx.captured_queries), self.MAX_DASHBOARD_QUERIES)
+
+    def test_warm_cache_serves_without_queries(self):
+        first = self.client.get('/api/').json()
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/')
+        self.assertEqual(response.json(), first)
+
+    def test_changes_invalidate_cached_sections(self):
+        DashboardService.get_dashboard_data(self.user)
+        case = LoanCase.objects.get(borrower_name='신규')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            LoanCase.objects.create(borrower_name='추가', manager=self.user)
+            question = CaseComment.objects.create(loan_case=case, writer=self.user, content='질문2', is_question=True)
+            Notice.objects.filter(title='공지').get().delete()
+        data = DashboardService.get_dashboard_data(self.user)
+        self.assertEqual(data['today_stats']['new_cases'], 5)
+        self.assertIn(question.id, [q['id'] for q in data['unread_questions']])
+        self.assertEqual(data['notices'], [])
+
+        # update()로 읽음 처리해도 미확인 질문 캐시가 갱신됨
+        with self.captureOnCommitCallbacks(execute=True):
+            LoanCaseService.mark_comments_as_read(case.id, self.user)
+        data = DashboardService.get_dashboard_data(self.user)
+        self.assertNotIn(question.id, [q['id'] for q in data['unread_questions']])
+
+
+class DailyCaseStatsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_backfill_uses_status_history_for_yesterday(self):
+        now = timezone.now()
+        today = now.date()
+        case = LoanCase.objects.create(borrower_name='차주', status='심사중')
+        LoanCase.objects.filter(pk=case.pk).update(created_at=now - timedelta(days=2))
+        case = LoanCase.objects.get(pk=case.pk)
+        case.status = '완료'
+        case.save()
+
+        DailyCaseStatsService.backfill(today - timedelta(days=2), today - timedelta(days=1))
+        today_stats = DashboardService.get_dashboard_data(None)['today_stats']
+
+        self.assertEqual(today_stats['ongoing_cases'], 0)
+        self.assertEqual(today_stats['ongoing_cases_diff'], -1)
+
+    def test_snapshot_baselines_replace_live_history_aggregates(self):
+        today = timezone.now().date()
+        last_month_end = today.replace(day=1) - timedelta(days=1)
+        case = LoanCase.objects.create(borrower_name='A', status='심사중')
+        LoanCase.objects.filter(pk=case.pk).update(created_at=timezone.now() - timedelta(days=70))
+        DailyCaseStatsService.snapshot(today - timedelta(days=1))
+        DailyCaseStatsService.snapshot(last_month_end)
+
+        with CaptureQueriesContext(connection) as ctx:
+            stats = DashboardService._get_stats(today)
+
+        # 스냅샷 1 + 오늘 기준 집계 1 (전일/전월 집계 없음)
+        live_sql = [q['sql'] for q in ctx.captured_queries if 'core_loancase' in q['sql']]
+        self.assertEqual(len(ctx.captured_queries), 2)
+        self.assertEqual(live_sql[0].count('COUNT('), 4)
+        self.assertEqual(stats['today_stats']['ongoing_cases_diff'], 0)
+
+    def test_snapshot_counts_current_status(self):
+        today = timezone.now().date()
+        LoanCase.objects.create(borrower_name='A', status='심사중', loan_amount=1000)
+        LoanCase.objects.create(borrower_name='B', status='심사중', loan_amount=500)
+
+        DailyCaseStatsService.snapshot(today)
+        row = DailyCaseStats.objects.get(date=today, status='심사중')
+
+        self.assertEqual((row.case_count, row.loan_amount, row.new_count), (2, 1500, 2))
+
+    def test_backfill_matches_snapshot_over_status_intervals(self):
+        now = timezone.now()
+        today = now.date()
+        case = LoanCase.objects.create(borrower_name='A', status='심사중', loan_amount=1000)
+        LoanCase.objects.filter(pk=case.pk).update(created_at=now - timedelta(days=40))
+        case = LoanCase.objects.get(pk=case.pk)
+        case.status = '완료'
+        case.save()
+        LoanCase.objects.create(borrower_name='B', status='완료', loan_amount=500)
+
+        DailyCaseStatsService.snapshot(today)
+        fields = ('status', 'manager_id', 'case_count', 'loan_amount', 'new_count',
+                  'recent_count', 'month_count', 'month_loan_amount')
+        snapshot = sorted(DailyCaseStats.objects.filter(date=today).values_list(*fields))
+
+        DailyCaseStatsService.backfill(today - timedelta(days=45), today)
+        self.assertEqual(sorted(DailyCaseStats.objects.filter(date=today).values_list(*fields)), snapshot)
+        # 생성일 이후 매일 한 행, 상태 변경 전까지는 '심사중'
+        self.assertEqual(DailyCaseStats.objects.filter(status='심사중').count(), 40)
+
+    def test_rows_without_manager_are_unique_per_day(self):
+        today = timezone.now().date()
+        DailyCaseStats.objects.create(date=today, status='심사중')
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            DailyCaseStats.objects.create(date=today, status='심사중')
+        DailyCaseStats.objects.create(date=today)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            DailyCaseStats.objects.create(date=today)
+
+
+class CsvExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='staff', password='pw', role='staff')
+        for i in range(20):
+            case = LoanCase.objects.create(borrower_name=f'차주{i}', loan_amount=1000, price_amount=10000)
+            PriorLoan.objects.create(loan_case=case, loan_type='선설정', financial_company='은행', amount=2000)
+            ConsultingLog.objects.create(loan_case=case, content='상담')
+
+    def test_export_streams_with_constant_queries(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.post('/api/cases/export-csv/')
+            content = b''.join(response.streaming_content).decode('utf-8')
+
+        rows = content.strip().splitlines()
+        self.assertEqual(len(rows), 21)
+        self.assertIn('후순위', rows[1])
+        self.assertIn('30.0', rows[1])
+        self.assertIn('은행 2000만원', rows[1])
+        # 대출 건 1 + prior_loans 1 + consulting_logs 1
+        self.assertLessEqual(len(ctx.captured_queries), 3)
+
+
+class CsvImportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='staff', password='pw', role='staff')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_import_round_trips_export_layout(self):
+        case = LoanCase.objects.create(
+            borrower_name='차주', status='심사중', loan_amount=1000, price_amount=10000, interest_rate='4.50')
+        PriorLoan.objects.create(loan_case=case, loan_type='선설정', financial_company='은행', amount=2000)
+        exported = b''.join(self.client.post('/api/cases/export-csv/').streaming_content)
+        invalid_row = ',심사중,-,,,,,False,-,-,-,,abc,,,,,,,-,-,\r\n'.encode('utf-8')
+
+        upload = SimpleUploadedFile('cases.csv', exported + invalid_row, content_type='text/csv')
+        response = self.client.post('/api/cases/import-csv/', {'csv_file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['imported_count'], 1)
+        self.assertEqual(response.data['error_count'], 1)
+        self.assertEqual(response.data['errors'][0]['row'], 3)
+        imported = LoanCase.objects.exclude(pk=case.pk).get()
+        self.assertEqual((imported.status, imported.loan_amount, imported.manager), ('심사중', 1000, self.user))
+        self.assertEqual(imported.prior_loans.get().amount, 2000)
+
+    def test_rows_exceeding_field_limits_are_reported(self):
+        header = '차주,래퍼,연락처,금리\r\n'
+        rows = [
+            '정상,레퍼,010-1234-5678,4.5',
+            '긴래퍼,' + 'ㄱ' * 51 + ',,',
+            '긴번호,,010-1234-5678-9,',
+            '금리초과,,,100',
+            '금리NaN,,,NaN',
+        ]
+        upload = SimpleUploadedFile(
+            'cases.csv', (header + '\r\n'.join(rows) + '\r\n').encode('utf-8'), content_type='text/csv')
+        response = self.client.post('/api/cases/import-csv/', {'csv_file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['imported_count'], response.data['error_count']), (1, 4))
+        self.assertEqual([error['row'] for error in response.data['errors']], [3, 4, 5, 6])
+        self.assertTrue(response.data['errors'][0]['errors'][0].startswith('referrer'))
+        self.assertEqual(LoanCase.objects.get().borrower_name, '정상')
+
+
+class CaseStatusChangeTests(TestCase):
+    def test_status_change_recorded_without_reselect(self):
+        user = User.objects.create_user(username='staff', password='pw', role='staff')
+        case = LoanCase.objects.get(pk=LoanCase.objects.create(borrower_name='차주').pk)
+        case.status = '심사중'
+        case._changed_by = user
+
+        # UPDATE 1 + 이력 INSERT 1 (기존 행 재조회 없음)
+        with self.assertNumQueries(2):
+            case.save()
+        with self.assertNumQueries(1):
+            case.save(update_fields=['borrower_name'])
+
+        change = case.status_history.get()
+        self.assertEqual((change.from_status, change.to_status, change.changed_by), ('단순조회중', '심사중', user))
+
+
+class LoanCaseLtvTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.with_prior = LoanCase.objects.create(borrower_name='후순위', loan_amount=1000, price_amount=3000)
+        PriorLoan.objects.create(loan_case=cls.with_prior, loan_type='선설정', financial_company='은행', amount=1000)
+        PriorLoan.objects.create(loan_case=cls.with_prior, loan_type='선설정', financial_company='캐피탈', amount=500)
+        cls.without_prior = LoanCase.objects.create(borrower_name='선순위', loan_amount=700, price_amount=10000)
+        cls.no_price = LoanCase.objects.create(borrower_name='시세없음', loan_amount=700)
+
+    def test_annotations_match_properties(self):
+        expected = {
+            case.pk: (case.loan_rank, case.loan_ltv)
+            for case in LoanCase.objects.all()
+        }
+
+        with self.assertNumQueries(1):
+            annotated = {
+                case.pk: (case.loan_rank, case.loan_ltv)
+                for case in LoanCase.objects.with_ltv()
+            }
+
+        self.assertEqual(annotated, expected)
+        self.assertEqual(annotated[self.with_prior.pk], ('후순위', 83.33))
+        self.assertEqual(annotated[self.without_prior.pk], ('선순위', 7.0))
+        self.assertEqual(annotated[self.no_price.pk], ('선순위', None))
+
+
+class LoanRateServiceTests(TestCase):
+    def test_price_uses_region_tier_and_ltv_bucket(self):
+        seoul = LoanRateService.price(900, '서울특별시 강남구 테헤란로 1', 72.5)
+        busan = LoanRateService.price(720, '부산광역시 해운대구 우동 1', 70)
+
+        self.assertEqual(seoul['region_key'], '서울_1급지')
+        self.assertEqual((seoul['base_ltv'], seoul['max_ltv'], seoul['rate']), (85.0, 90.0, 8.25))
+        # 광역시는 지역 가산금리 0.5%p
+        self.assertEqual((busan['region_key'], busan['max_ltv'], busan['rate']), ('인천및광역시_1급지', 80.0, 9.25))
+        self.assertIsNone(LoanRateService.price(600, '서울특별시 강남구', 70)['credit_band'])
+        self.assertIsNone(LoanRateService.price(900, '서울특별시 강남구', 95)['rate'])
+
+    def test_price_without_region_key_has_no_rate(self):
+        unknown = LoanRateService.price(900, '강원도 춘천시 효자동', 70)
+        self.assertEqual((unknown['region_key'], unknown['max_ltv'], unknown['rate']), (None, None, None))
+        self.assertEqual(
+            LoanRateService.price(900, '서울시 강남구 테헤란로 1', 72.5),
+            LoanRateService.price(900, '서울특별시 강남구 테헤란로 1', 72.5)
+        )
+
+    def test_pricing_view_batches_cases(self):
+        user = User.objects.create_user(username='admin', password='pw', role='admin', is_staff=True)
+        cases = [
+            LoanCase.objects.create(
+                borrower_name=f'차주{i}', manager=user, borrower_credit_score=800,
+                address_main='경기도 성남시 분당구 정자동', loan_amount=7000, price_amount=10000)
+            for i in range(3)
+        ]
+        client = APIClient()
+        client.force_authenticate(user)
+
+        with self.assertNumQueries(1):
+            response = client.post('/api/cases/pricing/', {'case_ids': [c.id for c in cases]}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][cases[0].id]['region_key'], '경기_2급지')
+        self.assertEqual(response.data['results'][cases[0].id]['rate'], 8.05)
+
+
+class RegionTierTests(TestCase):
+    def test_resolve_longest_district_match(self):
+        self.assertEqual(resolve_region('경기도 성남시 분당구 정자동 1'), ('경기', 2))
+        self.assertEqual(resolve_region('경기 안양시 동안구'), ('경기', 1))
+        self.assertEqual(resolve_region('서울특별시 강남구 테헤란로'), ('서울', 1))
+        self.assertEqual(resolve_region('강원도 춘천시'), ('강원', None))
+        self.assertEqual(resolve_region(None), (None, None))
+
+    def test_resolve_short_and_unspaced_province(self):
+        self.assertEqual(resolve_region('서울시 강남구 역삼동'), ('서울', 1))
+        self.assertEqual(resolve_region('서울강남구역삼동'), ('서울', 1))
+        self.assertEqual(resolve_region('경기도성남시 분당구'), ('경기', 2))
+        self.assertEqual(resolve_region('부산시 해운대구'), resolve_region('부산광역시 해운대구'))
+
+    def test_region_tier_follows_address(self):
+        case = LoanCase.objects.create(borrower_name='차주', address_main='서울특별시 노원구 상계동')
+        self.assertEqual(case.region_tier, 3)
+
+        case.address_main = '서울특별시 강남구 역삼동'
+        case.save(update_fields=['address_main'])
+
+        self.assertEqual(LoanCase.objects.filter(region_tier=1).get(), case)
+
+
+class CaseListCursorPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='admin', password='pw', role='admin', is_staff=True)
+        now = timezone.now()
+        for i in range(25):
+            case = LoanCase.objects.create(borrower_name=f'차주{i}', manager=cls.user)
+            LoanCase.objects.filter(pk=case.pk).update(created_at=now - timedelta(minutes=i // 2))
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_default_response_is_unchanged(self):
+        response = self.client.get('/api/cases/')
+        self.assertEqual(len(response.data), 25)
+
+    def test_cursor_pages_cover_every_case_once(self):
+        seen = []
+        url = '/api/cases/?pagination=cursor&page_size=10'
+        while url:
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url)
+            self.assertFalse(any('COUNT(' in q['sql'] for q in ctx.captured_queries))
+            seen.extend(row['id'] for row in response.data['results'])
+            url = response.data['next']
+
+        self.assertEqual(sorted(seen), sorted(LoanCase.objects.values_list('id', flat=True)))
+        self.assertEqual(len(seen), len(set(seen)))
+
+    def test_cases_without_created_at_are_skipped(self):
+        case = LoanCase.objects.create(borrower_name='생성일 없음', manager=self.user)
+        LoanCase.objects.filter(pk=case.pk).update(created_at=None)
+
+        response = self.client.get('/api/cases/?pagination=cursor&page_size=30&count=exact')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 25)
+        self.assertNotIn(case.id, [row['id'] for row in response.data['results']])
+
+    def test_approximate_count_is_capped(self):
+        with mock.patch.object(CreatedAtCursorPagination, 'approx_count_limit', 20):
+            response = self.client.get('/api/cases/?pagination=cursor&count=approx')
+
+        self.assertEqual((response.data['count'], response.data['count_is_approximate']), (20, True))
+        exact = self.client.get('/api/cases/?pagination=cursor&count=exact')
+        self.assertEqual((exact.data['count'], exact.data['count_is_approximate']), (25, False))
+
+
+class CaseStatusSummaryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='staff', password='pw', role='staff')
+        other = User.objects.create_user(username='other', password='pw', role='staff')
+        for status_, count in (('단순조회중', 3), ('신용조회중', 2), ('승인', 1), ('완료', 2)):
+            for i in range(count):
+                LoanCase.objects.create(borrower_name=f'{status_}{i}', manager=cls.user, status=status_)
+        old = LoanCase.objects.create(borrower_name='오래된 완료', manager=cls.user, status='완료')
+        LoanCase.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=40))
+        LoanCase.objects.create(borrower_name='다른 담당자', manager=other, status='단순조회중')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_summary_counts_in_one_query(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/cases/status-summary/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        groups = response.data['groups']
+        self.assertEqual(groups['reception']['count'], 5)
+        self.assertEqual(groups['reception']['statuses'], {'단순조회중': 3, '신용조회중': 2})
+        self.assertEqual(groups['signing']['count'], 1)
+        # 완료 그룹은 최근 30일 이내만
+        self.assertEqual(groups['completed']['count'], 2)
+        self.assertEqual(response.data['statuses']['완료'], 3)
+
+    def test_group_cases_are_paged(self):
+        response = self.client.get(
+            '/api/cases/status-summary/reception/', {'status': '단순조회중', 'page_size': 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNotNone(response.data['next'])
+        rest = self.client.get(response.data['next'])
+        self.assertEqual(len(rest.data['results']), 1)
+
+        invalid = self.client.get('/api/cases/status-summary/reception/', {'status': '완료'})
+        self.assertEqual(invalid.status_code, 400)
+
+
+class CommentPollingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='staff', password='pw', role='staff')
+        cls.case = LoanCase.objects.create(borrower_name='차주', manager=cls.user)
+        for i in range(3):
+            CaseComment.objects.create(loan_case=cls.case, writer=cls.user, content=f'댓글{i}')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = f'/api/cases/{self.case.id}/comments/'
+
+    def test_delta_returns_only_comments_after_cursor(self):
+        cursor = self.client.get(self.url).data['cursor']
+
+        # 새 댓글이 없으면 권한 조건을 포함한 댓글 쿼리 1회 후 204
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, cursor)
+        self.assertEqual(response.status_code, 204)
+
+        new_comment = CaseComment.objects.create(loan_case=self.case, writer=self.user, content='새 댓글')
+        # 새 댓글이 있으면 권한 조건을 포함한 댓글 쿼리 1회
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, cursor)
+
+        self.assertEqual([c['id'] for c in response.data['comments']], [new_comment.id])
+        self.assertEqual(response.data['cursor']['after_id'], new_comment.id)
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(self.url, {'after': 'yesterday'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_missing_or_hidden_case_is_rejected(self):
+        self.assertEqual(self.client.get('/api/cases/0/comments/').status_code, 404)
+
+        other = User.objects.create_user(username='other', password='pw', role='staff')
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+        # 폴링은 권한 확인 없이 빈 결과(204)만 받으므로 댓글이 노출되지 않음
+        self.assertEqual(self.client.get(self.url, {'after': '2000-01-01T00:00:00'}).status_code, 204)
+
+
+class ChangeBusTests(TestCase):
+    def test_events_since_and_reset(self):
+        bus = LocalChangeBus(buffer_size=2)
+        bus.publish('dashboard')
+        start = bus.last_id
+        bus.publish('questions', manager_id=1)
+
+        events, reset = bus.events_since(start)
+        self.assertFalse(reset)
+        self.assertEqual([event['topic'] for _, event in events], ['questions'])
+
+        # 버퍼에서 밀려난 ID는 재동기화, 버퍼 안의 ID는 이어서 조회
+        bus.publish('dashboard')
+        bus.publish('dashboard')
+        self.assertEqual(bus.events_since(start), ([], True))
+        events, reset = bus.events_since(bus.last_id - 2)
+        self.assertFalse(reset)
+        self.assertEqual(len(events), 2)
+
+        # 다른 프로세스의 ID는 재동기화
+        self.assertTrue(bus.events_since(bus.last_id + 10)[1])
+
+
+class ChangeStreamTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='staff', password='pw', role='staff')
+        cls.other = User.objects.create_user(username='other', password='pw', role='staff')
+        cls.case = LoanCase.objects.create(borrower_name='차주', manager=cls.user)
+
+    def setUp(self):
+        cache.clear()
+
+    def get_stream(self, user, params):
+        token = RefreshToken.for_user(user).access_token
+        return self.client.get('/api/stream/', {'mode': 'poll', **params}, HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_poll_returns_new_comment_and_questions(self):
+        last_event_id = get_change_bus().last_id
+        with self.captureOnCommitCallbacks(execute=True):
+            comment = CaseComment.objects.create(
+                loan_case=self.case, writer=self.other, content='질문', is_question=True)
+
+        response = self.get_stream(self.user, {
+            'topics': 'comments,questions', 'case_id': self.case.id, 'last_event_id': last_event_id})
+
+        self.assertEqual(response.status_code, 200)
+        events = {event['event']: event['data'] for event in response.json()['events']}
+        self.assertEqual(events['comment']['id'], comment.id)
+        self.assertEqual([q['id'] for q in events['unread_questions']['unread_questions']], [comment.id])
+
+    def test_wsgi_poll_returns_immediately_with_retry(self):
+        with mock.patch.object(LocalChangeBus, 'wait_async', side_effect=AssertionError('WSGI에서 대기함')):
+            response = self.get_stream(self.user, {'topics': 'dashboard'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['events'], [])
+        self.assertEqual(response.json()['retry'], WSGI_POLL_MILLISECONDS)
+
+    def test_requires_token_and_case_permission(self):
+        self.assertEqual(self.client.get('/api/stream/').status_code, 401)
+        response = self.get_stream(self.other, {'topics': 'comments', 'case_id': self.case.id})
+        self.assertEqual(response.status_code, 403)
+
+
+class CaseBundleTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='admin', password='pw', role='admin', is_staff=True)
+        cls.case = LoanCase.objects.create(
+            borrower_name='차주', manager=cls.user, loan_amount=10000, price_amount=50000)
+        first = SecurityProvider.objects.create(loan_case=cls.case, name='제공자1')
+        SecurityProvider.objects.create(loan_case=cls.case, name='제공자2', related_person=first)
+        PriorLoan.objects.create(loan_case=cls.case, loan_type='대환', financial_company='은행', amount=5000)
+        for i in range(2):
+            CaseComment.objects.create(loan_case=cls.case, writer=cls.user, content=f'댓글{i}')
+            ConsultingLog.objects.create(loan_case=cls.case, content=f'상담{i}', created_by=cls.user)
+            Event.objects.create(loan_case=cls.case, title=f'일정{i}', date=timezone.now().date())
+            Todo.objects.create(loan_case=cls.case, title=f'할일{i}', created_by=cls.user, assigned_to=cls.user)
+        Todo.objects.create(loan_case=cls.case, title='보관', created_by=cls.user, is_archived=True)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = f'/api/cases/{self.case.id}/bundle/'
+
+    def test_bundle_loads_all_sections_with_fixed_queries(self):
+        # 대출 건 1 + 선순위대출 1 + 담보제공자/댓글/상담일지/일정/할일 각 1
+        with self.assertNumQueries(7):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['loan_case']['loan_ltv'], 30.0)
+        self.assertEqual(len(response.data['security_providers']), 2)
+        self.assertEqual(len(response.data['prior_loans']), 1)
+        self.assertEqual(response.data['comment_cursor']['after_id'], response.data['comments'][-1]['id'])
+        self.assertEqual(len(response.data['consulting_logs']), 2)
+        self.assertEqual(len(response.data['events']), 2)
+        # 보관된 할 일은 제외
+        self.assertEqual(sorted(todo['title'] for todo in response.data['todos']), ['할일0', '할일1'])
+
+    def test_include_limits_sections(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, {'include': 'comments'})
+        self.assertEqual(response.data['sections'], ['comments'])
+        self.assertNotIn('todos', response.data)
+
+        self.assertEqual(self.client.get(self.url, {'include': 'unknown'}).status_code, 400)
+
+    def test_detail_and_create_compute_rank_and_ltv_without_extra_queries(self):
+        def prior_loan_queries(ctx):
+            return [q for q in ctx.captured_queries if q['sql'].startswith('SELECT "core_priorloan"')]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f'/api/cases/{self.case.id}/')
+        self.assertEqual((response.data['loan_case']['loan_rank'], response.data['loan_case']['loan_ltv']), ('후순위', 30.0))
+        # 선설정 목록 prefetch 1회만 (순위/LTV는 with_ltv 주석값)
+        self.assertEqual(len(prior_loan_queries(ctx)), 1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post('/api/cases/create/', {
+                'borrower_name': '신규', 'loan_amount': 1000, 'price_amount': 10000}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.data['loan_case']['loan_rank'], response.data['loan_case']['loan_ltv']), ('선순위', 10.0))
+        self.assertEqual(prior_loan_queries(ctx), [])
+
+
+class BatchViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='staff', password='pw', role='staff')
+        cls.case = LoanCase.objects.create(borrower_name='차주', manager=cls.user)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_dispatches_sub_requests_as_current_user(self):
+        response = self.client.post('/api/batch/', {'requests': [
+            {'method': 'GET', 'path': f'/api/cases/{self.case.id}/comments/'},
+            {'method': 'POST', 'path': f'/api/cases/{self.case.id}/comments/', 'body': {'content': '일괄 댓글'}},
+            {'method': 'GET', 'path': f'/api/todos/?loan_case={self.case.id}'},
+            {'method': 'GET', 'path': '/api/unknown/'},
+        ]}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        results = response.data['responses']
+        self.assertEqual([r['status'] for r in results], [200, 201, 200, 404])
+        self.assertEqual(results[1]['body']['comment']['content'], '일괄 댓글')
+        self.assertTrue(all('duration_ms' in r for r in results))
+
+    def test_atomic_batch_rolls_back_on_failure(self):
+        response = self.client.post('/api/batch/', {'atomic': True, 'requests': [
+            {'method': 'POST', 'path': f'/api/cases/{self.case.id}/comments/', 'body': {'content': '롤백'}},
+            {'method': 'POST', 'path': f'/api/cases/{self.case.id}/comments/', 'body': {}},
+            {'method': 'GET', 'path': f'/api/cases/{self.case.id}/comments/'},
+        ]}, format='json')
+
+        self.assertEqual([r['status'] for r in response.data['responses']], [201, 400, 424])
+        self.assertTrue(response.data['rolled_back'])
+        self.assertFalse(CaseComment.objects.filter(content='롤백').exists())
+
+    def test_atomic_flag_is_parsed_as_boolean(self):
+        requests = [{'method': 'POST', 'path': f'/api/cases/{self.case.id}/comments/', 'body': {'content': '유지'}},
+                    {'method': 'POST', 'path': f'/api/cases/{self.case.id}/comments/', 'body': {}}]
+
+        response = self.client.post('/api/batch/', {'atomic': 'false', 'requests': requests}, format='json')
+        self.assertFalse(response.data['atomic'])
+        self.assertTrue(CaseComment.objects.filter(content='유지').exists())
+
+        response = self.client.post('/api/batch/', {'atomic': 'maybe', 'requests': requests}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+
+class CaseVisibilityTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        branch = Branch.objects.create(name='본점')
+        team1 = Team.objects.create(branch=branch, name='1팀')
+        team2 = Team.objects.create(branch=branch, name='2팀')
+        cls.branch_manager = User.objects.create_user(
+            username='bm', password='pw', role='branch_manager', branch=branch)
+        cls.leader = User.objects.create_user(username='leader', password='pw', role='team_leader', team=team1)
+        cls.member = User.objects.create_user(username='member', password='pw', role='staff', team=team1)
+        cls.outsider = User.objects.create_user(username='outsider', password='pw', role='staff', team=team2)
+        cls.member_case = LoanCase.objects.create(borrower_name='1팀 차주', manager=cls.member)
+        cls.outsider_case = LoanCase.objects.create(borrower_name='2팀 차주', manager=cls.outsider)
+        for case in (cls.member_case, cls.outsider_case):
+            Event.objects.create(loan_case=case, title='일정', date=timezone.now().date())
+
+    def test_visible_to_scopes_by_role_and_org_path(self):
+        self.assertEqual(self.member.org_path, f'/{self.member.branch_id}/{self.member.team_id}/')
+        self.assertEqual(list(LoanCase.objects.visible_to(self.leader).order_by('id')),
+                         [self.member_case])
+        self.assertEqual(LoanCase.objects.visible_to(self.branch_manager).count(), 2)
+        self.assertEqual(list(LoanCase.objects.visible_to(self.outsider)), [self.outsider_case])
+        self.assertEqual(list(Event.objects.visible_to(self.leader).values_list('loan_case', flat=True)),
+                         [self.member_case.id])
+
+        with self.assertNumQueries(0):
+            self.assertTrue(self.member_case.is_visible_to(self.member))
+            self.assertFalse(self.outsider_case.is_visible_to(self.member))
+
+    def test_list_and_object_views_apply_scope(self):
+        client = APIClient()
+        client.force_authenticate(self.leader)
+
+        response = client.get('/api/cases/')
+        self.assertEqual([case['id'] for case in response.data], [self.member_case.id])
+        self.assertEqual(client.get(f'/api/cases/{self.outsider_case.id}/comments/').status_code, 403)
+        self.assertEqual(len(client.get('/api/events/').data), 1)
+
+
+class CalendarTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='staff', password='pw', role='staff')
+        other = User.objects.create_user(username='other', password='pw', role='staff')
+        case = LoanCase.objects.create(borrower_name='차주', manager=cls.user)
+        other_case = LoanCase.objects.create(borrower_name='남의 차주', manager=other)
+        cls.day = timezone.now().date().replace(day=10)
+        Event.objects.create(loan_case=case, title='홍길동, 자서', description='서류; 지참', event_type='authorizing', date=cls.day)
+        Event.objects.create(loan_case=case, title='지난해', date=cls.day - timedelta(days=400))
+        Event.objects.create(loan_case=other_case, title='남의 일정', date=cls.day)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.params = {'start': self.day.replace(day=1).isoformat(), 'end': (self.day + timedelta(days=25)).isoformat()}
+
+    def test_month_view_is_one_query_with_etag(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/calendar/events/', self.params)
+        self.assertEqual([(e['title'], e['start'], e['extendedProps']['type']) for e in response.data],
+                         [('홍길동, 자서 (자서)', self.day.isoformat(), 'authorizing')])
+
+        response = self.client.get('/api/calendar/events/', self.params, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+        plan = str(Event.objects.filter(date__gte=self.day, date__lt=self.day + timedelta(days=1)).explain())
+        self.assertIn('event_date_type_idx', plan)
+
+    def test_ics_export(self):
+        response = self.client.get('/api/calendar/events.ics', self.params)
+        self.assertEqual(response.status_code, 200)
+        body = response.content.decode('utf-8')
+        self.assertEqual(body.count('BEGIN:VEVENT'), 1)
+        self.assertIn(f"DTSTART;VALUE=DATE:{self.day.strftime('%Y%m%d')}\r\n", body)
+        self.assertIn('SUMMARY:홍길동\\, 자서 (자서)\r\n', body)
+        self.assertIn('DESCRIPTION:서류\\; 지참\r\n', body)
+
+        response = self.client.get('/api/calendar/events.ics', {'start': '2024-01-01', 'end': '2026-01-01'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_case_dates_are_projected_and_merged_with_events(self):
+        case = LoanCase.objects.create(
+            borrower_name='김철수', manager=self.user,
+            authorizing_date=self.day, journalizing_date=self.day + timedelta(days=1))
+        Event.objects.create(loan_case=case, title='자서 (등기소)', description='법무사 동행', event_type='authorizing', date=self.day)
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/calendar/events/', self.params)
+        self.assertEqual([e['title'] for e in response.data], ['홍길동, 자서 (자서)', '자서 (등기소) (자서)', '김철수 (기표)'])
+        self.assertEqual(response.data[2]['extendedProps']['event_id'], None)
+
+        response = self.client.get('/api/calendar/events/', {**self.params, 'type': 'journalizing'})
+        self.assertEqual([e['id'] for e in response.data], [f'case-{case.id}-journalizing'])
+
+    def test_dedupe_removes_copied_events_in_batches(self):
+        case = LoanCase.objects.create(borrower_name='김철수', manager=self.user, scheduled_date=self.day)
+        for _ in range(2):
+            Event.objects.create(loan_case=case, title='김철수님의 접수 일정', event_type='scheduled', date=self.day)
+        Event.objects.create(
+            loan_case=case, title='김철수님의 접수 일정', description='김철수고객 대출 접수 일정입니다.',
+            event_type='scheduled', date=self.day)
+        kept = [
+            Event.objects.create(loan_case=case, title='김철수님의 접수 일정', description='메모',
+                                 event_type='scheduled', date=self.day),
+            # 사용자가 직접 입력한 제목은 메모가 없어도 유지
+            Event.objects.create(loan_case=case, title='접수 (등기소)', event_type='scheduled', date=self.day),
+        ]
 
-# Create your tests here.
+        call_command('dedupe_case_events', batch_size=2, stdout=io.StringIO())
+        self.assertEqual(list(Event.objects.filter(loan_case=case).order_by('id')), kept)
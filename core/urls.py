@@ -14,12 +14,18 @@ urlpatterns = [
     path('events/<int:pk>/', EventDetailAPIView.as_view(), name='event-detail'),
     path('events/', EventListView.as_view(), name='event-list'),
     path('cases/<int:case_id>/events/', CaseEventListView.as_view(), name='case-events'),
+    path('calendar/events/', views.calendar_events_view, name='calendar_events'),
+    path('calendar/events.ics', views.calendar_ics_view, name='calendar_ics'),
 
 
     
     # LoanCase
     path('cases/', views.LoanCaseListView.as_view(), name='case_list'),
+    path('cases/pricing/', views.case_pricing_view, name='case_pricing'),
+    path('cases/status-summary/', views.case_status_summary_view, name='case_status_summary'),
+    path('cases/status-summary/<str:group>/', views.CaseStatusGroupListView.as_view(), name='case_status_group'),
     path('cases/<int:case_id>/', views.case_detail_view, name='case_detail'),
+    path('cases/<int:case_id>/bundle/', views.case_bundle_view, name='case_bundle'),
     path('cases/create/', views.case_create_view, name='case_create_api'),
     path('cases/<int:case_id>/update/', views.case_update_view, name='case_update'),
     path('cases/<int:case_id>/status/', views.case_status_view, name='case_status'),
@@ -50,6 +56,12 @@ urlpatterns = [
     # Export to CSV
     path('cases/export-csv/', views.export_cases_to_csv, name='export_cases_to_csv'),
     path('cases/import-csv/', views.import_cases_from_csv, name='import_cases_from_csv'),
+
+    # Batch
+    path('batch/', views.batch_view, name='batch'),
+
+    # Change stream
+    path('stream/', views.change_stream_view, name='change_stream'),
 ]
 
 # CopyDashboard:
@@ -57,7 +69,11 @@ urlpatterns = [
 
 # 대출 건:
 # GET /cases/ - 대출 건 리스트 조회
+# POST /cases/pricing/ - 대출 건 최대 LTV/예상 금리 일괄 조회
+# GET /cases/status-summary/ - 상태별/상태 그룹별 건수
+# GET /cases/status-summary/{group}/?status= - 상태 그룹 대출 건 목록 (커서 페이지)
 # GET /cases/{case_id}/ - 대출 건 상세 조회
+# GET /cases/{case_id}/bundle/?include= - 상세 화면 초기 데이터 일괄 조회 (댓글/상담일지/일정/할일 등)
 # PUT /cases/{case_id}/update/ - 대출 건 정보 수정
 # PATCH /cases/{case_id}/status/ - 상태 변경
 # PATCH /cases/{case_id}/urgent/ - 긴급처리 설정
@@ -82,6 +98,16 @@ urlpatterns = [
 # DELETE /cases/{case_id}/comments/{comment_id}/ - 댓글 삭제
 # POST /cases/{case_id}/comments/mark-read/ - 댓글 읽음 처리
 
+# 캘린더:
+# GET /calendar/events/?start=&end=&type= - FullCalendar 이벤트 소스 (ETag 지원)
+# GET /calendar/events.ics?start=&end=&type= - iCalendar 내보내기
+
+# 일괄 요청:
+# POST /batch/ - 여러 API 요청을 한 번에 처리 (요청별 상태/본문/처리 시간 반환)
+
+# 변경 알림:
+# GET /stream/?topics=comments,questions,dashboard&case_id= - 변경 푸시 (ASGI: SSE 또는 ?mode=poll 롱폴링, WSGI: 즉시 응답 폴링)
+
     # STATUS_CHOICES = [
     #     ('단순조회중', '단순조회중'),
     #     ('신용조회중', '신용조회중'),
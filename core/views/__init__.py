@@ -2,16 +2,20 @@ from .case_views import (
     case_detail_view, case_status_view, case_schedule_view, 
     case_urgent_view, case_update_view, update_loan_info_view,
     update_collateral_info_view, update_business_info_view,
-    case_create_view, case_delete_view
+    case_create_view, case_delete_view, case_bundle_view
 )
 from .dashboard_views import dashboard_view
-from .case_list_views import LoanCaseListView
+from .case_list_views import LoanCaseListView, case_pricing_view
+from .case_list_views import case_status_summary_view, CaseStatusGroupListView
 from .case_list_views import case_list_view, case_add_view
 from .provider_views import provider_list_view, provider_detail_view
 from .prior_loan_views import prior_loan_list_view, prior_loan_detail_view
 from .consulting_views import consulting_log_view, consulting_log_detail_view
 from .comment_views import comment_view, comment_detail_view, mark_comments_as_read
+from .stream_views import change_stream_view
+from .batch_views import batch_view
 from .event_views import EventListView
+from .calendar_views import calendar_events_view, calendar_ics_view
 from .csv_management_views import export_cases_to_csv, import_cases_from_csv
 
 # core/views/__init__.py
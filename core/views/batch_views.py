@@ -0,0 +1,163 @@
+# core/views/batch_views.py
+import asyncio
+import json
+import time
+from contextlib import nullcontext
+from io import BytesIO
+from urllib.parse import urlsplit
+from django.db import transaction
+from django.http import Http404, HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from rest_framework import serializers, status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+import logging
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_REQUESTS = 20
+BATCH_METHODS = ('GET', 'POST', 'PUT', 'PATCH', 'DELETE')
+BATCH_PATH = '/api/batch/'
+
+
+class BatchRequestError(Exception):
+    def __init__(self, status_code, message):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def build_sub_request(request, method, path, body):
+    """원 요청의 사용자/헤더를 그대로 쓰는 내부 요청 생성
+
+    _force_auth_user를 설정하면 DRF가 JWT를 다시 검증하지 않고 같은 사용자로 처리합니다.
+    """
+    url = urlsplit(path)
+    data = b'' if body is None else json.dumps(body).encode('utf-8')
+
+    sub_request = HttpRequest()
+    sub_request.method = method
+    sub_request.path = sub_request.path_info = url.path
+    sub_request.META = {
+        **request.META,
+        'REQUEST_METHOD': method,
+        'PATH_INFO': url.path,
+        'QUERY_STRING': url.query,
+        'CONTENT_TYPE': 'application/json',
+        'CONTENT_LENGTH': str(len(data)),
+    }
+    sub_request.GET = QueryDict(url.query)
+    sub_request._stream = BytesIO(data)
+    sub_request._read_started = False
+    sub_request.user = request.user
+    sub_request._force_auth_user = request.user
+    sub_request._force_auth_token = request.auth
+    return sub_request
+
+
+def dispatch_sub_request(request, item):
+    """(상태 코드, 응답 본문)"""
+    if not isinstance(item, dict):
+        raise BatchRequestError(status.HTTP_400_BAD_REQUEST, '각 요청은 method, path, body를 가진 객체여야 합니다.')
+
+    method = str(item.get('method', 'GET')).upper()
+    path = item.get('path') or ''
+    if method not in BATCH_METHODS:
+        raise BatchRequestError(status.HTTP_405_METHOD_NOT_ALLOWED, f'지원하지 않는 메서드입니다: {method}')
+    if not path.startswith('/api/') or urlsplit(path).path == BATCH_PATH:
+        raise BatchRequestError(status.HTTP_400_BAD_REQUEST, 'path는 /api/ 로 시작하는 API 경로여야 합니다.')
+
+    try:
+        match = resolve(urlsplit(path).path)
+    except Resolver404:
+        raise BatchRequestError(status.HTTP_404_NOT_FOUND, '요청한 경로를 찾을 수 없습니다.')
+    # 스트리밍(async) 뷰는 일괄 처리 대상이 아님
+    if asyncio.iscoroutinefunction(match.func):
+        raise BatchRequestError(status.HTTP_400_BAD_REQUEST, '일괄 요청에서 사용할 수 없는 경로입니다.')
+
+    sub_request = build_sub_request(request, method, path, item.get('body'))
+    try:
+        response = match.func(sub_request, *match.args, **match.kwargs)
+    except Http404:
+        raise BatchRequestError(status.HTTP_404_NOT_FOUND, '요청한 데이터를 찾을 수 없습니다.')
+
+    if getattr(response, 'streaming', False):
+        raise BatchRequestError(status.HTTP_400_BAD_REQUEST, '파일/스트리밍 응답은 일괄 요청에서 사용할 수 없습니다.')
+    if hasattr(response, 'render'):
+        response.render()
+
+    if not response.content:
+        return response.status_code, None
+    if response.get('Content-Type', '').startswith('application/json'):
+        return response.status_code, json.loads(response.content)
+    return response.status_code, response.content.decode(response.charset)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def batch_view(request):
+    """여러 API 요청을 한 번에 처리
+
+    요청: {"requests": [{"method": "GET", "path": "/api/todos/?loan_case=1", "body": null}, ...],
+           "atomic": false}
+    - 하위 요청은 현재 사용자로 URLconf의 뷰를 직접 호출합니다 (JWT 재검증/미들웨어 없음).
+    - atomic=true 이면 하나의 트랜잭션으로 처리하고, 실패(4xx/5xx)가 나오면 전체를 롤백하고
+      나머지 요청은 실행하지 않습니다 (424).
+    - 각 응답에 처리 시간(duration_ms)을 포함합니다.
+    """
+    items = request.data.get('requests')
+    if not isinstance(items, list) or not items:
+        return Response({'error': 'requests 목록이 필요합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+    if len(items) > MAX_BATCH_REQUESTS:
+        return Response({'error': f'한 번에 최대 {MAX_BATCH_REQUESTS}건까지 요청할 수 있습니다.'},
+                        status=status.HTTP_400_BAD_REQUEST)
+
+    # 'false', '0' 같은 문자열도 불리언으로 해석 (bool('false')는 True)
+    try:
+        atomic = serializers.BooleanField().to_internal_value(request.data.get('atomic', False))
+    except serializers.ValidationError:
+        return Response({'error': 'atomic은 true 또는 false여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+    started = time.perf_counter()
+    results = []
+
+    try:
+        with transaction.atomic() if atomic else nullcontext():
+            failed = False
+            for item in items:
+                if failed:
+                    results.append({'status': status.HTTP_424_FAILED_DEPENDENCY, 'body': None, 'duration_ms': 0.0})
+                    continue
+
+                item_started = time.perf_counter()
+                try:
+                    status_code, body = dispatch_sub_request(request, item)
+                except BatchRequestError as e:
+                    status_code, body = e.status_code, {'error': str(e)}
+                except Exception as e:
+                    logger.error(f"Batch sub-request failed: {item}: {str(e)}", exc_info=True)
+                    status_code, body = status.HTTP_500_INTERNAL_SERVER_ERROR, {'error': '서버 오류가 발생했습니다.'}
+
+                results.append({
+                    'status': status_code,
+                    'body': body,
+                    'duration_ms': round((time.perf_counter() - item_started) * 1000, 2),
+                })
+
+                if atomic and status_code >= 400:
+                    failed = True
+                    transaction.set_rollback(True)
+    except Exception as e:
+        logger.error(f"Error in batch_view: {str(e)}", exc_info=True)
+        return Response({'error': '서버 오류가 발생했습니다.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    total_ms = round((time.perf_counter() - started) * 1000, 2)
+    logger.info(
+        f"Batch by {request.user}: {len(items)} requests, {total_ms}ms "
+        f"(slowest {max(r['duration_ms'] for r in results)}ms)"
+    )
+    return Response({
+        'atomic': atomic,
+        'rolled_back': atomic and any(r['status'] >= 400 for r in results),
+        'duration_ms': total_ms,
+        'responses': results,
+    })
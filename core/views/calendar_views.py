@@ -0,0 +1,75 @@
+# core/views/calendar_views.py
+from django.http import HttpResponse
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from ..models import Event
+from ..services.calendar_service import CalendarService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def get_calendar_events(request):
+    """(일정 목록, 오류 응답)"""
+    event_type = request.query_params.get('type') or None
+    if event_type and event_type not in dict(Event.EVENT_TYPES):
+        return None, Response({'error': '유효하지 않은 일정 유형입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        start, end = CalendarService.parse_range(request.query_params.get('start'), request.query_params.get('end'))
+    except ValueError as e:
+        return None, Response({'error': f'잘못된 기간입니다: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
+    return CalendarService.get_events(request.user, start, end, event_type), None
+
+
+def not_modified(request, etag):
+    return etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def calendar_events_view(request):
+    """FullCalendar 이벤트 소스 (?start=&end=&type=)
+
+    내용이 같으면 ETag로 304를 반환합니다 (브라우저가 If-None-Match로 재검증).
+    """
+    try:
+        events, error = get_calendar_events(request)
+        if error:
+            return error
+
+        data = CalendarService.to_fullcalendar(events)
+        etag = CalendarService.etag(data)
+        response = Response(status=status.HTTP_304_NOT_MODIFIED) if not_modified(request, etag) else Response(data)
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+    except Exception as e:
+        logger.error(f"Error in calendar_events_view: {str(e)}", exc_info=True)
+        return Response({'error': '일정을 불러오는 중 오류가 발생했습니다.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def calendar_ics_view(request):
+    """일정 iCalendar(.ics) 내보내기 (?start=&end=&type=)"""
+    try:
+        events, error = get_calendar_events(request)
+        if error:
+            return error
+
+        etag = CalendarService.etag(events)
+        if not_modified(request, etag):
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = HttpResponse(
+                CalendarService.to_ical(events, request.get_host()), content_type='text/calendar; charset=utf-8')
+            response['Content-Disposition'] = 'attachment; filename="modi_calendar.ics"'
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+    except Exception as e:
+        logger.error(f"Error in calendar_ics_view: {str(e)}", exc_info=True)
+        return Response({'error': '일정을 내보내는 중 오류가 발생했습니다.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
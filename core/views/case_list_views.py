@@ -1,10 +1,12 @@
 from rest_framework import filters
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.generics import ListAPIView
 from django_filters.rest_framework import DjangoFilterBackend, FilterSet, CharFilter, ChoiceFilter
 from ..models import LoanCase
+from ..pagination import CursorOptInPagination, CreatedAtCursorPagination
 from accounts.permissions import CanManageCase
-from ..serializers import LoanCaseSerializer
+from ..serializers import LoanCaseSerializer, CaseStatusRowSerializer
+from ..services.loan_rate_service import LoanRateService
+from ..services.case_status_service import CaseStatusService
 from django.shortcuts import render
 from core.models import LoanCase
 from rest_framework.decorators import api_view, permission_classes
@@ -14,33 +16,82 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 일괄 금리 조회 1회당 최대 대출 건 수
+MAX_PRICING_CASES = 500
+
 class LoanCaseFilter(FilterSet):
     borrower_name = CharFilter(lookup_expr='icontains')
     status = ChoiceFilter(choices=LoanCase.STATUS_CHOICES)
     
     class Meta:
         model = LoanCase
-        fields = ['borrower_name', 'status', 'is_urgent']
+        fields = ['borrower_name', 'status', 'is_urgent', 'region_tier']
 
 class LoanCaseListView(ListAPIView):
     permission_classes = [CanManageCase]
     serializer_class = LoanCaseSerializer
-    pagination_class = PageNumberPagination
+    # ?pagination=cursor 요청 시 (created_at, id) 키셋 페이지네이션
+    pagination_class = CursorOptInPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = LoanCaseFilter
     search_fields = ['borrower_name', 'borrower_phone', 'address_main']
-    ordering_fields = ['created_at', 'updated_at', 'loan_amount']
+    ordering_fields = ['created_at', 'updated_at', 'loan_amount', 'ltv']
     ordering = ['-created_at']
 
     def get_queryset(self):
-        user = self.request.user
-        if user.role == 'admin':
-            return LoanCase.objects.all()
-        elif user.role == 'branch_manager':
-            return LoanCase.objects.filter(manager__branch=user.branch)
-        elif user.role == 'team_leader':
-            return LoanCase.objects.filter(manager__team=user.team)
-        return LoanCase.objects.filter(manager=user)
+        # manager_name 직렬화 시 행마다 사용자 조회가 발생하지 않도록 함께 조회
+        return LoanCase.objects.visible_to(self.request.user).select_related('manager').with_ltv()
+
+
+@api_view(['GET'])
+@permission_classes([CanManageCase])
+def case_status_summary_view(request):
+    """상태별/상태 그룹별 대출 건수"""
+    try:
+        return Response(CaseStatusService.get_summary(request.user))
+    except Exception as e:
+        logger.error(f"Error getting status summary: {str(e)}", exc_info=True)
+        return Response({'error': '상태별 건수 조회 중 오류가 발생했습니다.'},
+                        status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class CaseStatusGroupListView(ListAPIView):
+    """상태 그룹(?status=로 특정 상태)의 대출 건을 커서 방식으로 나눠 조회"""
+    permission_classes = [CanManageCase]
+    serializer_class = CaseStatusRowSerializer
+    pagination_class = CreatedAtCursorPagination
+
+    def get_queryset(self):
+        return CaseStatusService.get_group_cases(
+            self.request.user, self.kwargs['group'], self.request.query_params.get('status'))
+
+    def list(self, request, *args, **kwargs):
+        try:
+            return super().list(request, *args, **kwargs)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+@api_view(['POST'])
+@permission_classes([CanManageCase])
+def case_pricing_view(request):
+    """여러 대출 건의 최대 LTV/예상 금리를 한 번에 조회"""
+    case_ids = request.data.get('case_ids')
+    if not isinstance(case_ids, list) or not case_ids:
+        return Response({'error': 'case_ids 목록이 필요합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+    if len(case_ids) > MAX_PRICING_CASES:
+        return Response({'error': f'한 번에 최대 {MAX_PRICING_CASES}건까지 조회할 수 있습니다.'},
+                        status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        # 권한 없는 건은 조회 조건에서 제외
+        cases = LoanCase.objects.visible_to(request.user).filter(id__in=case_ids).with_ltv()
+        return Response({'results': LoanRateService.price_cases(cases)})
+    except (TypeError, ValueError):
+        return Response({'error': 'case_ids는 숫자 목록이어야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        logger.error(f"Error pricing cases: {str(e)}", exc_info=True)
+        return Response({'error': '금리 조회 중 오류가 발생했습니다.'},
+                        status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 # @api_view(['POST'])
 # @permission_classes([CanManageCase])
@@ -6,8 +6,11 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from django.core.exceptions import ValidationError
 from ..models import LoanCase
+from ..serializers import EventSerializer
 from ..services.loan_case_service import LoanCaseService
-from accounts.permissions import CanManageCase
+from .comment_views import get_comment_cursor
+from accounts.permissions import CanManageCase, CanManageEvent
+from todos.serializers import TodoSerializer
 import json
 import logging
 from django.http import Http404
@@ -67,6 +70,68 @@ def case_detail_view(request, case_id):
                         status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@api_view(['GET'])
+@permission_classes([CanManageCase])
+def case_bundle_view(request, case_id):
+    """상세 화면 초기 데이터 일괄 조회
+
+    ?include=comments,todos 처럼 필요한 관련 데이터만 선택할 수 있으며 기본은 전체입니다.
+    각 섹션은 개별 API와 같은 형태로 반환합니다.
+    """
+    try:
+        include = request.query_params.get('include')
+        sections = [s for s in include.split(',') if s] if include else list(LoanCaseService.BUNDLE_SECTIONS)
+        invalid = set(sections) - set(LoanCaseService.BUNDLE_SECTIONS)
+        if invalid:
+            return Response({'error': f"알 수 없는 include 값입니다: {', '.join(sorted(invalid))}"},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        # 일정은 CaseEventListView와 같은 권한이 있을 때만 포함
+        if 'events' in sections and not CanManageEvent().has_permission(request, None):
+            sections.remove('events')
+
+        loan_case = LoanCaseService.get_case_bundle(case_id, sections)
+        if not loan_case:
+            return Response({'error': '대출 건을 찾을 수 없습니다.'},
+                            status=status.HTTP_404_NOT_FOUND)
+
+        if not CanManageCase().has_object_permission(request, None, loan_case):
+            return Response({'error': '권한이 없습니다.'},
+                            status=status.HTTP_403_FORBIDDEN)
+
+        context = {
+            'loan_case': loan_case.to_dict(),
+            'status_choices': dict(LoanCase.STATUS_CHOICES),
+            'business_type_choices': dict(LoanCase.BUSINESS_TYPE_CHOICES),
+            'vat_status_choices': dict(LoanCase.VAT_STATUS_CHOICES),
+            'price_type_choices': dict(LoanCase.PRICE_TYPE_CHOICES),
+            'scheduled_statuses': ['자서예정', '기표예정'],
+            'loan_type_choices': dict(LoanCase.LOAN_TYPE_CHOICES),
+            'sections': sections,
+        }
+
+        if 'security_providers' in sections:
+            context['security_providers'] = [provider.to_dict() for provider in loan_case.security_providers.all()]
+        if 'prior_loans' in sections:
+            context['prior_loans'] = [loan.to_dict() for loan in loan_case.prior_loans.all()]
+        if 'comments' in sections:
+            comments = list(loan_case.comments.all())
+            context['comments'] = [comment.to_dict() for comment in comments]
+            context['comment_cursor'] = get_comment_cursor(comments)
+        if 'consulting_logs' in sections:
+            context['consulting_logs'] = [log.to_dict() for log in loan_case.consulting_logs.all()]
+        if 'events' in sections:
+            context['events'] = EventSerializer(loan_case.events.all(), many=True).data
+        if 'todos' in sections:
+            context['todos'] = TodoSerializer(loan_case.todos.all(), many=True).data
+
+        return Response(context)
+    except Exception as e:
+        logger.error(f"Error in case_bundle_view for case {case_id}: {str(e)}", exc_info=True)
+        return Response({'error': '대출 건 정보를 불러오는 중 오류가 발생했습니다.'},
+                        status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
 @api_view(['PUT', 'PATCH'])  # PATCH 메서드 추가
 @permission_classes([CanManageCase])
 def case_update_view(request, case_id):
@@ -112,7 +177,7 @@ def case_status_view(request, case_id):
             f"Status Change Attempt - Current: {loan_case.status}, New: {new_status}")
 
         # LoanCaseService의 update_case_status 메서드 사용
-        success = LoanCaseService.update_case_status(case_id, new_status)
+        success = LoanCaseService.update_case_status(case_id, new_status, request.user)
         if success:
             return Response({'message': '상태가 변경되었습니다.'})
         return Response({'error': '유효하지 않은 상태 변경입니다.'}, status=status.HTTP_400_BAD_REQUEST)
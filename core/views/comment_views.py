@@ -4,29 +4,82 @@ from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from ..services.loan_case_service import LoanCaseService
 from accounts.permissions import CanManageCase
-from core.models import CaseComment
+from core.models import CaseComment, LoanCase
 from rest_framework.permissions import IsAuthenticated
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def parse_comment_cursor(params):
+    """?after=<ISO 일시>&after_id=<댓글 ID> 파싱. 값이 잘못되면 ValueError"""
+    after = params.get('after')
+    if not after:
+        return None, None
+
+    # 쿼리스트링의 '+'는 공백으로 들어오므로 되돌림
+    parsed = parse_datetime(after.replace(' ', '+'))
+    if parsed is None:
+        raise ValueError(after)
+    if timezone.is_aware(parsed):
+        parsed = timezone.make_naive(parsed)
+
+    after_id = params.get('after_id')
+    return parsed, int(after_id) if after_id else None
+
+
+def get_comment_cursor(comments, after=None, after_id=None):
+    """다음 폴링에 사용할 마지막 댓글 위치"""
+    if not comments:
+        return {'after': after.isoformat() if after else None, 'after_id': after_id}
+    last = comments[-1]
+    return {'after': last.created_at.isoformat(), 'after_id': last.id}
+
+
+def check_case_permission(request, case_id):
+    """대출 건 권한이 없으면 403 응답, 있으면 None (대출 건이 없으면 LoanCase.DoesNotExist)"""
+    # 권한 확인에는 담당자만 필요하므로 연관 데이터 없이 조회
+    loan_case = LoanCase.objects.select_related('manager').get(id=case_id)
+    if not CanManageCase().has_object_permission(request, None, loan_case):
+        return Response({'error': '권한이 없습니다.'}, status=status.HTTP_403_FORBIDDEN)
+    return None
+
+
 @api_view(['GET', 'POST'])
 @permission_classes([CanManageCase])
 def comment_view(request, case_id):
     try:
-        loan_case = LoanCaseService.get_case_with_related(case_id)
-        if not CanManageCase().has_object_permission(request, None, loan_case):
-            return Response({'error': '권한이 없습니다.'}, status=status.HTTP_403_FORBIDDEN)
-
         if request.method == "GET":
-            comments = loan_case.comments.all().order_by('created_at')
+            try:
+                after, after_id = parse_comment_cursor(request.query_params)
+            except ValueError:
+                return Response({'error': 'after는 ISO 형식 일시, after_id는 숫자여야 합니다.'},
+                                status=status.HTTP_400_BAD_REQUEST)
+
+            # 권한 조건을 댓글 쿼리에 포함해 한 번에 조회
+            comments = list(LoanCaseService.get_comments(case_id, after, after_id, user=request.user))
+            if not comments:
+                # 새 댓글 폴링은 권한 조건이 포함된 쿼리 결과만으로 응답 (권한 없는 건은 항상 빈 결과)
+                if after is not None:
+                    return Response(status=status.HTTP_204_NO_CONTENT)
+                # 첫 조회 결과가 없을 때만 대출 건 존재/권한 확인 (없으면 404, 권한 없으면 403)
+                error = check_case_permission(request, case_id)
+                if error:
+                    return error
+
             return Response({
-                'comments': [comment.to_dict() for comment in comments]
+                'comments': [comment.to_dict() for comment in comments],
+                'cursor': get_comment_cursor(comments, after, after_id),
             })
 
+        error = check_case_permission(request, case_id)
+        if error:
+            return error
+
         content = request.data.get('content')
         if not content:
             return Response({'error': '댓글 내용을 입력해주세요.'},
@@ -38,6 +91,9 @@ def comment_view(request, case_id):
             'comment': comment.to_dict()
         }, status=status.HTTP_201_CREATED)
 
+    except LoanCase.DoesNotExist:
+        return Response({'error': '해당 대출 건을 찾을 수 없습니다.'},
+                        status=status.HTTP_404_NOT_FOUND)
     except Exception as e:
         logger.error(f"Error in comment_view: {str(e)}", exc_info=True)
         return Response({'error': '서버 오류가 발생했습니다.'},
@@ -73,7 +129,8 @@ def comment_detail_view(request, case_id, comment_id):
 @permission_classes([CanManageCase])
 def mark_comments_as_read(request, case_id):
     try:
-        loan_case = LoanCaseService.get_case_with_related(case_id)
+        # 권한 확인에는 담당자만 필요하므로 연관 데이터 없이 조회
+        loan_case = LoanCase.objects.select_related('manager').get(id=case_id)
         if not CanManageCase().has_object_permission(request, None, loan_case):
             return Response({'error': '권한이 없습니다.'}, status=status.HTTP_403_FORBIDDEN)
 
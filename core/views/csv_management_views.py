@@ -1,34 +1,67 @@
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 import csv
+import io
 from django.utils import timezone
 from ..models import LoanCase
 from ..serializers import CsvExportSerializer
+from ..services.csv_import_service import CsvImportService
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework import status
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 메모리에 올리는 대출 건 수 (청크마다 prefetch 쿼리 2회)
+EXPORT_CHUNK_SIZE = 2000
+
+
+class Echo:
+    """csv.writer가 쓴 행을 그대로 반환하는 버퍼"""
+    def write(self, value):
+        return value
+
+
+def iter_csv_rows(queryset):
+    serializer = CsvExportSerializer()
+    writer = csv.writer(Echo())
+
+    # 헤더 작성
+    yield writer.writerow(CsvExportSerializer.Meta.fields)
+
+    # 데이터 작성
+    for loan_case in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield writer.writerow(serializer.to_representation(loan_case).values())
+
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def export_cases_to_csv(request):
     # 필터링 옵션 적용 가능
-    queryset = LoanCase.objects.all()
-    
-    response = HttpResponse(content_type='text/csv; charset=utf-8')
-    response['Content-Disposition'] = f'attachment; filename="loan_cases_{timezone.now().date()}.csv"'
-
-    serializer = CsvExportSerializer(queryset, many=True)
-    
-    # CSV 작성
-    writer = csv.writer(response)
-    
-    # 헤더 작성
-    writer.writerow(serializer.data[0].keys() if serializer.data else [])
-    
-    # 데이터 작성
-    for data in serializer.data:
-        writer.writerow(data.values())
+    queryset = LoanCase.objects.with_ltv().prefetch_related(
+        'prior_loans', 'consulting_logs'
+    ).order_by('id')
 
+    response = StreamingHttpResponse(iter_csv_rows(queryset), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="loan_cases_{timezone.now().date()}.csv"'
     return response
 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
 def import_cases_from_csv(request):
-    pass
\ No newline at end of file
+    csv_file = request.FILES.get('csv_file')
+    if not csv_file:
+        return Response({'error': 'CSV 파일을 선택해주세요.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        # 업로드 파일을 메모리에 모두 올리지 않고 행 단위로 읽음 (엑셀 BOM 허용)
+        stream = io.TextIOWrapper(csv_file.file, encoding='utf-8-sig', newline='')
+        result = CsvImportService.import_cases(stream, request.user)
+        return Response({'success': True, **result})
+    except UnicodeDecodeError:
+        return Response({'error': 'CSV 파일은 UTF-8 인코딩이어야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        logger.error(f"Error importing cases from CSV: {str(e)}", exc_info=True)
+        return Response({'error': 'CSV 업로드 중 오류가 발생했습니다.'},
+                        status=status.HTTP_500_INTERNAL_SERVER_ERROR)
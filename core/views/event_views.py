@@ -57,6 +57,9 @@ class EventListCreateAPIView(generics.ListCreateAPIView):
     serializer_class = EventSerializer
     permission_classes = [IsAuthenticated, CanManageEvent]
 
+    def get_queryset(self):
+        return Event.objects.visible_to(self.request.user)
+
     def create(self, request, *args, **kwargs):
         logger.info(f"Creating event with data: {request.data}")
         try:
@@ -98,7 +101,7 @@ class EventListView(generics.ListAPIView):
             start_date = datetime.strptime(start_str, '%Y-%m-%d')
             end_date = datetime.strptime(end_str, '%Y-%m-%d')
 
-        return Event.objects.filter(date__range=[start_date, end_date])
+        return Event.objects.visible_to(self.request.user).filter(date__range=[start_date, end_date])
 
 
 class CaseEventListView(generics.ListAPIView):
@@ -107,15 +110,18 @@ class CaseEventListView(generics.ListAPIView):
 
     def get_queryset(self):
         case_id = self.kwargs.get('case_id')
-        return Event.objects.filter(loan_case_id=case_id)
+        return Event.objects.visible_to(self.request.user).filter(loan_case_id=case_id)
     
 # core/views/event_views.py
 
 class EventDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Event.objects.all()
     serializer_class = EventSerializer
     permission_classes = [IsAuthenticated, CanManageEvent]
 
+    def get_queryset(self):
+        # 권한 확인(CanManageEvent)에 필요한 담당자까지 함께 조회
+        return Event.objects.select_related('loan_case__manager')
+
     def update(self, request, *args, **kwargs):
         logger.info(f"Updating event with data: {request.data}")
         try:
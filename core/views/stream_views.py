@@ -0,0 +1,183 @@
+# core/views/stream_views.py
+import json
+import time
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from accounts.permissions import CanManageCase
+from ..models import LoanCase
+from ..services.change_bus import get_change_bus
+from ..services.dashboard_service import DashboardService
+import logging
+
+logger = logging.getLogger(__name__)
+
+TOPICS = ('comments', 'questions', 'dashboard')
+# 연결 유지용 heartbeat 간격 / 스트림 최대 유지 시간 (이후 클라이언트가 Last-Event-ID로 재연결)
+STREAM_HEARTBEAT_SECONDS = 15
+STREAM_MAX_SECONDS = 300
+# ASGI에서 ?mode=poll 일 때 롱폴링 최대 대기 시간
+LONG_POLL_TIMEOUT_SECONDS = 25
+# SSE 재연결 간격
+RETRY_MILLISECONDS = 5000
+# WSGI 폴링 간격: 기다리지 않고 즉시 응답해 워커를 점유하지 않으며,
+# 요청 수가 늘지 않도록 기존 대시보드 전체 새로고침 주기(5분)와 같게 유지 (운영은 ASGI로 SSE 사용)
+WSGI_POLL_MILLISECONDS = 5 * 60 * 1000
+
+# 같은 이벤트 ID에 대한 대시보드 공통 통계는 연결 간에 한 번만 계산
+_shared_stats_cache = {'event_id': None, 'data': None}
+
+
+def authenticate(request):
+    """DRF 인증 클래스(JWT)로 사용자 확인. 실패 시 None"""
+    drf_request = Request(request, authenticators=[cls() for cls in api_settings.DEFAULT_AUTHENTICATION_CLASSES])
+    try:
+        user = drf_request.user
+    except AuthenticationFailed:
+        return None
+    return user if user and user.is_authenticated else None
+
+
+def get_subscription(request):
+    """(topics, case_id) 또는 오류 응답"""
+    topics = set(filter(None, request.GET.get('topics', ','.join(TOPICS)).split(',')))
+    if not topics <= set(TOPICS):
+        return None, JsonResponse({'error': f'topics는 {", ".join(TOPICS)} 중에서 선택해야 합니다.'}, status=400)
+
+    case_id = request.GET.get('case_id')
+    if 'comments' in topics:
+        if not case_id:
+            topics.discard('comments')
+        else:
+            try:
+                loan_case = LoanCase.objects.select_related('manager').get(id=int(case_id))
+            except (ValueError, LoanCase.DoesNotExist):
+                return None, JsonResponse({'error': '해당 대출 건을 찾을 수 없습니다.'}, status=404)
+            if not CanManageCase().has_object_permission(request, None, loan_case):
+                return None, JsonResponse({'error': '권한이 없습니다.'}, status=403)
+            case_id = loan_case.id
+    return (topics, case_id), None
+
+
+def get_shared_stats(event_id):
+    if _shared_stats_cache['event_id'] != event_id:
+        _shared_stats_cache.update(event_id=event_id, data=DashboardService.get_shared_stats())
+    return _shared_stats_cache['data']
+
+
+def build_messages(events, user, topics, case_id, last_event_id):
+    """버스 이벤트를 사용자에게 보낼 (이벤트명, 데이터) 목록으로 변환
+
+    기존 JSON 형태를 그대로 사용합니다.
+    - comment: 댓글 to_dict()
+    - unread_questions: 대시보드 unread_questions 목록
+    - dashboard: today_stats, month_stats, urgent_cases, recent_cases
+    """
+    messages = []
+    questions_changed = dashboard_changed = False
+    for _, event in events:
+        topic = event['topic']
+        if topic == 'comment' and 'comments' in topics and event['case_id'] == case_id:
+            messages.append(('comment', event['comment']))
+        elif topic == 'questions' and 'questions' in topics and event['manager_id'] == user.id:
+            questions_changed = True
+        elif topic == 'dashboard' and 'dashboard' in topics:
+            dashboard_changed = True
+
+    # 여러 변경이 한 번에 오면 사용자별 조회는 한 번만
+    if questions_changed:
+        messages.append(('unread_questions', {'unread_questions': DashboardService.get_unread_questions(user)}))
+    if dashboard_changed:
+        data = dict(get_shared_stats(last_event_id))
+        data['recent_cases'] = DashboardService.get_recent_cases(user)
+        messages.append(('dashboard', data))
+    return messages
+
+
+def format_sse(event_id, name, data):
+    return f"id: {event_id}\nevent: {name}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
+
+def get_last_event_id(request, bus):
+    """재연결 시 Last-Event-ID 헤더(또는 ?last_event_id=)부터, 처음이면 현재 위치부터"""
+    value = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return bus.last_id
+
+
+async def stream_changes(user, topics, case_id, last_event_id):
+    bus = get_change_bus()
+    started = time.monotonic()
+    yield f"retry: {RETRY_MILLISECONDS}\nid: {last_event_id}\nevent: ready\ndata: {{}}\n\n"
+
+    while time.monotonic() - started < STREAM_MAX_SECONDS:
+        events, reset = await bus.wait_async(last_event_id, STREAM_HEARTBEAT_SECONDS)
+        if reset:
+            # 버퍼에서 밀려났거나 다른 프로세스의 ID: 클라이언트가 전체 데이터를 다시 조회
+            last_event_id = bus.last_id
+            yield format_sse(last_event_id, 'reset', {})
+            continue
+        if not events:
+            yield ': ping\n\n'
+            continue
+
+        last_event_id = events[-1][0]
+        messages = await sync_to_async(build_messages)(events, user, topics, case_id, last_event_id)
+        for name, data in messages:
+            yield format_sse(last_event_id, name, data)
+
+
+async def change_stream_view(request):
+    """댓글/미확인 질문/대시보드 변경 푸시
+
+    ASGI에서는 text/event-stream으로 변경 시마다 전송하고, ?mode=poll 이면 변경이 생기거나
+    제한 시간이 될 때까지 기다렸다 JSON으로 한 번 응답합니다 (롱폴링).
+    WSGI에서는 대기 중 워커를 점유하지 않도록 지금까지의 변경만 즉시 JSON으로 응답하고,
+    클라이언트는 retry(ms) 후 다시 요청합니다.
+    """
+    user = await sync_to_async(authenticate)(request)
+    if user is None:
+        return JsonResponse({'error': '인증이 필요합니다.'}, status=401)
+    if user.role not in ['admin', 'branch_manager', 'team_leader', 'staff']:
+        return JsonResponse({'error': '권한이 없습니다.'}, status=403)
+    request.user = user
+
+    subscription, error = await sync_to_async(get_subscription)(request)
+    if error:
+        return error
+    topics, case_id = subscription
+
+    bus = get_change_bus()
+    last_event_id = get_last_event_id(request, bus)
+
+    if isinstance(request, ASGIRequest):
+        if request.GET.get('mode') != 'poll':
+            response = StreamingHttpResponse(
+                stream_changes(user, topics, case_id, last_event_id), content_type='text/event-stream')
+            response['Cache-Control'] = 'no-cache'
+            response['X-Accel-Buffering'] = 'no'
+            return response
+        events, reset = await bus.wait_async(last_event_id, LONG_POLL_TIMEOUT_SECONDS)
+        retry = 0
+    else:
+        events, reset = await sync_to_async(bus.events_since)(last_event_id)
+        retry = WSGI_POLL_MILLISECONDS
+
+    if reset:
+        return JsonResponse({'last_event_id': bus.last_id, 'reset': True, 'retry': retry, 'events': []})
+
+    if events:
+        last_event_id = events[-1][0]
+    messages = await sync_to_async(build_messages)(events, user, topics, case_id, last_event_id)
+    return JsonResponse({
+        'last_event_id': last_event_id,
+        'reset': False,
+        'retry': retry,
+        'events': [{'event': name, 'data': data} for name, data in messages],
+    }, encoder=DjangoJSONEncoder)
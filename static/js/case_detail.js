@@ -21,6 +21,13 @@ class CaseDetailManager {
             consultingLogs: [],
             events: [],
             initialized: false,
+            // bundle 응답 중 아직 사용하지 않은 섹션 (각 매니저가 첫 로드에 한 번 사용)
+            preloaded: {},
+            takePreloaded(section) {
+                const data = this.preloaded[section];
+                delete this.preloaded[section];
+                return data;
+            },
             endpoints: {
                 base: `/api/cases/${caseId}/`,
                 comments: `/api/cases/${caseId}/comments/`,
@@ -98,6 +105,7 @@ class CaseDetailManager {
 
         this.endpoints = {
             detail: `${baseUrl}/${this.loanCaseId}/`,
+            bundle: `${baseUrl}/${this.loanCaseId}/bundle/`,
             update: `${baseUrl}/${this.loanCaseId}/update/`,
             status: `${baseUrl}/${this.loanCaseId}/status/`,
             urgent: `${baseUrl}/${this.loanCaseId}/urgent/`,
@@ -277,7 +285,8 @@ class CaseDetailManager {
                 throw new Error('Form not initialized');
             }
     
-            const data = await window.authUtils.fetchWithAuth(this.endpoints.detail);
+            // 상세/담보제공자/선순위대출/댓글/상담일지/일정/할일을 한 번에 조회
+            const data = await window.authUtils.fetchWithAuth(this.endpoints.bundle);
             console.log('Initial fetch data:', data);
     
             // loan_case 데이터를 window.loanCaseApp에 저장
@@ -289,17 +298,19 @@ class CaseDetailManager {
             
             window.loanCaseApp.securityProviders = data.security_providers || [];
             window.loanCaseApp.priorLoans = data.prior_loans || [];
-    
-            // 댓글과 상담일지 데이터 로드
-            console.log('Fetching comments from:', this.endpoints.comments);
-            const commentsResponse = await window.authUtils.fetchWithAuth(this.endpoints.comments);
-            window.loanCaseApp.comments = commentsResponse || [];
-            console.log('Comments API Response:', commentsResponse);
-    
-            console.log('Fetching consulting logs from:', this.endpoints.consultingLogs);
-            const logsResponse = await window.authUtils.fetchWithAuth(this.endpoints.consultingLogs);
-            window.loanCaseApp.consultingLogs = logsResponse || [];
-            console.log('ConsultingLogs API Response:', logsResponse);
+            window.loanCaseApp.comments = data.comments || [];
+            window.loanCaseApp.consultingLogs = data.consulting_logs || [];
+            window.loanCaseApp.events = data.events || [];
+
+            // 각 매니저는 첫 로드에 개별 API 대신 이 데이터를 사용
+            window.loanCaseApp.preloaded = {
+                comments: { comments: data.comments, cursor: data.comment_cursor },
+                consulting_logs: { consulting_logs: data.consulting_logs },
+                todos: { results: data.todos }
+            };
+            if (data.events) {
+                window.loanCaseApp.preloaded.events = data.events;
+            }
     
             console.log('Updated loanCaseApp:', window.loanCaseApp);
     
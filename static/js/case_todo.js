@@ -33,7 +33,8 @@ async function waitForLoanCaseId() {
 async function loadTodos() {
     try {
         const encodedLoanCaseId = encodeURIComponent(currentLoanCaseId);
-        const response = await window.authUtils.fetchWithAuth(`/api/todos/?loan_case=${encodedLoanCaseId}`);
+        const response = window.loanCaseApp?.takePreloaded?.('todos')
+            || await window.authUtils.fetchWithAuth(`/api/todos/?loan_case=${encodedLoanCaseId}`);
 
         console.log('Todo API Response:', response);
         const todoList = document.getElementById('todoList');
@@ -185,7 +186,10 @@ async function initializeTodos() {
         loadTodosFunction = loadTodos;
         window.loadTodos = loadTodos;
 
-        // 초기 로드
+        // 초기 로드 (상세 화면 bundle 응답이 준비되면 그 데이터 사용)
+        if (!window.loanCaseApp?.initialized) {
+            await new Promise(resolve => document.addEventListener('appInitialized', resolve, { once: true }));
+        }
         loadTodos();
 
     } catch (error) {
@@ -0,0 +1,121 @@
+// static/js/change_stream.js
+// /api/stream/ 변경 알림 구독 (ASGI: SSE 스트림, WSGI: 응답의 retry(ms) 간격으로 폴링)
+// EventSource는 Authorization 헤더를 보낼 수 없어 fetch로 직접 읽습니다.
+(function () {
+    const RETRY_DELAY = 5000;
+
+    class ChangeStream {
+        constructor({ topics, caseId = null, handlers = {} }) {
+            this.topics = topics;
+            this.caseId = caseId;
+            this.handlers = handlers;
+            this.lastEventId = null;
+            this.retryDelay = RETRY_DELAY;
+            this.controller = null;
+            this.stopped = false;
+        }
+
+        start() {
+            this.stopped = false;
+            this.connect();
+            return this;
+        }
+
+        stop() {
+            this.stopped = true;
+            this.controller?.abort();
+        }
+
+        buildUrl() {
+            const params = new URLSearchParams({ topics: this.topics.join(',') });
+            if (this.caseId) params.set('case_id', this.caseId);
+            if (this.lastEventId !== null) params.set('last_event_id', this.lastEventId);
+            return `/api/stream/?${params}`;
+        }
+
+        async connect() {
+            while (!this.stopped) {
+                try {
+                    this.controller = new AbortController();
+                    const response = await fetch(this.buildUrl(), {
+                        headers: { 'Authorization': `Bearer ${localStorage.getItem('token')}` },
+                        signal: this.controller.signal
+                    });
+
+                    if (response.status === 401 && await window.authUtils?.refreshToken()) continue;
+                    if (!response.ok) throw new Error(`Stream request failed: ${response.status}`);
+
+                    if ((response.headers.get('Content-Type') || '').startsWith('text/event-stream')) {
+                        await this.readStream(response);
+                    } else {
+                        const result = await response.json();
+                        this.handlePoll(result);
+                        // 롱폴링(retry 0)은 바로, WSGI 폴링은 retry 후 다시 요청
+                        if (result.retry) await new Promise(resolve => setTimeout(resolve, result.retry));
+                        continue;
+                    }
+                } catch (error) {
+                    if (this.stopped) return;
+                    console.error('Change stream error:', error);
+                }
+                await new Promise(resolve => setTimeout(resolve, this.retryDelay));
+            }
+        }
+
+        async readStream(response) {
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) return;
+                buffer += decoder.decode(value, { stream: true });
+
+                let boundary;
+                while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                    this.handleFrame(buffer.slice(0, boundary));
+                    buffer = buffer.slice(boundary + 2);
+                }
+            }
+        }
+
+        handleFrame(frame) {
+            let name = 'message';
+            let data = '';
+            frame.split('\n').forEach(line => {
+                if (line.startsWith(':')) return;
+                const index = line.indexOf(':');
+                const field = index === -1 ? line : line.slice(0, index);
+                const value = index === -1 ? '' : line.slice(index + 1).replace(/^ /, '');
+
+                if (field === 'id') this.lastEventId = value;
+                else if (field === 'event') name = value;
+                else if (field === 'data') data += value;
+                else if (field === 'retry') this.retryDelay = parseInt(value, 10) || RETRY_DELAY;
+            });
+            if (data) this.dispatch(name, JSON.parse(data));
+        }
+
+        handlePoll(result) {
+            this.lastEventId = result.last_event_id;
+            if (result.reset) {
+                this.dispatch('reset', {});
+                return;
+            }
+            result.events.forEach(event => this.dispatch(event.event, event.data));
+        }
+
+        dispatch(name, data) {
+            const handler = this.handlers[name];
+            if (!handler) return;
+            try {
+                handler(data);
+            } catch (error) {
+                console.error(`Change stream handler error (${name}):`, error);
+            }
+        }
+    }
+
+    window.ChangeStream = ChangeStream;
+})();
@@ -51,6 +51,7 @@ class CommentManager {
             // 데이터 로드
             console.log('Loading initial comments...');
             await this.loadComments();
+            this.subscribeChanges();
 
             this.isInitialized = true;
             console.log('Comment manager initialization complete');
@@ -121,11 +122,13 @@ class CommentManager {
     async loadComments() {
         try {
             console.log('Loading comments from:', this.endpoints.list);
-            const response = await window.authUtils.fetchWithAuth(this.endpoints.list);
+            const response = window.loanCaseApp.takePreloaded?.('comments')
+                || await window.authUtils.fetchWithAuth(this.endpoints.list);
             console.log('Comments loaded:', response);
 
             if (response?.comments) {
                 this.comments = response.comments;
+                this.cursor = response.cursor;
                 console.log('Comments array:', this.comments);
                 await this.renderComments();
             }
@@ -174,21 +177,48 @@ class CommentManager {
 
     async checkNewComments() {
         try {
-            const latestDate = this.comments[0]?.created_at || new Date().toISOString();
-            const newComments = await window.authUtils.fetchWithAuth(
-                `${this.endpoints.list}?after=${latestDate}`
+            // 마지막으로 받은 댓글 (created_at, id) 이후만 조회, 새 댓글이 없으면 204(null)
+            const params = new URLSearchParams({
+                after: this.cursor?.after || new Date().toISOString()
+            });
+            if (this.cursor?.after_id) {
+                params.append('after_id', this.cursor.after_id);
+            }
+            const response = await window.authUtils.fetchWithAuth(
+                `${this.endpoints.list}?${params}`
             );
 
-            if (newComments.length > 0) {
-                this.handleNewComments(newComments);
+            if (response?.comments?.length > 0) {
+                this.cursor = response.cursor;
+                this.handleNewComments(response.comments);
             }
         } catch (error) {
             console.error('새 댓글 확인 중 오류:', error);
         }
     }
 
+    subscribeChanges() {
+        // 새 댓글은 변경 알림으로 받고, 알림을 놓친 경우(reset)에만 커서 이후를 다시 조회
+        if (!window.ChangeStream) return;
+        this.changeStream = new window.ChangeStream({
+            topics: ['comments'],
+            caseId: window.loanCaseApp.caseId,
+            handlers: {
+                comment: (comment) => {
+                    this.cursor = { after: comment.created_at, after_id: comment.id };
+                    this.handleNewComments([comment]);
+                },
+                reset: () => this.checkNewComments()
+            }
+        }).start();
+    }
+
     handleNewComments(newComments) {
-        this.comments = [...newComments, ...this.comments];
+        const knownIds = new Set(this.comments.map(comment => comment.id));
+        newComments = newComments.filter(comment => !knownIds.has(comment.id));
+        if (newComments.length === 0) return;
+
+        this.comments = [...this.comments, ...newComments];
         this.renderComments();
         this.updateUnreadCount();
     }
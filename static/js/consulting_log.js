@@ -113,7 +113,8 @@ class ConsultingLogManager {
     async loadLogs() {
         try {
             console.log('Loading logs from:', this.endpoints.list);
-            const response = await window.authUtils.fetchWithAuth(this.endpoints.list);
+            const response = window.loanCaseApp.takePreloaded?.('consulting_logs')
+                || await window.authUtils.fetchWithAuth(this.endpoints.list);
             console.log('Logs loaded:', response);
 
             if (response?.consulting_logs) {
@@ -109,25 +109,7 @@ const Dashboard = {
         this.updateStatElement('ongoing-cases', data.today_stats.ongoing_cases);
 
         // 월별 통계 업데이트
-        if (data.month_stats) {
-            const monthlyStats = document.querySelector('[data-stat="monthly-stats"]');
-            if (monthlyStats) {
-                monthlyStats.textContent = `${data.month_stats.count}건`;
-
-                const monthlyAmount = document.querySelector('[data-stat="monthly-amount"]');
-                if (monthlyAmount && data.month_stats.amount) {
-                    // 수수료 계산 (0.3%)
-                    const commission = Math.floor(data.month_stats.amount * 10000 * 0.003);
-
-                    monthlyAmount.innerHTML = `
-                    ${data.month_stats.amount.toLocaleString()}만원
-                    <span class="text-sm text-gray-500">
-                        (예상 수수료: ${commission.toLocaleString()}원)
-                    </span>
-                `;
-                }
-            }
-        }
+        this.updateMonthStats(data.month_stats);
 
         // 긴급 케이스 업데이트
         this.updateUrgentCases(data.urgent_cases);
@@ -160,8 +142,53 @@ const Dashboard = {
     `).join('') : '<p class="text-gray-500 text-center">최근 등록된 케이스가 없습니다.</p>';
     },
 
+    updateMonthStats(monthStats) {
+        if (!monthStats) return;
+        const monthlyStats = document.querySelector('[data-stat="monthly-stats"]');
+        if (monthlyStats) {
+            monthlyStats.textContent = `${monthStats.count}건`;
+
+            const monthlyAmount = document.querySelector('[data-stat="monthly-amount"]');
+            if (monthlyAmount && monthStats.amount) {
+                // 수수료 계산 (0.3%)
+                const commission = Math.floor(monthStats.amount * 10000 * 0.003);
+
+                monthlyAmount.innerHTML = `
+                ${monthStats.amount.toLocaleString()}만원
+                <span class="text-sm text-gray-500">
+                    (예상 수수료: ${commission.toLocaleString()}원)
+                </span>
+            `;
+            }
+        }
+    },
+
+    applyChanges(data) {
+        // 변경 알림으로 받은 항목만 갱신 (공지사항은 그대로)
+        apiResponseCache = { ...apiResponseCache, ...data };
+
+        if (data.today_stats) {
+            this.updateStatElement('new-cases', data.today_stats.new_cases);
+            this.updateStatElement('ongoing-cases', data.today_stats.ongoing_cases);
+        }
+        this.updateMonthStats(data.month_stats);
+        if (data.urgent_cases) this.updateUrgentCases(data.urgent_cases);
+        if (data.recent_cases) this.updateRecentCases(data.recent_cases);
+    },
+
     startAutoRefresh() {
-        // 5분마다 자동 새로고침
+        if (window.ChangeStream) {
+            this.changeStream = new window.ChangeStream({
+                topics: ['dashboard', 'questions'],
+                handlers: {
+                    dashboard: (data) => this.applyChanges(data),
+                    unread_questions: (data) => this.applyChanges(data),
+                    reset: () => this.updateStats()
+                }
+            }).start();
+        }
+
+        // 변경 알림이 끊긴 경우를 대비해 5분마다 전체 새로고침
         setInterval(() => {
             this.updateStats();
             this.updateEvents();
@@ -219,74 +246,9 @@ const Dashboard = {
         `).join('') : '<p class="text-gray-500">등록된 공지사항이 없습니다.</p>';
     },
 
-    async updateEvents() {
-        console.log('updateEvents 시작');
-        try {
-            // 내부 fetchWithAuth 메서드로 직접 호출
-            const response = await fetchWithAuth('/api/events/');
-
-            console.log('fetchWithAuth 응답:', response);
-
-            if (!response) {
-                console.warn('응답이 없습니다.');
-                return;
-            }
-
-            const events = Array.isArray(response) ? response :
-                (response.results ? response.results : []);
-
-            console.log('파싱된 이벤트:', events);
-
-            if (!events.length) {
-                console.warn('이벤트가 없습니다.');
-                return;
-            }
-
-            eventsResponseCache = events;
-
-            if (calendar) {
-                calendar.removeAllEvents();
-
-                const calendarEvents = events.map(event => {
-                    let backgroundColor, title;
-
-                    switch (event.event_type) {
-                        case 'scheduled':
-                            backgroundColor = '#FB8C00';
-                            title = `${event.title} (접수)`;
-                            break;
-                        case 'authorizing':
-                            backgroundColor = '#1E88E5';
-                            title = `${event.title} (자서)`;
-                            break;
-                        case 'journalizing':
-                            backgroundColor = '#43A047';
-                            title = `${event.title} (기표)`;
-                            break;
-                        default:
-                            backgroundColor = '#90CAF9';
-                            title = event.title;
-                    }
-
-                    return {
-                        id: event.id,
-                        title: title,
-                        start: event.date,
-                        backgroundColor: backgroundColor,
-                        extendedProps: {
-                            description: event.description,
-                            loan_case: event.loan_case,
-                            type: event.event_type
-                        }
-                    };
-                });
-
-                console.log('캘린더 이벤트:', calendarEvents);
-                calendar.addEventSource(calendarEvents);
-            }
-        } catch (error) {
-            console.error('updateEvents 에러:', error);
-        }
+    // 캘린더에 보이는 기간의 일정 다시 조회 (initializeCalendar의 events 소스)
+    updateEvents() {
+        calendar?.refetchEvents();
     }
 };
 
@@ -304,6 +266,12 @@ function initializeCalendar() {
         },
         locale: 'ko',
         height: 'auto',
+        // 보이는 기간만 서버에서 조회 (FullCalendar 형식 JSON, 유형별 색상/제목 포함)
+        events: async (info) => {
+            const params = new URLSearchParams({ start: info.startStr, end: info.endStr });
+            eventsResponseCache = await fetchWithAuth(`/api/calendar/events/?${params}`);
+            return eventsResponseCache || [];
+        },
         eventClick: function (info) {
             const event = info.event;
             const loanCaseId = event.extendedProps.loan_case;
@@ -356,7 +324,6 @@ function initialize() {
     setupEventListeners();
     initializeCalendar();
     Dashboard.updateStats();
-    Dashboard.updateEvents();
     Dashboard.startAutoRefresh();
 }
 
@@ -112,7 +112,8 @@ class EventManager {
 
         try {
             this.isLoading = true;
-            const response = await window.authUtils.fetchWithAuth(this.endpoints.base);
+            const response = window.loanCaseApp?.takePreloaded?.('events')
+                || await window.authUtils.fetchWithAuth(this.endpoints.base);
             const events = Array.isArray(response) ? response : response.results || [];
 
             this.events = events;
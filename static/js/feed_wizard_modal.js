@@ -37,28 +37,6 @@ document.addEventListener('DOMContentLoaded', () => {
         return `${names.join('/')}고객`;
     };
 
-    const loadAdditionalData = async (caseId) => {
-        try {
-            // 선순위 대출 정보
-            const priorLoansResponse = await window.authUtils.fetchWithAuth(`/api/cases/${caseId}/prior-loans/`);
-            
-            // 담보제공자 정보
-            const providersResponse = await window.authUtils.fetchWithAuth(`/api/cases/${caseId}/providers/`);
-            
-            // 이벤트 정보 (자서일정 등)
-            const eventsResponse = await window.authUtils.fetchWithAuth(`/api/cases/${caseId}/events/`);
-            
-            return {
-                prior_loans: priorLoansResponse.prior_loans || [],
-                security_providers: providersResponse.providers || [],
-                events: Array.isArray(eventsResponse) ? eventsResponse : eventsResponse.results || []
-            };
-        } catch (error) {
-            console.error('추가 데이터 로드 실패:', error);
-            return {};
-        }
-    };
-
     // 피드 양식 템플릿 함수들
     const feedTemplates = {
         '신용조회': (data) => {
@@ -204,10 +182,14 @@ ${data.referrer || '래퍼명'}`;
             
             try {
                 const caseId = window.loanCaseApp.caseId;
-                const [caseData, additionalData] = await Promise.all([
-                    window.authUtils.fetchWithAuth(`/api/cases/${caseId}/`),
-                    loadAdditionalData(caseId)
-                ]);
+                const caseData = await window.authUtils.fetchWithAuth(
+                    `/api/cases/${caseId}/bundle/?include=security_providers,prior_loans,events`
+                );
+                const additionalData = {
+                    prior_loans: caseData.prior_loans || [],
+                    security_providers: caseData.security_providers || [],
+                    events: caseData.events || []
+                };
 
                 // 기본 데이터와 추가 데이터 병합
                 window.loanCaseApp.loan_case = {
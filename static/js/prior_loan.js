@@ -221,22 +221,19 @@ class PriorLoanManager {
                 }
             });
     
-            // 데이터 저장
-            const response = await window.authUtils.fetchWithAuth(
-                this.currentLoanId 
-                    ? `${this.endpoints.base}${this.currentLoanId}/`
-                    : this.endpoints.base,
+            // 데이터 저장과 전체 목록 다시 불러오기를 한 번에
+            const responses = await window.authUtils.batch([
                 {
                     method: this.currentLoanId ? 'PUT' : 'POST',
-                    headers: {
-                        'Content-Type': 'application/json'
-                    },
-                    body: JSON.stringify(data)
-                }
-            );
-    
-            // 새로운 데이터 전체 다시 불러오기
-            const result = await window.authUtils.fetchWithAuth(this.endpoints.base);
+                    path: this.currentLoanId
+                        ? `${this.endpoints.base}${this.currentLoanId}/`
+                        : this.endpoints.base,
+                    body: data
+                },
+                { method: 'GET', path: this.endpoints.base }
+            ], { atomic: true });
+            if (!responses) return;
+            const [, result] = responses;
             console.log('Updated loans response:', result);  // 응답 구조 확인
             
             // API 응답 구조에 따라 배열 추출
@@ -1,7 +1,6 @@
 // 전역 변수
 let calendar;
 let activeFilter = 'all';
-let eventsCache = null;
 
 // 이벤트 타입별 색상 설정
 const EVENT_COLORS = {
@@ -14,8 +13,7 @@ const EVENT_COLORS = {
 async function initialize() {
     setupCalendar();
     setupEventListeners();
-    await loadEvents();
-    updateUpcomingEvents();
+    await updateUpcomingEvents();
 }
 
 // 캘린더 설정
@@ -32,6 +30,8 @@ function setupCalendar() {
         },
         locale: 'ko',
         height: 'auto',
+        // 보이는 기간만 서버에서 조회 (FullCalendar 형식 JSON)
+        events: (info) => fetchCalendarEvents(info.startStr, info.endStr),
         eventClick: handleEventClick,
         eventDidMount: function(info) {
             // 툴팁 설정
@@ -70,86 +70,85 @@ function setupEventListeners() {
         });
     });
 
+    document.getElementById('exportIcsBtn')?.addEventListener('click', exportIcs);
+
     document.getElementById('addEventBtn')?.addEventListener('click', () => {
         window.location.href = '/web/cases/add/';
     });
 }
 
-// 이벤트 로드
-async function loadEvents() {
+// 로컬 날짜 'YYYY-MM-DD' (toISOString은 UTC 기준이라 날짜가 하루 밀릴 수 있음)
+function toDateString(date) {
+    const month = String(date.getMonth() + 1).padStart(2, '0');
+    const day = String(date.getDate()).padStart(2, '0');
+    return `${date.getFullYear()}-${month}-${day}`;
+}
+
+// 기간별 일정 조회 (/api/calendar/events/)
+async function fetchCalendarEvents(start, end) {
+    const params = new URLSearchParams({ start, end });
+    if (activeFilter !== 'all') params.set('type', activeFilter);
     try {
-        const response = await window.authUtils.fetchWithAuth('/api/events/');
-        if (!response) return;
-        
-        eventsCache = response;
-        displayEvents(response);
+        return await window.authUtils.fetchWithAuth(`/api/calendar/events/?${params}`) || [];
     } catch (error) {
         console.error('이벤트 로드 중 에러:', error);
         window.authUtils.showToast('에러', '일정을 불러오는데 실패했습니다.', 'error');
+        return [];
     }
 }
 
-// 이벤트 표시
-function displayEvents(events) {
-    if (!calendar) return;
-    
-    calendar.removeAllEvents();
-    
-    const calendarEvents = events.map(event => ({
-        id: event.id,
-        title: event.title,
-        start: event.date,
-        backgroundColor: EVENT_COLORS[event.event_type],
-        extendedProps: {
-            description: event.description,
-            loan_case: event.loan_case,
-            type: event.event_type
-        }
-    }));
-    
-    calendar.addEventSource(calendarEvents);
-}
-
 // 이벤트 필터링
 function filterEvents() {
-    if (!eventsCache) return;
-    
-    const filteredEvents = activeFilter === 'all' 
-        ? eventsCache 
-        : eventsCache.filter(event => event.event_type === activeFilter);
-    
-    displayEvents(filteredEvents);
-    updateUpcomingEvents(filteredEvents);
+    calendar?.refetchEvents();
+    updateUpcomingEvents();
 }
 
-// 다가오는 이벤트 업데이트
-function updateUpcomingEvents(events = eventsCache) {
-    if (!events) return;
-
+// 다가오는 이벤트 업데이트 (오늘부터 60일)
+async function updateUpcomingEvents() {
     const upcomingContainer = document.getElementById('upcomingEvents');
     if (!upcomingContainer) return;
 
     const today = new Date();
-    const filteredEvents = events
-        .filter(event => new Date(event.date) >= today)
-        .sort((a, b) => new Date(a.date) - new Date(b.date))
-        .slice(0, 5);
+    const end = new Date(today.getTime() + 60 * 24 * 60 * 60 * 1000);
+    const events = (await fetchCalendarEvents(toDateString(today), toDateString(end))).slice(0, 5);
 
-    upcomingContainer.innerHTML = filteredEvents.length 
-        ? filteredEvents.map(event => `
+    upcomingContainer.innerHTML = events.length 
+        ? events.map(event => `
             <div class="p-3 bg-gray-50 rounded-lg hover:bg-gray-100 transition-colors cursor-pointer"
-                onclick="openEventDetail(${event.loan_case})">
+                onclick="openEventDetail(${event.extendedProps.loan_case})">
                 <div class="flex items-center gap-2">
                     <div class="w-2 h-2 rounded-full" 
-                        style="background-color: ${EVENT_COLORS[event.event_type]}"></div>
+                        style="background-color: ${EVENT_COLORS[event.extendedProps.type]}"></div>
                     <p class="font-medium">${event.title}</p>
                 </div>
-                <p class="text-sm text-gray-600 mt-1">${new Date(event.date).toLocaleDateString()}</p>
+                <p class="text-sm text-gray-600 mt-1">${new Date(event.start).toLocaleDateString()}</p>
             </div>
         `).join('')
         : '<p class="text-gray-500 text-center">예정된 일정이 없습니다.</p>';
 }
 
+// iCalendar(.ics) 내보내기 (보이는 기간)
+async function exportIcs() {
+    const params = new URLSearchParams({
+        start: toDateString(calendar.view.activeStart),
+        end: toDateString(calendar.view.activeEnd)
+    });
+    if (activeFilter !== 'all') params.set('type', activeFilter);
+
+    const response = await fetch(`/api/calendar/events.ics?${params}`, {
+        headers: { 'Authorization': `Bearer ${window.authUtils.getToken()}` }
+    });
+    if (!response.ok) {
+        window.authUtils.showToast('에러', '일정을 내보내지 못했습니다.', 'error');
+        return;
+    }
+    const link = document.createElement('a');
+    link.href = URL.createObjectURL(await response.blob());
+    link.download = 'modi_calendar.ics';
+    link.click();
+    URL.revokeObjectURL(link.href);
+}
+
 // 이벤트 클릭 핸들러
 function handleEventClick(info) {
     const loanCaseId = info.event.extendedProps.loan_case;
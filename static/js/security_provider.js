@@ -221,24 +221,21 @@ class SecurityProviderManager {
     
             console.log('Submitting provider data:', data);
     
-            // 저장 요청
-            const saveResponse = await window.authUtils.fetchWithAuth(
-                this.currentProviderId
-                    ? `${this.endpoints.base}${this.currentProviderId}/`
-                    : this.endpoints.base,
+            // 저장 요청과 전체 목록 다시 불러오기를 한 번에
+            const responses = await window.authUtils.batch([
                 {
                     method: this.currentProviderId ? 'PUT' : 'POST',
-                    headers: {
-                        'Content-Type': 'application/json'
-                    },
-                    body: JSON.stringify(data)
-                }
-            );
+                    path: this.currentProviderId
+                        ? `${this.endpoints.base}${this.currentProviderId}/`
+                        : this.endpoints.base,
+                    body: data
+                },
+                { method: 'GET', path: this.endpoints.base }
+            ], { atomic: true });
+            if (!responses) return;
+            const [saveResponse, updatedData] = responses;
     
             console.log('Save Response:', saveResponse);
-    
-            // 전체 목록 다시 불러오기
-            const updatedData = await window.authUtils.fetchWithAuth(this.endpoints.base);
             console.log('Updated data:', updatedData);
     
             // providers 배열 추출
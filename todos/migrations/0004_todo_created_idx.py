@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-19 00:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0003_auto_20241230_0959'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['-created_at', '-id'], name='todo_created_idx'),
+        ),
+    ]
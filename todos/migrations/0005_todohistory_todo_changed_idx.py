@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-19 01:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0004_todo_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='todohistory',
+            index=models.Index(fields=['todo', '-changed_at'], name='todo_history_idx'),
+        ),
+    ]
@@ -1,6 +1,6 @@
 from django.db import models
 from django.conf import settings
-from core.models import LoanCase
+from core.models import CaseScopedQuerySet, LoanCase
 
 class Todo(models.Model):
     STATUS_CHOICES = (
@@ -15,6 +15,13 @@ class Todo(models.Model):
         (3, '높음'),
     )
 
+    objects = CaseScopedQuerySet.as_manager()
+
+    # 변경 이력(TodoHistory)을 남기는 필드
+    HISTORY_FIELDS = (
+        'loan_case', 'title', 'content', 'deadline', 'status', 'priority', 'assigned_to', 'is_archived',
+    )
+
     loan_case = models.ForeignKey(
         LoanCase, 
         on_delete=models.CASCADE, 
@@ -79,11 +86,39 @@ class Todo(models.Model):
 
     class Meta:
         ordering = ['-priority', 'deadline', '-created_at']
+        indexes = [
+            # 커서 페이지네이션 (created_at, id) 정렬
+            models.Index(fields=['-created_at', '-id'], name='todo_created_idx'),
+        ]
         verbose_name = '할일'
         verbose_name_plural = '할일 목록'
 
     def __str__(self):
         return f"{self.title} ({self.get_status_display()})"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 조회 시점 값 보관 (변경 이력, 이전 담당자 통계 캐시 삭제에 사용)
+        instance._loaded_values = instance.get_tracked_values()
+        return instance
+
+    def get_tracked_values(self):
+        # 지연 로딩(defer)된 필드는 DEFERRED로 두고 비교하지 않음
+        return {
+            name: self.__dict__.get(self._meta.get_field(name).attname, models.DEFERRED)
+            for name in self.HISTORY_FIELDS
+        }
+
+    def get_changed_fields(self):
+        """조회 이후 바뀐 필드 {필드명: (이전 값, 새 값)}"""
+        loaded = getattr(self, '_loaded_values', {})
+        current = self.get_tracked_values()
+        return {
+            name: (old, current[name])
+            for name, old in loaded.items()
+            if old is not models.DEFERRED and current[name] is not models.DEFERRED and old != current[name]
+        }
     
 class TodoTemplate(models.Model):
     title = models.CharField(max_length=200)
@@ -102,4 +137,10 @@ class TodoHistory(models.Model):
     changed_at = models.DateTimeField(auto_now_add=True)
     field_name = models.CharField(max_length=50)
     old_value = models.TextField(null=True)
-    new_value = models.TextField(null=True)
\ No newline at end of file
+    new_value = models.TextField(null=True)
+
+    class Meta:
+        indexes = [
+            # 할일별 이력 조회 (최신순)
+            models.Index(fields=['todo', '-changed_at'], name='todo_history_idx'),
+        ]
@@ -0,0 +1,182 @@
+# todos/services.py
+from datetime import date, timedelta
+from typing import Dict, Iterable
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+from .models import Todo, TodoHistory
+
+
+class TodoStatsService:
+    """할일 대시보드 통계
+
+    사용자별 통계(loan_case 미지정)는 캐시하고, 할일 저장/삭제/일괄 처리 시 관련 사용자 캐시를 삭제합니다.
+    캐시 유지 시간은 TODO_STATS_CACHE_TIMEOUT (0이면 캐시 사용 안 함).
+    """
+
+    ACTIVE_STATUSES = ['pending', 'in_progress']
+
+    @staticmethod
+    def _cache_key(user_id, today: date) -> str:
+        # 날짜가 바뀌면 마감 기준 통계가 달라지므로 키에 포함
+        return f'todos:stats:{user_id}:{today.isoformat()}'
+
+    @staticmethod
+    def get_stats(queryset, user, cached: bool = False) -> Dict:
+        today = timezone.now().date()
+        timeout = getattr(settings, 'TODO_STATS_CACHE_TIMEOUT', 300)
+        if not (cached and timeout):
+            return TodoStatsService.compute(queryset, user, today)
+
+        key = TodoStatsService._cache_key(user.pk, today)
+        stats = cache.get(key)
+        if stats is None:
+            stats = TodoStatsService.compute(queryset, user, today)
+            cache.set(key, stats, timeout)
+        return stats
+
+    @staticmethod
+    def compute(queryset, user, today: date) -> Dict:
+        """전체/마감/우선순위/내 할일 통계를 조건부 집계 쿼리 한 번으로 계산"""
+        active = Q(status__in=TodoStatsService.ACTIVE_STATUSES)
+        overdue = Q(deadline__date__lt=today) & active
+        due_today = Q(deadline__date=today)
+        mine = Q(assigned_to=user)
+
+        counts = queryset.order_by().aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status='pending')),
+            in_progress=Count('id', filter=Q(status='in_progress')),
+            completed=Count('id', filter=Q(status='completed')),
+            overdue=Count('id', filter=overdue),
+            today=Count('id', filter=due_today),
+            this_week=Count('id', filter=Q(
+                deadline__date__gt=today,
+                deadline__date__lte=today + timedelta(days=7)
+            )),
+            high=Count('id', filter=Q(priority=3)),
+            medium=Count('id', filter=Q(priority=2)),
+            low=Count('id', filter=Q(priority=1)),
+            my_total=Count('id', filter=mine),
+            my_overdue=Count('id', filter=mine & overdue),
+            my_today=Count('id', filter=mine & due_today),
+        )
+
+        return {
+            'total_stats': {key: counts[key] for key in ('total', 'pending', 'in_progress', 'completed')},
+            'deadline_stats': {key: counts[key] for key in ('overdue', 'today', 'this_week')},
+            'priority_stats': {key: counts[key] for key in ('high', 'medium', 'low')},
+            'my_todos': {
+                'total': counts['my_total'],
+                'overdue': counts['my_overdue'],
+                'today': counts['my_today'],
+            },
+        }
+
+    @staticmethod
+    def invalidate(user_ids: Iterable):
+        today = timezone.now().date()
+        keys = [TodoStatsService._cache_key(user_id, today) for user_id in set(user_ids) if user_id]
+        if keys:
+            cache.delete_many(keys)
+
+
+class _HistoryBatch(list):
+    """트랜잭션 커밋 시 한 번에 저장할 TodoHistory 목록 (on_commit 콜백)"""
+
+    def __init__(self, savepoint_ids):
+        super().__init__()
+        self.savepoint_ids = savepoint_ids
+
+    def __call__(self):
+        TodoHistory.objects.bulk_create(self)
+
+
+class TodoHistoryService:
+    """할일 변경 이력 기록"""
+
+    @staticmethod
+    def history_value(value):
+        return None if value is None else str(value)
+
+    @staticmethod
+    def record_changes(todo, changed_by):
+        """조회 이후 바뀐 필드만 이력으로 남김
+
+        트랜잭션 안에서는 커밋 시 bulk_create로 한 번에 저장하고, 롤백되면 버립니다.
+        """
+        rows = [
+            TodoHistory(
+                todo_id=todo.pk,
+                changed_by=changed_by,
+                field_name=name,
+                old_value=TodoHistoryService.history_value(old_value),
+                new_value=TodoHistoryService.history_value(new_value),
+            )
+            for name, (old_value, new_value) in todo.get_changed_fields().items()
+        ]
+        if not rows:
+            return
+
+        connection = transaction.get_connection()
+        if not connection.in_atomic_block:
+            TodoHistory.objects.bulk_create(rows)
+            return
+        TodoHistoryService._pending_batch(connection).extend(rows)
+
+    @staticmethod
+    def _pending_batch(connection) -> _HistoryBatch:
+        # 세이브포인트별로 버퍼를 나눠, 세이브포인트 롤백 시 해당 이력도 함께 버려지도록 함
+        savepoint_ids = tuple(connection.savepoint_ids)
+        for _, callback, *_ in connection.run_on_commit:
+            if isinstance(callback, _HistoryBatch) and callback.savepoint_ids == savepoint_ids:
+                return callback
+        batch = _HistoryBatch(savepoint_ids)
+        transaction.on_commit(batch)
+        return batch
+
+
+class TodoBulkService:
+    """할일 일괄 변경 (변경 이력을 일괄 기록)"""
+
+    # bulk_update action_type -> 변경 필드
+    ACTION_FIELDS = {
+        'status': 'status',
+        'assign': 'assigned_to',
+        'archive': 'is_archived',
+    }
+
+    @staticmethod
+    def update_field(todos, field_name: str, value, changed_by) -> int:
+        """조회 1회(행 잠금) + update 1회 + 이력 bulk_create 1회로 일괄 변경
+
+        값이 실제로 바뀐 할일만 이력을 남기고, update()는 signal이 없으므로 통계 캐시를 직접 삭제합니다.
+        Returns: 변경된 할일 수
+        """
+        attname = Todo._meta.get_field(field_name).attname
+        with transaction.atomic():
+            rows = list(todos.select_for_update().values_list('id', attname, 'created_by_id', 'assigned_to_id'))
+            if not rows:
+                return 0
+            updated_count = Todo.objects.filter(id__in=[row[0] for row in rows]).update(**{attname: value})
+
+            new_value = TodoHistoryService.history_value(value)
+            TodoHistory.objects.bulk_create([
+                TodoHistory(
+                    todo_id=todo_id,
+                    changed_by=changed_by,
+                    field_name=field_name,
+                    old_value=TodoHistoryService.history_value(old_value),
+                    new_value=new_value,
+                )
+                for todo_id, old_value, _, _ in rows
+                if TodoHistoryService.history_value(old_value) != new_value
+            ])
+
+        stats_user_ids = {user_id for row in rows for user_id in row[2:]}
+        if field_name == 'assigned_to':
+            stats_user_ids.add(value)
+        TodoStatsService.invalidate(stats_user_ids)
+        return updated_count
@@ -0,0 +1,27 @@
+# todos/signals.py
+from django.db.models import DEFERRED
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Todo
+from .services import TodoHistoryService, TodoStatsService
+
+
+@receiver(post_save, sender=Todo)
+def todo_saved(sender, instance, created, **kwargs):
+    loaded = getattr(instance, '_loaded_values', {})
+    # 변경자(_changed_by)가 지정된 수정만 이력으로 남김
+    changed_by = getattr(instance, '_changed_by', None)
+    if not created and changed_by is not None:
+        TodoHistoryService.record_changes(instance, changed_by)
+
+    # 담당자가 바뀐 경우 이전 담당자의 통계도 삭제
+    previous_assignee = loaded.get('assigned_to')
+    if previous_assignee is DEFERRED:
+        previous_assignee = None
+    TodoStatsService.invalidate({instance.created_by_id, instance.assigned_to_id, previous_assignee})
+    instance._loaded_values = instance.get_tracked_values()
+
+
+@receiver(post_delete, sender=Todo)
+def todo_deleted(sender, instance, **kwargs):
+    TodoStatsService.invalidate({instance.created_by_id, instance.assigned_to_id})
@@ -1,3 +1,171 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from accounts.models import User
+from core.models import LoanCase
+from todos.models import Todo, TodoHistory
+
+STATS_URL = '/api/todos/dashboard_stats/'
+
+
+class TodoDashboardStatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='staff', password='pw', role='staff')
+        cls.other = User.objects.create_user(username='other', password='pw', role='staff')
+        cls.case = LoanCase.objects.create(borrower_name='차주', manager=cls.user)
+        now = timezone.now()
+        cls.overdue = Todo.objects.create(
+            loan_case=cls.case, title='지연', created_by=cls.user, assigned_to=cls.user,
+            priority=3, deadline=now - timedelta(days=2))
+        Todo.objects.create(loan_case=cls.case, title='오늘', created_by=cls.user, deadline=now)
+        Todo.objects.create(
+            loan_case=cls.case, title='완료', created_by=cls.user, status='completed', priority=1,
+            deadline=now + timedelta(days=3))
+        Todo.objects.create(loan_case=cls.case, title='남의 할일', created_by=cls.other)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_stats_use_one_query_then_cache(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(STATS_URL)
+        self.assertEqual(response.data['total_stats'], {'total': 3, 'pending': 2, 'in_progress': 0, 'completed': 1})
+        self.assertEqual(response.data['deadline_stats'], {'overdue': 1, 'today': 1, 'this_week': 1})
+        self.assertEqual(response.data['priority_stats'], {'high': 1, 'medium': 1, 'low': 1})
+        self.assertEqual(response.data['my_todos'], {'total': 1, 'overdue': 1, 'today': 0})
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(STATS_URL).data, response.data)
+
+    def test_changes_invalidate_cached_stats(self):
+        self.client.get(STATS_URL)
+
+        self.overdue.status = 'completed'
+        self.overdue.save()
+        self.assertEqual(self.client.get(STATS_URL).data['my_todos']['overdue'], 0)
+
+        response = self.client.post('/api/todos/bulk_update/', {
+            'todo_ids': [self.overdue.id], 'action_type': 'assign', 'value': self.other.id}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get(STATS_URL).data['my_todos']['total'], 0)
+
+        other = APIClient()
+        other.force_authenticate(self.other)
+        self.assertEqual(other.get(STATS_URL).data['total_stats']['total'], 2)
+        self.client.delete('/api/todos/bulk_delete/', {'todo_ids': [self.overdue.id]}, format='json')
+        self.assertEqual(other.get(STATS_URL).data['total_stats']['total'], 1)
+
+
+class TodoBulkOperationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='staff', password='pw', role='staff')
+        case = LoanCase.objects.create(borrower_name='차주', manager=cls.user)
+        cls.todos = [
+            Todo.objects.create(loan_case=case, title=f'할일{i}', created_by=cls.user, status=status)
+            for i, status in enumerate(['pending', 'in_progress', 'completed'])
+        ]
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_bulk_status_writes_history_in_batch(self):
+        ids = [todo.id for todo in self.todos]
+        # savepoint + 잠금 조회 + update + 이력 insert + release
+        with self.assertNumQueries(5):
+            response = self.client.post('/api/todos/bulk_update/', {
+                'todo_ids': ids, 'action_type': 'status', 'value': 'completed'}, format='json')
+        self.assertEqual(response.data['updated_count'], 3)
+
+        histories = TodoHistory.objects.order_by('todo_id')
+        self.assertEqual(
+            [(h.todo_id, h.field_name, h.old_value, h.new_value, h.changed_by_id) for h in histories],
+            [(ids[0], 'status', 'pending', 'completed', self.user.id),
+             (ids[1], 'status', 'in_progress', 'completed', self.user.id)])
+
+    def test_bulk_archive_validates_value(self):
+        response = self.client.post('/api/todos/bulk_update/', {
+            'todo_ids': [self.todos[0].id], 'action_type': 'archive', 'value': 'maybe'}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post('/api/todos/bulk_update/', {
+            'todo_ids': [self.todos[0].id], 'action_type': 'archive', 'value': True}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(TodoHistory.objects.get().new_value, 'True')
+
+    def test_bulk_actions_ignore_other_users_todos(self):
+        other = User.objects.create_user(username='other', password='pw', role='staff')
+        other_todo = Todo.objects.create(
+            loan_case=LoanCase.objects.create(borrower_name='타인', manager=other), title='타인 할일', created_by=other)
+
+        response = self.client.post('/api/todos/bulk_update/', {
+            'todo_ids': [other_todo.id], 'action_type': 'status', 'value': 'completed'}, format='json')
+        self.assertEqual(response.status_code, 404)
+
+        response = self.client.delete('/api/todos/bulk_delete/', {
+            'todo_ids': [other_todo.id, self.todos[0].id]}, format='json')
+        self.assertEqual(response.data['deleted_count'], 1)
+        other_todo.refresh_from_db()
+        self.assertEqual((other_todo.status, TodoHistory.objects.count()), ('pending', 0))
+
+    def test_bulk_actions_include_todos_assigned_on_other_cases(self):
+        other = User.objects.create_user(username='other', password='pw', role='staff')
+        assigned = Todo.objects.create(
+            loan_case=LoanCase.objects.create(borrower_name='타인', manager=other),
+            title='배정 할일', created_by=other, assigned_to=self.user)
+        self.assertIn(assigned.id, [todo['id'] for todo in self.client.get('/api/todos/').data['results']])
+
+        response = self.client.post('/api/todos/bulk_update/', {
+            'todo_ids': [assigned.id], 'action_type': 'status', 'value': 'completed'}, format='json')
+        self.assertEqual(response.data['updated_count'], 1)
+
+        response = self.client.delete('/api/todos/bulk_delete/', {'todo_ids': [assigned.id]}, format='json')
+        self.assertEqual(response.data['deleted_count'], 1)
+
+
+class TodoHistoryTrackingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='staff', password='pw', role='staff')
+        case = LoanCase.objects.create(borrower_name='차주', manager=cls.user)
+        cls.todo = Todo.objects.create(loan_case=case, title='서류 요청', created_by=cls.user)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_patch_records_changed_fields_in_one_insert(self):
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.patch(f'/api/todos/{self.todo.id}/', {
+                    'title': '서류 요청', 'status': 'completed', 'priority': 3}, format='json')
+        self.assertEqual(response.status_code, 200)
+        inserts = [q['sql'] for q in queries if q['sql'].startswith('INSERT INTO "todos_todohistory"')]
+        self.assertEqual(len(inserts), 1)
+
+        response = self.client.get(f'/api/todos/{self.todo.id}/history/')
+        self.assertEqual(
+            sorted((h['field_name'], h['old_value'], h['new_value']) for h in response.data),
+            [('priority', '2', '3'), ('status', 'pending', 'completed')])
+
+    def test_rolled_back_changes_leave_no_history(self):
+        todo = Todo.objects.get(pk=self.todo.pk)
+        todo._changed_by = self.user
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    todo.status = 'completed'
+                    todo.save()
+                    raise ValueError
+            except ValueError:
+                pass
+        self.assertFalse(TodoHistory.objects.exists())
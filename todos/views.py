@@ -9,17 +9,27 @@ from .models import Todo, TodoTemplate
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from .serializers import TodoSerializer, TodoTemplateSerializer, TodoHistorySerializer
+from .services import TodoBulkService, TodoStatsService
 from rest_framework import status
 from accounts.models import User
-from core.models import LoanCase
+from core.models import LoanCase, case_visibility_q
+from core.pagination import CursorOptInPagination
+from django.core.exceptions import ValidationError
 from django.db.models import Q
+import logging
 
+logger = logging.getLogger(__name__)
 
-class TodoPagination(PageNumberPagination):
+
+class TodoPageNumberPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
 
+class TodoPagination(CursorOptInPagination):
+    # ?pagination=cursor 요청 시 (created_at, id) 키셋 페이지네이션
+    default_class = TodoPageNumberPagination
+
 class TodoFilter(filters.FilterSet):
     deadline_status = filters.CharFilter(method='filter_deadline_status')
     my_todos = filters.BooleanFilter(method='filter_my_todos')
@@ -83,7 +93,9 @@ class TodoViewSet(viewsets.ModelViewSet):
         if loan_case:
             try:
                 loan_case_id = int(loan_case)
-                return Todo.objects.filter(loan_case_id=loan_case_id, is_archived=False)
+                # 조회 가능한 대출 건의 할 일만 (권한 조건은 JOIN으로 처리)
+                return Todo.objects.visible_to(self.request.user).filter(
+                    loan_case_id=loan_case_id, is_archived=False)
             except (ValueError, TypeError):
                 return Todo.objects.none()
         
@@ -94,62 +106,27 @@ class TodoViewSet(viewsets.ModelViewSet):
             is_archived=False
         ).order_by('-priority', 'deadline')
 
+    def get_bulk_queryset(self, todo_ids):
+        """일괄 변경/삭제 대상: 목록에 보이는 본인 생성/배정 할일 + 조회 가능한 대출 건의 할일"""
+        user = self.request.user
+        return Todo.objects.filter(
+            Q(created_by=user) | Q(assigned_to=user) | case_visibility_q(user, 'loan_case__'),
+            id__in=todo_ids
+        )
+
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
 
+    def perform_update(self, serializer):
+        # 변경된 필드는 post_save signal에서 TodoHistory로 기록
+        serializer.instance._changed_by = self.request.user
+        serializer.save()
+
     @action(detail=False, methods=['get'])
     def dashboard_stats(self, request):
-        today = timezone.now().date()
-        queryset = self.get_queryset()
-
-        # 전체 현황 통계
-        total_stats = {
-            'total': queryset.count(),
-            'pending': queryset.filter(status='pending').count(),
-            'in_progress': queryset.filter(status='in_progress').count(),
-            'completed': queryset.filter(status='completed').count(),
-        }
-
-        # 데드라인 기준 통계
-        deadline_stats = {
-            'overdue': queryset.filter(
-                deadline__date__lt=today,
-                status__in=['pending', 'in_progress']
-            ).count(),
-            'today': queryset.filter(deadline__date=today).count(),
-            'this_week': queryset.filter(
-                deadline__date__gt=today,
-                deadline__date__lte=today + timedelta(days=7)
-            ).count(),
-        }
-
-        # 우선순위별 통계
-        priority_stats = {
-            'high': queryset.filter(priority=3).count(),
-            'medium': queryset.filter(priority=2).count(),
-            'low': queryset.filter(priority=1).count(),
-        }
-
-        # 내 할일 통계
-        my_todos = {
-            'total': queryset.filter(assigned_to=request.user).count(),
-            'overdue': queryset.filter(
-                assigned_to=request.user,
-                deadline__date__lt=today,
-                status__in=['pending', 'in_progress']
-            ).count(),
-            'today': queryset.filter(
-                assigned_to=request.user,
-                deadline__date=today
-            ).count(),
-        }
-
-        return Response({
-            'total_stats': total_stats,
-            'deadline_stats': deadline_stats,
-            'priority_stats': priority_stats,
-            'my_todos': my_todos
-        })
+        # 사용자 전체 할일 통계만 캐시 (대출 건별 통계는 여러 사용자가 보므로 매번 계산)
+        cached = not request.query_params.get('loan_case')
+        return Response(TodoStatsService.get_stats(self.get_queryset(), request.user, cached=cached))
     
     @action(detail=False, methods=['post'])
     def bulk_update(self, request):
@@ -163,34 +140,28 @@ class TodoViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        todos = Todo.objects.filter(id__in=todo_ids)
-        
-        if not todos.exists():
-            return Response(
-                {"error": "유효한 할일이 없습니다."}, 
-                status=status.HTTP_404_NOT_FOUND
-            )
-
         if action_type == 'status':
             if value not in dict(Todo.STATUS_CHOICES):
                 return Response(
                     {"error": "유효하지 않은 상태입니다."}, 
                     status=status.HTTP_400_BAD_REQUEST
                 )
-            todos.update(status=value)
 
         elif action_type == 'assign':
-            try:
-                assigned_to = User.objects.get(id=value)
-                todos.update(assigned_to=assigned_to)
-            except User.DoesNotExist:
+            if not User.objects.filter(id=value).exists():
                 return Response(
                     {"error": "유효하지 않은 사용자입니다."}, 
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
         elif action_type == 'archive':
-            todos.update(is_archived=value)
+            try:
+                value = Todo._meta.get_field('is_archived').to_python(value)
+            except ValidationError:
+                return Response(
+                    {"error": "보관 여부는 true/false 값이어야 합니다."}, 
+                    status=status.HTTP_400_BAD_REQUEST
+                )
 
         else:
             return Response(
@@ -198,9 +169,22 @@ class TodoViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        # 권한이 있는 할일만 변경 (다른 사용자의 할일 ID는 무시)
+        updated_count = TodoBulkService.update_field(
+            self.get_bulk_queryset(todo_ids),
+            TodoBulkService.ACTION_FIELDS[action_type],
+            value,
+            request.user
+        )
+        if not updated_count:
+            return Response(
+                {"error": "유효한 할일이 없습니다."}, 
+                status=status.HTTP_404_NOT_FOUND
+            )
+
         return Response({
             "message": "성공적으로 업데이트되었습니다.",
-            "updated_count": todos.count()
+            "updated_count": updated_count
         })
 
     @action(detail=False, methods=['delete'])
@@ -213,7 +197,11 @@ class TodoViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        deleted_count = Todo.objects.filter(id__in=todo_ids).delete()[0]
+        todos = self.get_bulk_queryset(todo_ids)
+        # 이력은 할일과 함께 삭제되므로 삭제 기록은 로그로 남김
+        deleted_ids = list(todos.values_list('id', flat=True))
+        deleted_count = todos.delete()[1].get(Todo._meta.label, 0)
+        logger.info(f"Todos bulk deleted by {request.user}: {deleted_ids}")
         
         return Response({
             "message": "성공적으로 삭제되었습니다.",
@@ -223,7 +211,7 @@ class TodoViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['get'])
     def history(self, request, pk=None):
         todo = self.get_object()
-        histories = todo.histories.all().order_by('-changed_at')
+        histories = todo.histories.select_related('changed_by').order_by('-changed_at')
         serializer = TodoHistorySerializer(histories, many=True)
         return Response(serializer.data)
 